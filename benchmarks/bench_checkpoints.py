@@ -0,0 +1,60 @@
+"""
+Measures writing and loading checkpoints of a mechanism holding large numpy arrays with and without zero-copy.
+
+Run with `python benchmarks/bench_checkpoints.py [n_megabytes] [n_steps]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from negmas import MappingUtilityFunction, RandomNegotiator, SAOMechanism
+from negmas.checkpoints import CheckpointRunner
+
+
+def bench(folder: Path, zero_copy: bool, n_megabytes: int, n_steps: int) -> None:
+    mechanism = SAOMechanism(
+        outcomes=20,
+        n_steps=n_steps,
+        checkpoint_every=1,
+        checkpoint_folder=folder,
+        checkpoint_filename="mechanism",
+        single_checkpoint=False,
+        checkpoint_zero_copy=zero_copy,
+    )
+    mechanism.table = np.random.rand(n_megabytes * (1 << 17))  # type: ignore
+    ufuns = MappingUtilityFunction.generate_random(2, outcomes=20)
+    for i in range(2):
+        mechanism.add(
+            RandomNegotiator(p_acceptance=0, p_rejection=1, p_ending=0),
+            preferences=ufuns[i],
+        )
+    start = time.perf_counter()
+    mechanism.run()
+    write = (time.perf_counter() - start) / n_steps
+
+    runner = CheckpointRunner(folder=folder)
+    start = time.perf_counter()
+    forks = [runner.fork(every=0, step=step) for step in runner.steps]
+    load = (time.perf_counter() - start) / len(forks)
+    print(
+        f"{'zero-copy' if zero_copy else 'dill':>10}: write {write * 1e3:8.2f}ms "
+        f"fork {load * 1e3:8.2f}ms per checkpoint"
+    )
+
+
+def main(n_megabytes: int = 100, n_steps: int = 10) -> None:
+    for zero_copy in (False, True):
+        with tempfile.TemporaryDirectory() as folder:
+            bench(Path(folder), zero_copy, n_megabytes, n_steps)
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+    main(*(int(_) for _ in sys.argv[1:3]))
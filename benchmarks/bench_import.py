@@ -0,0 +1,43 @@
+"""
+Measures the time taken to import negmas (and its most used names) in a fresh interpreter.
+
+Run with `python benchmarks/bench_import.py [n_repetitions] [budget_ms]`. Exits with an error if the median time
+of a bare `import negmas` exceeds the budget. Use `python -X importtime -c "import negmas"` to find the culprit.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+
+STATEMENTS = (
+    "import negmas",
+    "from negmas import SAOMechanism",
+    "from negmas.situated import World",
+)
+
+
+def bench(statement: str, n_repetitions: int) -> float:
+    times = []
+    for _ in range(n_repetitions):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(n_repetitions: int = 5, budget_ms: int = 500) -> None:
+    baseline = bench("pass", n_repetitions)
+    results = {_: bench(_, n_repetitions) - baseline for _ in STATEMENTS}
+    for statement, elapsed in results.items():
+        print(f"{statement:>36}: {elapsed * 1e3:10.1f}ms")
+    if results[STATEMENTS[0]] * 1e3 > budget_ms:
+        sys.exit(f"import negmas exceeded its budget of {budget_ms}ms")
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+    main(*(int(_) for _ in sys.argv[1:3]))
@@ -0,0 +1,83 @@
+"""
+Measures the cost of maintaining the Weitzman indices of Pandora's box elicitors.
+
+Run with `python benchmarks/bench_pandora.py [n_outcomes] [n_steps]`.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from negmas.elicitation import EStrategy, FastElicitor, User
+from negmas.preferences import MappingUtilityFunction
+from negmas.sao import LimitedOutcomesNegotiator, SAOMechanism
+
+
+def make_elicitor(n_outcomes: int) -> tuple[FastElicitor, SAOMechanism]:
+    """Creates an elicitor that joined a negotiation over `n_outcomes` outcomes"""
+    outcomes = [(_,) for _ in range(n_outcomes)]
+    user = User(
+        preferences=MappingUtilityFunction(
+            dict(zip(outcomes, np.random.rand(n_outcomes).tolist())),
+            reserved_value=0.0,
+        ),
+        cost=0.001,
+    )
+    mechanism = SAOMechanism(outcomes=outcomes, n_steps=100)
+    strategy = EStrategy(strategy="titration-0.05")
+    strategy.on_enter(nmi=mechanism.nmi)
+    elicitor = FastElicitor(strategy=strategy, user=user)
+    mechanism.add(LimitedOutcomesNegotiator(acceptable_outcomes=outcomes[:2]))
+    mechanism.add(elicitor)
+    return elicitor, mechanism
+
+
+def main(n_outcomes: int = 10_000, n_steps: int = 1_000) -> None:
+    random.seed(0)
+    np.random.seed(0)
+    elicitor, mechanism = make_elicitor(n_outcomes)
+    outcomes = mechanism.outcomes
+    assert outcomes is not None
+
+    start = time.perf_counter()
+    elicitor.unknown = None
+    elicitor.init_unknowns()
+    print(f"{'initialize':>24}: {time.perf_counter() - start:10.4f}s")
+
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        changed = random.sample(outcomes, 3)
+        elicitor.on_opponent_model_updated(changed, [0.0] * 3, [1.0] * 3)
+    elapsed = (time.perf_counter() - start) / n_steps
+    print(f"{'opponent model update':>24}: {elapsed * 1e6:10.1f}us per update")
+
+    # the index maintenance done by every call to `elicit_single` (excluding asking the user)
+    elapsed, n = 0.0, 0
+    for _ in range(n_steps):
+        if not elicitor.can_elicit():
+            break
+        start = time.perf_counter()
+        _, best = elicitor.offer_to_elicit()
+        elapsed += time.perf_counter() - start
+        outcome = outcomes[best]
+        u = elicitor.do_elicit(outcome, mechanism.state)
+        elicitor.preferences.distributions[outcome] = u
+        start = time.perf_counter()
+        if isinstance(u, float):
+            elicitor.remove_best_offer_from_unknown_list()
+        else:
+            elicitor.update_best_offer_utility(outcome, u)
+        elapsed += time.perf_counter() - start
+        n += 1
+    elapsed /= max(n, 1)
+    print(f"{'elicitation step':>24}: {elapsed * 1e6:10.1f}us per step ({n} steps)")
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+    main(*(int(_) for _ in sys.argv[1:3]))
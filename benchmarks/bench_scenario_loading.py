@@ -0,0 +1,64 @@
+"""
+Measures loading a library of scenarios with and without the scenario parse cache.
+
+Run with `python benchmarks/bench_scenario_loading.py [n_copies] [n_jobs]`. The library is made of copies of the
+scenarios in negmas/tests/data/scenarios.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import negmas
+from negmas import inout
+from negmas.inout import Scenario
+
+
+def loadable(path: Path) -> bool:
+    try:
+        return Scenario.load(path) is not None
+    except Exception:
+        return False
+
+
+def library(folder: Path, n_copies: int) -> list[Path]:
+    source = Path(negmas.__file__).parent / "tests" / "data" / "scenarios"
+    scenarios = [_ for _ in sorted(source.rglob("*")) if loadable(_)]
+    paths = []
+    for i in range(n_copies):
+        for s in scenarios:
+            paths.append(folder / f"{s.name}-{i}")
+            shutil.copytree(s, paths[-1])
+    return paths
+
+
+def bench(name: str, f) -> None:
+    start = time.perf_counter()
+    scenarios = f()
+    elapsed = time.perf_counter() - start
+    n = sum(_ is not None for _ in scenarios)
+    print(f"{name:>28}: {elapsed:8.3f}s ({n} scenarios)")
+
+
+def main(n_copies: int = 5, n_jobs: int = -1) -> None:
+    jobs = n_jobs if n_jobs >= 0 else None
+    with tempfile.TemporaryDirectory() as folder:
+        inout.SCENARIO_CACHE_DIR = Path(folder) / "cache"
+        paths = library(Path(folder), n_copies)
+        bench("load (no cache)", lambda: [Scenario.load(_) for _ in paths])
+        bench("load_many (no cache)", lambda: Scenario.load_many(paths, n_jobs=jobs))
+        for name in ("cold", "warm"):
+            bench(
+                f"load_many ({name} cache)",
+                lambda: Scenario.load_many(paths, n_jobs=jobs, cache=True),
+            )
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+    main(*(int(_) for _ in sys.argv[1:3]))
@@ -0,0 +1,68 @@
+"""
+Measures the time taken by `serialize` to encode negotiation histories and world configurations.
+
+Run with `python benchmarks/bench_serialization.py [n_steps] [n_repetitions]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+from itertools import islice
+
+from negmas.preferences import MappingUtilityFunction
+from negmas.sao import AspirationNegotiator, NaiveTitForTatNegotiator, SAOMechanism
+from negmas.serialization import serialize
+from negmas.tournaments.neg.situated import (
+    neg_config_generator,
+    random_discrete_scenarios,
+)
+
+
+def bench(name: str, values: list, n_repetitions: int) -> None:
+    start = time.perf_counter()
+    for _ in range(n_repetitions):
+        for v in values:
+            serialize(v)
+    elapsed = (time.perf_counter() - start) / (n_repetitions * len(values))
+    print(f"{name:>24}: {elapsed * 1e3:10.3f}ms per value")
+
+
+def main(n_steps: int = 1000, n_repetitions: int = 10) -> None:
+    # two negotiators with opposing preferences that agree near the end of the negotiation
+    outcomes = [(_,) for _ in range(n_steps)]
+    mechanism = SAOMechanism(outcomes=outcomes, n_steps=n_steps)
+    for sign in (1, -1):
+        mechanism.add(
+            AspirationNegotiator(),
+            preferences=MappingUtilityFunction(
+                {o: 0.5 + sign * (o[0] / n_steps - 0.5) for o in outcomes},
+                outcome_space=mechanism.outcome_space,
+                reserved_value=0.0,
+            ),
+        )
+    mechanism.run()
+    print(f"{len(mechanism.history)} negotiation steps")
+    bench("history", [mechanism.history], n_repetitions)
+    bench("extended trace", [mechanism.extended_trace], n_repetitions)
+
+    scenarios = list(
+        islice(
+            random_discrete_scenarios(
+                issues=[5, 4, (3, 6)],
+                partners=[AspirationNegotiator, NaiveTitForTatNegotiator],
+            ),
+            20,
+        )
+    )
+    bench("world scenarios", scenarios, n_repetitions)
+    configs = [
+        neg_config_generator(n_competitors=2, scenarios=iter([_]))[0] for _ in scenarios
+    ]
+    bench("world configs", configs, n_repetitions)
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+    main(*(int(_) for _ in sys.argv[1:3]))
@@ -6,36 +6,64 @@ __author__ = """Yasser Mohammad"""
 __email__ = "yasserfarouk@gmail.com"
 __version__ = "0.10.23"
 
+import importlib
+from typing import TYPE_CHECKING
 
-from .config import *
-from .types import *
-from .common import *
-from .inout import *
-from .mechanisms import *
-from .negotiators import *
-from .outcomes import *
-from .gb import *
-from .sao import *
-from .situated import *
-from .st import *
-from .preferences import *
-from .genius import *
-
-
-__all__ = (
-    config.__all__
-    + types.__all__
-    + common.__all__
-    + outcomes.__all__
-    + preferences.__all__
-    + negotiators.__all__
-    + mechanisms.__all__
-    + gb.__all__
-    + sao.__all__
-    + st.__all__
-    + inout.__all__
-    + genius.__all__
-    + situated.__all__
+from ._exports import EXPORTS
+
+# Submodules are imported (PEP 562) the first time one of their names is accessed so that importing negmas (e.g. in
+# every tournament worker) does not pay for everything it can do.
+if TYPE_CHECKING:
+    from .config import *
+    from .types import *
+    from .common import *
+    from .inout import *
+    from .mechanisms import *
+    from .negotiators import *
+    from .outcomes import *
+    from .gb import *
+    from .sao import *
+    from .situated import *
+    from .st import *
+    from .preferences import *
+    from .genius import *
+
+_SOURCES = {name: module for module, names in EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str):
+    module = _SOURCES.get(name, None)
+    if module is None:
+        # a submodule that is not imported yet
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SOURCES))
+
+
+__all__ = list(
+    EXPORTS["config"]
+    + EXPORTS["types"]
+    + EXPORTS["common"]
+    + EXPORTS["outcomes"]
+    + EXPORTS["preferences"]
+    + EXPORTS["negotiators"]
+    + EXPORTS["mechanisms"]
+    + EXPORTS["gb"]
+    + EXPORTS["sao"]
+    + EXPORTS["st"]
+    + EXPORTS["inout"]
+    + EXPORTS["genius"]
+    + EXPORTS["situated"]
     # + modeling.__all__
     # + helpers.prob.__all__
     # + [
@@ -0,0 +1,533 @@
+"""
+Names exported by the top-level `negmas` package from each of its submodules.
+
+The package uses them to import submodules only when one of their names is first accessed.
+Keep each tuple equal to the `__all__` of its submodule (`negmas/tests/test_lazy_imports.py` checks this).
+"""
+
+from __future__ import annotations
+
+__all__ = ["EXPORTS"]
+
+# a name exported by several submodules is taken from the last one
+EXPORTS: dict[str, tuple[str, ...]] = {
+    "config": (
+        "NEGMAS_CONFIG",
+        "CONFIG_KEY_JNEGMAS_JAR",
+        "CONFIG_KEY_GENIUS_BRIDGE_JAR",
+        "negmas_config",
+    ),
+    "types": ("NamedObject", "Runnable", "Rational"),
+    "common": (
+        "NegotiatorInfo",
+        "NegotiatorMechanismInterface",
+        "MechanismState",
+        "Value",
+        "PreferencesChange",
+        "PreferencesChangeType",
+        "AgentMechanismInterface",
+        "TraceElement",
+        "DEFAULT_JAVA_PORT",
+        "MechanismAction",
+    ),
+    "inout": (
+        "Scenario",
+        "scenario_size",
+        "load_genius_domain",
+        "load_genius_domain_from_folder",
+        "find_genius_domain_and_utility_files",
+        "load_geniusweb_domain",
+        "load_geniusweb_domain_from_folder",
+        "find_geniusweb_domain_and_utility_files",
+        "get_domain_issues",
+    ),
+    "mechanisms": ("Mechanism", "MechanismStepResult", "Traceable"),
+    "negotiators": (
+        "NegotiatorInfo",
+        "Negotiator",
+        "Controller",
+        "ControlledNegotiator",
+        "Component",
+        "EvaluatorNegotiator",
+        "RealComparatorNegotiator",
+        "BinaryComparatorNegotiator",
+        "NLevelsComparatorNegotiator",
+        "RankerNegotiator",
+        "RankerWithWeightsNegotiator",
+        "SorterNegotiator",
+        "TimeCurve",
+        "Aspiration",
+        "PolyAspiration",
+        "ExpAspiration",
+        "ModularNegotiator",
+    ),
+    "outcomes": (
+        "Outcome",
+        "ExtendedOutcome",
+        "PartialOutcomeDict",
+        "PartialOutcomeTuple",
+        "OutcomeRange",
+        "check_one_and_only",
+        "check_one_at_most",
+        "ensure_os",
+        "os_or_none",
+        "DEFAULT_LEVELS",
+        "OutcomeSpace",
+        "DiscreteOutcomeSpace",
+        "IndependentIssuesOS",
+        "IndependentDiscreteIssuesOS",
+        "make_issue",
+        "Issue",
+        "DiscreteIssue",
+        "CallableIssue",
+        "CategoricalIssue",
+        "OrdinalIssue",
+        "DiscreteOrdinalIssue",
+        "RangeIssue",
+        "CardinalIssue",
+        "ContiguousIssue",
+        "ContinuousIssue",
+        "CountableInfiniteIssue",
+        "ContinuousInfiniteIssue",
+        "InfiniteIssue",
+        "generate_issues",
+        "issues_from_genius",
+        "issues_from_geniusweb",
+        "issues_from_xml_str",
+        "issues_from_geniusweb_json_str",
+        "issues_to_genius",
+        "issues_to_xml_str",
+        "issues_from_outcomes",
+        "num_outcomes",
+        "enumerate_issues",
+        "enumerate_discrete_issues",
+        "discretize_and_enumerate_issues",
+        "sample_issues",
+        "sample_outcomes",
+        "combine_issues",
+        "dict2outcome",
+        "outcome2dict",
+        "outcome_in_range",
+        "outcome_is_complete",
+        "outcome_types_are_ok",
+        "outcome_is_valid",
+        "generalized_minkowski_distance",
+        "min_dist",
+        "CartesianOutcomeSpace",
+        "DiscreteCartesianOutcomeSpace",
+        "make_os",
+        "DistanceFun",
+    ),
+    "gb": (
+        "ResponseType",
+        "GBResponse",
+        "GBState",
+        "GBNMI",
+        "ThreadState",
+        "NegotiatorMechanismInterface",
+        "all_negotiator_types",
+        "GBComponent",
+        "AcceptancePolicy",
+        "OfferingPolicy",
+        "ProposalPolicy",
+        "Model",
+        "LimitedOutcomesAcceptancePolicy",
+        "NegotiatorAcceptancePolicy",
+        "ConcensusAcceptancePolicy",
+        "AllAcceptanceStrategies",
+        "AnyAcceptancePolicy",
+        "AcceptImmediately",
+        "RejectAlways",
+        "EndImmediately",
+        "AcceptAbove",
+        "RandomAcceptancePolicy",
+        "AcceptTop",
+        "AcceptBest",
+        "TFTAcceptancePolicy",
+        "ACNext",
+        "ACLast",
+        "ACLastKReceived",
+        "ACLastFractionReceived",
+        "ACTime",
+        "AcceptAfter",
+        "AcceptAround",
+        "AcceptBetween",
+        "ACConst",
+        "AcceptAnyRational",
+        "AcceptBetterRational",
+        "AcceptNotWorseRational",
+        "CABOfferingPolicy",
+        "WAROfferingPolicy",
+        "LimitedOutcomesOfferingPolicy",
+        "NegotiatorOfferingPolicy",
+        "ConcensusOfferingPolicy",
+        "RandomConcensusOfferingPolicy",
+        "UnanimousConcensusOfferingPolicy",
+        "UtilBasedConcensusOfferingPolicy",
+        "MyBestConcensusOfferingPolicy",
+        "MyWorstConcensusOfferingPolicy",
+        "NoneOfferingPolicy",
+        "RandomOfferingPolicy",
+        "OfferTop",
+        "OfferBest",
+        "TFTOfferingPolicy",
+        "MiCROOfferingPolicy",
+        "TimeBasedOfferingStrategy",
+        "ConcessionRecommender",
+        "KindConcessionRecommender",
+        "OfferSelectorProtocol",
+        "OfferSelector",
+        "RandomOfferSelector",
+        "BestOfferSelector",
+        "MedianOfferSelector",
+        "WorstOfferSelector",
+        "OfferOrientedSelector",
+        "FirstOfferOrientedSelector",
+        "LastOfferOrientedSelector",
+        "BestOfferOrientedSelector",
+        "OutcomeSetOrientedSelector",
+        "PartnerOffersOrientedSelector",
+        "MultiplicativePartnerOffersOrientedSelector",
+        "AdditivePartnerOffersOrientedSelector",
+        "UtilityInverter",
+        "UtilityBasedOutcomeSetRecommender",
+        "UFunModel",
+        "FrequencyUFunModel",
+        "FrequencyLinearUFunModel",
+        "ZeroSumModel",
+        "GBMechanism",
+        "ParallelGBMechanism",
+        "SerialGBMechanism",
+        "GBNegotiator",
+        "LimitedOutcomesNegotiator",
+        "LimitedOutcomesAcceptor",
+        "ToughNegotiator",
+        "TopFractionNegotiator",
+        "UtilBasedNegotiator",
+        "TimeBasedNegotiator",
+        "TimeBasedConcedingNegotiator",
+        "BoulwareTBNegotiator",
+        "LinearTBNegotiator",
+        "ConcederTBNegotiator",
+        "AspirationNegotiator",
+        "FirstOfferOrientedTBNegotiator",
+        "LastOfferOrientedTBNegotiator",
+        "BestOfferOrientedTBNegotiator",
+        "AdditiveParetoFollowingTBNegotiator",
+        "MultiplicativeParetoFollowingTBNegotiator",
+        "MultiplicativeLastOfferFollowingTBNegotiator",
+        "AdditiveLastOfferFollowingTBNegotiator",
+        "MultiplicativeFirstFollowingTBNegotiator",
+        "AdditiveFirstFollowingTBNegotiator",
+        "NaiveTitForTatNegotiator",
+        "SimpleTitForTatNegotiator",
+        "RandomNegotiator",
+        "RandomAlwaysAcceptingNegotiator",
+        "NiceNegotiator",
+        "CABNegotiator",
+        "CARNegotiator",
+        "CANNegotiator",
+        "WABNegotiator",
+        "WARNegotiator",
+        "WANNegotiator",
+        "MiCRONegotiator",
+        "EvaluationStrategy",
+        "LocalEvaluationStrategy",
+        "AnyAcceptEvaluationStrategy",
+        "AllAcceptEvaluationStrategy",
+        "all_accept",
+        "any_accept",
+        "GAOEvaluationStrategy",
+        "TAUEvaluationStrategy",
+        "INFINITE",
+        "OfferingConstraint",
+        "LocalOfferingConstraint",
+        "IncrementalOfferingConstraint",
+        "AnyOfferingConstraint",
+        "AllOfferingConstraints",
+        "RepeatFinalOfferOnly",
+        "RepeatLastOfferOnly",
+        "UniqueOffers",
+    ),
+    "sao": (
+        "ResponseType",
+        "SAOResponse",
+        "SAOState",
+        "SAONMI",
+        "all_negotiator_types",
+        "AcceptancePolicy",
+        "OfferingPolicy",
+        "ProposalPolicy",
+        "Model",
+        "LimitedOutcomesAcceptancePolicy",
+        "NegotiatorAcceptancePolicy",
+        "ConcensusAcceptancePolicy",
+        "AllAcceptanceStrategies",
+        "AnyAcceptancePolicy",
+        "AcceptImmediately",
+        "RejectAlways",
+        "EndImmediately",
+        "AcceptAbove",
+        "RandomAcceptancePolicy",
+        "AcceptTop",
+        "AcceptBest",
+        "TFTAcceptancePolicy",
+        "ACNext",
+        "ACLast",
+        "ACLastKReceived",
+        "ACLastFractionReceived",
+        "ACTime",
+        "AcceptAfter",
+        "AcceptAround",
+        "AcceptBetween",
+        "ACConst",
+        "AcceptAnyRational",
+        "AcceptBetterRational",
+        "AcceptNotWorseRational",
+        "CABOfferingPolicy",
+        "WAROfferingPolicy",
+        "LimitedOutcomesOfferingPolicy",
+        "NegotiatorOfferingPolicy",
+        "ConcensusOfferingPolicy",
+        "RandomConcensusOfferingPolicy",
+        "UnanimousConcensusOfferingPolicy",
+        "UtilBasedConcensusOfferingPolicy",
+        "MyBestConcensusOfferingPolicy",
+        "MyWorstConcensusOfferingPolicy",
+        "NoneOfferingPolicy",
+        "RandomOfferingPolicy",
+        "OfferTop",
+        "OfferBest",
+        "TFTOfferingPolicy",
+        "MiCROOfferingPolicy",
+        "TimeBasedOfferingStrategy",
+        "ConcessionRecommender",
+        "KindConcessionRecommender",
+        "OfferSelectorProtocol",
+        "OfferSelector",
+        "RandomOfferSelector",
+        "BestOfferSelector",
+        "MedianOfferSelector",
+        "WorstOfferSelector",
+        "OfferOrientedSelector",
+        "FirstOfferOrientedSelector",
+        "LastOfferOrientedSelector",
+        "BestOfferOrientedSelector",
+        "OutcomeSetOrientedSelector",
+        "PartnerOffersOrientedSelector",
+        "MultiplicativePartnerOffersOrientedSelector",
+        "AdditivePartnerOffersOrientedSelector",
+        "UtilityInverter",
+        "UtilityBasedOutcomeSetRecommender",
+        "UFunModel",
+        "FrequencyUFunModel",
+        "FrequencyLinearUFunModel",
+        "ZeroSumModel",
+        "SAOMechanism",
+        "SAOProtocol",
+        "TraceElement",
+        "SAONegotiator",
+        "LimitedOutcomesNegotiator",
+        "LimitedOutcomesAcceptor",
+        "ToughNegotiator",
+        "TopFractionNegotiator",
+        "UtilBasedNegotiator",
+        "TimeBasedNegotiator",
+        "TimeBasedConcedingNegotiator",
+        "BoulwareTBNegotiator",
+        "LinearTBNegotiator",
+        "ConcederTBNegotiator",
+        "AspirationNegotiator",
+        "FirstOfferOrientedTBNegotiator",
+        "LastOfferOrientedTBNegotiator",
+        "BestOfferOrientedTBNegotiator",
+        "AdditiveParetoFollowingTBNegotiator",
+        "MultiplicativeParetoFollowingTBNegotiator",
+        "MultiplicativeLastOfferFollowingTBNegotiator",
+        "AdditiveLastOfferFollowingTBNegotiator",
+        "MultiplicativeFirstFollowingTBNegotiator",
+        "AdditiveFirstFollowingTBNegotiator",
+        "NaiveTitForTatNegotiator",
+        "SimpleTitForTatNegotiator",
+        "RandomNegotiator",
+        "RandomAlwaysAcceptingNegotiator",
+        "NiceNegotiator",
+        "CABNegotiator",
+        "CARNegotiator",
+        "CANNegotiator",
+        "WABNegotiator",
+        "WARNegotiator",
+        "WANNegotiator",
+        "MiCRONegotiator",
+        "ControlledSAONegotiator",
+        "SAOController",
+        "SAORandomController",
+        "SAOSyncController",
+        "SAORandomSyncController",
+        "SAOSingleAgreementController",
+        "SAOSingleAgreementRandomController",
+        "SAOSingleAgreementAspirationController",
+        "SAOMetaNegotiatorController",
+    ),
+    "situated": (
+        "PROTOCOL_CLASS_NAME_FIELD",
+        "EDGE_TYPES",
+        "DEFAULT_EDGE_TYPES",
+        "EDGE_COLORS",
+        "RunningNegotiationInfo",
+        "NegotiationRequestInfo",
+        "RenegotiationRequest",
+        "NegotiationInfo",
+        "Operations",
+        "Action",
+        "Adapter",
+        "Agent",
+        "Entity",
+        "AgentWorldInterface",
+        "BreachProcessing",
+        "Breach",
+        "BulletinBoard",
+        "Contract",
+        "safe_min",
+        "deflistdict",
+        "show_edge_colors",
+        "ContractRecords",
+        "MechanismFactory",
+        "TimeInAgreementMixin",
+        "NoContractExecutionMixin",
+        "NoResponsesMixin",
+        "StatsMonitor",
+        "WorldMonitor",
+        "save_stats",
+        "IncrementalStatsWriter",
+        "StatsColumn",
+        "StatsStore",
+        "World",
+        "SimpleWorld",
+        "NegWorld",
+        "NegAgent",
+        "Condition",
+    ),
+    "st": ("VetoSTMechanism", "HillClimbingSTMechanism"),
+    "preferences": (
+        "INVALID_UTILITY",
+        "Distribution",
+        "Value",
+        "UtilityValue",
+        "VolatileUFunMixin",
+        "SessionDependentUFunMixin",
+        "StateDependentUFunMixin",
+        "StationaryMixin",
+        "BasePref",
+        "Ordinal",
+        "CardinalProb",
+        "CardinalCrisp",
+        "UFun",
+        "UFunProb",
+        "UFunCrisp",
+        "OrdinalRanking",
+        "CardinalRanking",
+        "HasReservedOutcome",
+        "HasReservedValue",
+        "HasReservedDistribution",
+        "Randomizable",
+        "Scalable",
+        "Shiftable",
+        "PartiallyShiftable",
+        "PartiallyScalable",
+        "Normalizable",
+        "HasRange",
+        "InverseUFun",
+        "IndIssues",
+        "XmlSerializableUFun",
+        "SingleIssueFun",
+        "MultiIssueFun",
+        "Preferences",
+        "BaseUtilityFunction",
+        "UtilityFunction",
+        "ProbUtilityFunction",
+        "PresortingInverseUtilityFunction",
+        "SamplingInverseUtilityFunction",
+        "LinDiscountedUFun",
+        "ExpDiscountedUFun",
+        "DiscountedUtilityFunction",
+        "ConstUtilityFunction",
+        "LinearUtilityAggregationFunction",
+        "LinearAdditiveUtilityFunction",
+        "LinearUtilityFunction",
+        "AffineUtilityFunction",
+        "MappingUtilityFunction",
+        "NonLinearAggregationUtilityFunction",
+        "HyperRectangleUtilityFunction",
+        "NonlinearHyperRectangleUtilityFunction",
+        "RandomUtilityFunction",
+        "RankOnlyUtilityFunction",
+        "ProbMappingUtilityFunction",
+        "IPUtilityFunction",
+        "ILSUtilityFunction",
+        "UniformUtilityFunction",
+        "ProbRandomUtilityFunction",
+        "pareto_frontier",
+        "pareto_frontier_of",
+        "pareto_frontier_bf",
+        "pareto_frontier_active",
+        "nash_points",
+        "kalai_points",
+        "ks_points",
+        "max_welfare_points",
+        "max_relative_welfare_points",
+        "make_discounted_ufun",
+        "scale_max",
+        "normalize",
+        "sample_outcome_with_utility",
+        "extreme_outcomes",
+        "minmax",
+        "conflict_level",
+        "opposition_level",
+        "winwin_level",
+        "get_ranks",
+        "distance_to",
+        "distance_between",
+        "calc_outcome_distances",
+        "calc_scenario_stats",
+        "ScenarioStats",
+        "OutcomeDistances",
+        "OutcomeOptimality",
+        "sort_by_utility",
+        "calc_reserved_value",
+        "dominating_points",
+        "WeightedUtilityFunction",
+        "ComplexNonlinearUtilityFunction",
+        "ConstFun",
+        "IdentityFun",
+        "AffineFun",
+        "LinearFun",
+        "TriangularFun",
+        "LambdaFun",
+        "PolynomialFun",
+        "QuadraticFun",
+        "ExponentialFun",
+        "LogFun",
+        "SinFun",
+        "CosFun",
+        "TableFun",
+        "TableMultiFun",
+        "AffineMultiFun",
+        "LinearMultiFun",
+        "LambdaMultiFun",
+        "make_fun_from_xml",
+    ),
+    "genius": (
+        "DEFAULT_JAVA_PORT",
+        "DEFAULT_PYTHON_PORT",
+        "DEFAULT_GENIUS_NEGOTIATOR_TIMEOUT",
+        "ANY_JAVA_PORT",
+        "RANDOM_JAVA_PORT",
+        "get_free_tcp_port",
+        "GeniusBridge",
+        "init_genius_bridge",
+        "genius_bridge_is_running",
+        "genius_bridge_is_installed",
+        "GeniusNegotiator",
+    ),
+}
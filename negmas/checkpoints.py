@@ -9,6 +9,7 @@ from typing import Any, Callable
 
 import numpy as np
 
+from negmas.helpers.checkpointing import wait_for_checkpoints
 from negmas.helpers.inout import load
 from negmas.types import NamedObject
 
@@ -25,6 +26,10 @@ class CheckpointMixin:
         info: dict[str, Any] | None = None,
         exist_ok: bool = True,
         single: bool = True,
+        compression: str | None = None,
+        background: str | None = None,
+        differential: int = 0,
+        zero_copy: bool = False,
     ):
         """
         Initializes the object to automatically save a checkpoint
@@ -39,13 +44,29 @@ class CheckpointMixin:
             info: Any extra information to save in the json file associated with each checkpoint
             exist_ok: Override existing files if any
             single: If True, only the most recent checkpoint will be kept
+            compression: Compression method for checkpoints (gzip, bz2, lzma, zstd or lz4) or None for no compression
+            background: If given, checkpoints are written without waiting for the disk. Use "thread" to serialize
+                        the object in the caller and only write (compress and save) it in a background thread or
+                        "fork" to both serialize and write it in a forked (copy-on-write) process so that the
+                        object is not stalled by serialization either.
+            differential: If positive, a full checkpoint is followed by this number of differential checkpoints
+                          storing only the changes from it (ignored if `single` or `zero_copy` is True)
+            zero_copy: If True, numpy arrays are saved as separate blobs that are memory-mapped when the checkpoint
+                       is loaded (see `negmas.helpers.checkpointing.write_checkpoint`)
 
         Remarks:
 
             - single_checkpoint implies exist_ok
+            - `CheckpointRunner` reconstructs differential checkpoints from their base transparently.
 
         """
         self.__checkpoint_every = -1 if folder is None else every
+        self.__checkpoint_compression = compression
+        self.__checkpoint_background = background
+        self.__checkpoint_differential = 0 if single or zero_copy else differential
+        self.__checkpoint_zero_copy = zero_copy
+        self.__checkpoint_base: Path | None = None
+        self.__checkpoint_n_deltas = 0
         self.__checkpoint_folder = folder
         self.__checkpoint_extra_info = info
         self.__checkpoint_exist_ok = exist_ok
@@ -67,16 +88,48 @@ class CheckpointMixin:
             return None
         step = getattr(self, self.__step_atrrib)
         if step % self.__checkpoint_every == 0 or self.__checkpoint_every == 1:
-            me: NamedObject = self  # type: ignore
-            return me.checkpoint(
-                path=self.__checkpoint_folder,
-                file_name=self.__checkpoint_filename,
-                info=self.__checkpoint_extra_info,
-                exist_ok=self.__checkpoint_exist_ok or self.__checkpoint_single,
-                single_checkpoint=self.__checkpoint_single,
-                step_attribs=(self.__step_atrrib,),
+            return self.__save_checkpoint(
+                exist_ok=self.__checkpoint_exist_ok or self.__checkpoint_single
             )
 
+    def __save_checkpoint(self, exist_ok: bool) -> Path:
+        base = None
+        if self.__checkpoint_differential > 0:
+            if (
+                self.__checkpoint_base is not None
+                and self.__checkpoint_n_deltas < self.__checkpoint_differential
+            ):
+                base = self.__checkpoint_base
+                self.__checkpoint_n_deltas += 1
+            else:
+                self.__checkpoint_base, self.__checkpoint_n_deltas = None, 0
+        self.checkpoint_flush()
+        me: NamedObject = self  # type: ignore
+        path = me.checkpoint(
+            path=self.__checkpoint_folder,  # type: ignore
+            file_name=self.__checkpoint_filename,
+            info=self.__checkpoint_extra_info,
+            exist_ok=exist_ok,
+            single_checkpoint=self.__checkpoint_single,
+            step_attribs=(self.__step_atrrib,),
+            compression=self.__checkpoint_compression,
+            base=base,
+            background=self.__checkpoint_background,
+            zero_copy=self.__checkpoint_zero_copy,
+        )
+        if self.__checkpoint_differential > 0 and base is None:
+            self.__checkpoint_base = path
+        return path
+
+    def checkpoint_flush(self) -> None:
+        """Called (in this process) before every checkpoint is saved to write any buffered output (e.g. event logs).
+
+        Remarks:
+            - Saving a checkpoint must not write output as a side effect because the object may be serialized in a
+              forked process (see the `background` parameter of `checkpoint_init`). Buffered output that is not
+              written here is not saved in the checkpoint.
+        """
+
     def checkpoint_final_step(self) -> Path | None:
         """Should be called at the end of the simulation to save the final state
 
@@ -85,15 +138,9 @@ class CheckpointMixin:
         """
         if self.__checkpoint_every < 1 or self.__checkpoint_folder is None:
             return None
-        me: NamedObject = self  # type: ignore
-        return me.checkpoint(
-            path=self.__checkpoint_folder,
-            file_name=self.__checkpoint_filename,
-            info=self.__checkpoint_extra_info,
-            exist_ok=True,
-            single_checkpoint=self.__checkpoint_single,
-            step_attribs=(self.__step_atrrib,),
-        )
+        path = self.__save_checkpoint(exist_ok=True)
+        wait_for_checkpoints()
+        return path
 
 
 class CheckpointRunner:
@@ -214,6 +261,7 @@ class CheckpointRunner:
         info: dict[str, Any] | None = None,
         exist_ok: bool = True,
         single: bool = True,
+        step: int | None = None,
     ) -> NamedObject | None:
         """
         Creates a copy of the internal object that can be run safely.
@@ -229,19 +277,29 @@ class CheckpointRunner:
             info: Any extra information to save in the json file associated with each checkpoint
             exist_ok: Override existing files if any
             single: If True, only the most recent checkpoint will be kept
+            step: If given, a new object is loaded from the checkpoint of this step (which must exist) instead of
+                  using the loaded object. The current step of the runner does not change.
 
         Returns:
+            The forked object or None if no step is loaded (and `step` is not given)
+
+        Remarks:
+            - Loading zero-copy checkpoints (see `CheckpointMixin.checkpoint_init`) memory-maps their arrays so
+              forking many steps is cheap and the forks share unchanged array memory.
 
         """
-        if self.__object is None:
+        if step is not None:
+            filename = self.__files.get(step)
+            if not filename:
+                raise ValueError(f"step {step} has no file")
+            x = self.__object_type.from_checkpoint(filename, return_info=False)
+        elif self.__object is None:
             return None
-        if (
-            not isinstance(self.__object, CheckpointMixin)
-            and folder is not None
-            and every > 0
-        ):
+        else:
+            x, step = self.__object, self.current_step
+        if not isinstance(x, CheckpointMixin) and folder is not None and every > 0:
             raise ValueError(
-                f"Object of type {self.__object.__class__.__name__} is not implementing the "
+                f"Object of type {x.__class__.__name__} is not implementing the "
                 f"CheckpointMixin. It cannot be forked"
             )
         if copy_past_checkpoints and folder is None:
@@ -255,12 +313,11 @@ class CheckpointRunner:
             folder = Path(folder).absolute()
 
         if copy_past_checkpoints:
-            files = [v for k, v in self.__files.items() if k <= self.current_step]
+            files = [v for k, v in self.__files.items() if k <= step]
             for f in files:
                 shutil.copy(str(f), str(folder / Path(f).name))
                 shutil.copy(str(f) + ".json", str(folder / (Path(f).name + ".json")))
-        x = self.__object
-        if isinstance(self.__object, CheckpointMixin):
+        if isinstance(x, CheckpointMixin):
             CheckpointMixin.checkpoint_init(
                 x,  # type: ignore
                 every=every,
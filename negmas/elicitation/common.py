@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, Iterable
+from heapq import heapify
+from typing import Any, Hashable, Iterable, Iterator
 
 import numpy as np
 
@@ -8,7 +9,17 @@ from ..common import Value
 np.seterr(all="raise")  # setting numpy to raise exceptions in case of errors
 
 
-__all__ = ["_loc", "_locs", "_scale", "_upper", "_uppers", "argmax", "argmin", "argmin"]
+__all__ = [
+    "_loc",
+    "_locs",
+    "_scale",
+    "_upper",
+    "_uppers",
+    "argmax",
+    "argmin",
+    "argmin",
+    "IndexedHeap",
+]
 
 
 def _loc(u: Value):
@@ -49,3 +60,109 @@ def argsort(iterable: Iterable[Any]):
 def argmin(iterable):
     """Returns the index of the minimum"""
     return min(enumerate(iterable), key=lambda x: x[1])[0]
+
+
+class IndexedHeap:
+    """
+    A min-heap of (priority, key) tuples that can update or remove the entry of any key in O(log n).
+
+    Args:
+        items: Initial (priority, key) tuples. Keys must be hashable and unique.
+
+    Remarks:
+        - Entries are ordered like a list maintained by `heapq` (i.e. by priority then key). Indexing and
+          iteration give entries in heap order so `heap[0]` is the minimum.
+    """
+
+    __slots__ = ("_heap", "_positions")
+
+    def __init__(self, items: Iterable[tuple[float, Hashable]] = ()):
+        self._heap = list(items)
+        heapify(self._heap)
+        self._positions = {key: i for i, (_, key) in enumerate(self._heap)}
+        if len(self._positions) != len(self._heap):
+            raise ValueError("Keys of an IndexedHeap must be unique")
+
+    def _sift_up(self, i: int) -> None:
+        heap, positions, item = self._heap, self._positions, self._heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if not item < above:
+                break
+            heap[i] = above
+            positions[above[1]] = i
+            i = parent
+        heap[i] = item
+        positions[item[1]] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, positions, item = self._heap, self._positions, self._heap[i]
+        n = len(heap)
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and heap[right] < heap[child]:
+                child = right
+            below = heap[child]
+            if not below < item:
+                break
+            heap[i] = below
+            positions[below[1]] = i
+            i, child = child, 2 * child + 1
+        heap[i] = item
+        positions[item[1]] = i
+
+    def push(self, priority: float, key: Hashable) -> None:
+        """Adds an entry (or updates the priority of the key if it is already in the heap)"""
+        if key in self._positions:
+            self.update(key, priority)
+            return
+        self._heap.append((priority, key))
+        self._positions[key] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self) -> tuple[float, Hashable]:
+        """Removes and returns the entry with minimum priority"""
+        return self.remove(self._heap[0][1])
+
+    def update(self, key: Hashable, priority: float) -> None:
+        """Changes the priority of a key in the heap"""
+        i = self._positions[key]
+        old = self._heap[i]
+        self._heap[i] = (priority, key)
+        if self._heap[i] < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, key: Hashable) -> tuple[float, Hashable]:
+        """Removes the entry of a key and returns it"""
+        i = self._positions.pop(key)
+        item, last = self._heap[i], self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            if last < item:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        return item
+
+    def priority(self, key: Hashable) -> float:
+        """Returns the priority of a key in the heap"""
+        return self._heap[self._positions[key]][0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def __getitem__(self, i: int) -> tuple[float, Hashable]:
+        return self._heap[i]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[tuple[float, Hashable]]:
+        return iter(self._heap)
+
+    def __repr__(self) -> str:
+        return f"IndexedHeap({self._heap})"
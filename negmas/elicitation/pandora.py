@@ -2,7 +2,6 @@ from __future__ import annotations
 import functools
 import random
 import time
-from heapq import heapify, heappop
 from math import sqrt
 from typing import Callable
 
@@ -15,7 +14,7 @@ from ..negotiators.helpers import PolyAspiration
 from ..outcomes import Outcome
 from ..sao import AspirationNegotiator, SAONegotiator
 from .base import BaseElicitor
-from .common import _loc, _scale
+from .common import IndexedHeap, _loc, _scale
 from .expectors import (
     AspiringExpector,
     BalancedExpector,
@@ -191,6 +190,7 @@ class BasePandoraElicitor(BaseElicitor):
         self.user_model_in_index = user_model_in_index
         self.precalculated_index = precalculated_index
         self.incremental = incremental
+        self._outcomes: list[Outcome] = []
         self.__asp = PolyAspiration(max_aspiration, aspiration_type)
 
     def utility_at(self, x):
@@ -254,75 +254,70 @@ class BasePandoraElicitor(BaseElicitor):
             return self.user.ufun(outcome)
         return u
 
+    def _index_of(
+        self, i: int, current: float, reserved_value: float, cost: float
+    ) -> float:
+        """Returns minus the index of the outcome with the given index (`current` is its current value)"""
+        outcomes = self._outcomes
+        xw = self.preferences.distributions[outcomes[i]]
+        if self.assume_uniform:
+            loc = xw.loc if not isinstance(xw, float) else xw
+            scale = xw.scale if not isinstance(xw, float) else 0.0
+            if self.user_model_in_index:
+                p = self.opponent_model.probability_of_acceptance(outcomes[i])
+                current_loc = loc
+                loc = p * loc + (1 - p) * reserved_value
+                scale = p * (current_loc + scale) + (1 - p) * reserved_value - loc
+            return -weitzman_index_uniform(loc, scale, cost=cost)
+
+        def qualityfun(z, distribution, cost):
+            c_estimate = distribution.expect(lambda x: x - z, lb=z, ub=1.0)
+            if self.user_model_in_index:
+                p = self.opponent_model.probability_of_acceptance(outcomes[i])
+                c_estimate = p * c_estimate + (1 - p) * reserved_value
+            return sqrt(c_estimate - cost)
+
+        f = functools.partial(qualityfun, distribution=xw, cost=cost)
+        return -opt.minimize(
+            f, x0=np.asarray([current]), bounds=[(0.0, 1.0)], method="L-BFGS-B"
+        ).x[0]
+
     def z_index(self, updated_outcomes: list[Outcome] | None = None):
         """
         Update the internal z-index or create it if needed.
 
         Args:
             updated_outcomes: A list of the outcomes with updated utility values.
+
+        Remarks:
+            - The z-index is an `IndexedHeap` of (minus the index, outcome index) tuples. Only the entries of updated
+              outcomes that are still unknown are recalculated (each in O(log n)).
         """
-        n_outcomes = self._nmi.n_outcomes
-        outcomes = self._nmi.outcomes
         unknown = self.unknown
+        reserved_value, cost = self.reserved_value, self.user.cost_of_asking()
         if unknown is None:
-            unknown = [(-self.reserved_value, _) for _ in range(n_outcomes)]
-        else:
-            unknown = [_ for _ in unknown if _[1] is not None]
-
-        xw = list(self.preferences.distributions.values())
-        if len(unknown) == 0:
-            return
-        unknown_indices = [_[1] for _ in unknown if _[1] is not None]
+            n_outcomes = self._nmi.n_outcomes
+            return IndexedHeap(
+                (self._index_of(i, -reserved_value, reserved_value, cost), i)
+                for i in range(n_outcomes)
+            )
         if updated_outcomes is None:
-            updated_outcomes = unknown_indices
-        else:
-            updated_outcomes = [self.indices[_] for _ in updated_outcomes]
-            updated_outcomes = list(set(unknown_indices).intersection(updated_outcomes))
-        if len(updated_outcomes) == 0:
-            return unknown
-        z = unknown
-        if self.assume_uniform:
-            for j, (u, i) in enumerate(unknown):
-                if i is None or i not in updated_outcomes:
-                    continue
-                loc = xw[i].loc if not isinstance(xw[i], float) else xw[i]
-                scale = xw[i].scale if not isinstance(xw[i], float) else 0.0
-                if self.user_model_in_index:
-                    p = self.opponent_model.probability_of_acceptance(outcomes[i])
-                    current_loc = loc
-                    loc = p * loc + (1 - p) * self.reserved_value
-                    scale = (
-                        p * (current_loc + scale) + (1 - p) * self.reserved_value - loc
-                    )
-                cost = self.user.cost_of_asking()
-                z[j] = (-weitzman_index_uniform(loc, scale, cost=cost), i)
+            updated = [_[1] for _ in unknown]
         else:
-
-            def qualityfun(z, distribution, cost):
-                c_estimate = distribution.expect(lambda x: x - z, lb=z, ub=1.0)
-                if self.user_model_in_index:
-                    p = self.opponent_model.probability_of_acceptance(outcomes[i])
-                    c_estimate = p * c_estimate + (1 - p) * self.reserved_value
-                return sqrt(c_estimate - cost)
-
-            for j, (u, i) in enumerate(unknown):
-                if i is None or i not in updated_outcomes:
-                    continue
-                cost = self.user.cost_of_asking()
-                f = functools.partial(qualityfun, distribution=xw[i], cost=cost)
-                z[j] = (
-                    -opt.minimize(
-                        f, x0=np.asarray([u]), bounds=[(0.0, 1.0)], method="L-BFGS-B"
-                    ).x[0],
-                    i,
-                )
-                # we always push the reserved value for the outcome None representing breaking
-        heapify(z)
-        return z
+            indices = self.indices
+            updated = {indices[_] for _ in updated_outcomes}
+            updated = [_ for _ in updated if _ in unknown]
+        for i in updated:
+            if i is None:
+                continue
+            unknown.update(
+                i, self._index_of(i, unknown.priority(i), reserved_value, cost)
+            )
+        return unknown
 
     def init_unknowns(self):
         """
-        Initializes the unknowns list which is a list of Tuples [-u(o), o] for o in outcomes.
+        Initializes the unknowns heap of tuples [-z(o), o] for o in outcomes (see `z_index`).
         """
         self.unknown = self.z_index(updated_outcomes=None)
 
@@ -347,16 +342,14 @@ class BasePandoraElicitor(BaseElicitor):
 
     def update_best_offer_utility(self, outcome: Outcome, u: Value):
         """
-        Updates the unknown list (and makes sure it is a heap) given the given utility
-        value for the given outcome.
+        Updates the unknown heap given the given utility value for the best outcome.
         """
         if self.unknown is None:
             self.init_unknowns()
-        self.unknown[0] = (
-            -weitzman_index_uniform(_loc(u), _scale(u), self.user.cost_of_asking()),
+        self.unknown.update(
             self.unknown[0][1],
+            -weitzman_index_uniform(_loc(u), _scale(u), self.user.cost_of_asking()),
         )
-        heapify(self.unknown)
 
     def remove_best_offer_from_unknown_list(self) -> tuple[float, int]:
         """
@@ -364,7 +357,7 @@ class BasePandoraElicitor(BaseElicitor):
         """
         if self.unknown is None:
             self.init_unknowns()
-        return heappop(self.unknown)
+        return self.unknown.pop()
 
     def elicit_single(self, state: MechanismState):
         """
@@ -391,7 +384,7 @@ class BasePandoraElicitor(BaseElicitor):
             return False
         if best_index is None:
             return self.continue_eliciting_past_reserved_val
-        outcome = self._nmi.outcomes[best_index]
+        outcome = self._outcomes[best_index]
         u = self.do_elicit(outcome, None)
         self.preferences.distributions[outcome] = u
         expected_value = self.offering_utility(outcome, state=state)
@@ -422,6 +415,7 @@ class BasePandoraElicitor(BaseElicitor):
         super().init_elicitation(preferences=preferences, **kwargs)
         strt_time = time.perf_counter()
         self.cutoff_utility = self.reserved_value
+        self._outcomes = list(self._nmi.outcomes)
         self.unknown = None  # needed as init_unknowns uses unknown
         self.init_unknowns()
         self._elicitation_time += time.perf_counter() - strt_time
@@ -509,8 +503,8 @@ class FullElicitor(BasePandoraElicitor):
             self.elicitation_history = [zip(outcomes, utilities)]
             self.elicited = True
 
-    def init_unknowns(self) -> list[tuple[float, int]]:
-        self.unknown = []
+    def init_unknowns(self) -> None:
+        self.unknown = IndexedHeap()
 
 
 class RandomElicitor(BasePandoraElicitor):
@@ -547,12 +541,9 @@ class RandomElicitor(BasePandoraElicitor):
 
     def init_unknowns(self) -> None:
         n = self._nmi.n_outcomes
-        z: list[tuple[float, int | None]] = list(
-            zip((-random.random() for _ in range(n + 1)), range(n + 1))
-        )
-        z[-1] = (z[-1][0], None)
-        heapify(z)
-        self.unknown = z
+        keys: list[int | None] = list(range(n))
+        keys.append(None)
+        self.unknown = IndexedHeap(zip((-random.random() for _ in keys), keys))
 
     def update_best_offer_utility(self, outcome: Outcome, u: Value):
         pass
@@ -2,10 +2,11 @@
 Implements all Value-of-Information based elicitation methods.
 """
 from __future__ import annotations
-import copy
+import os
 import time
 from abc import abstractmethod
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from heapq import heapify, heappop, heappush
 
 import numpy as np
@@ -33,7 +34,7 @@ from ..models.acceptance import AdaptiveDiscreteAcceptanceModel
 from ..outcomes import Outcome
 from ..sao import AspirationNegotiator, SAONegotiator
 from .base import BaseElicitor
-from .common import _scale, argmax
+from .common import _scale
 from .expectors import Expector, MeanExpector
 from .queries import Answer, Query, RangeConstraint
 from .strategy import EStrategy
@@ -48,6 +49,121 @@ __all__ = [
 ]
 
 
+PARALLEL_MIN_ANSWERS = 10_000
+"""Minimum number of answers evaluated at once by `VOIElicitor` to split the evaluation among threads"""
+
+
+def _policy_sums(
+    eus: np.ndarray, acceptance: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the probability of reaching every step of a policy and the EEU accumulated before every step.
+
+    Args:
+        eus: Expected utilities of the outcomes in the order they are offered
+        acceptance: Acceptance probabilities of the same outcomes
+
+    Returns:
+        Two arrays of length `len(eus) + 1`. The last element of the second is the EEU of the policy.
+    """
+    with np.errstate(all="ignore"):
+        p = np.ones(len(eus) + 1)
+        p[1:] = np.cumprod(1.0 - acceptance)
+        s = np.zeros(len(eus) + 1)
+        s[1:] = np.cumsum(eus * acceptance * p[:-1])
+    return p, s
+
+
+def _replaced_eeu(
+    eus: np.ndarray, acceptance: np.ndarray, position: int, value: float
+) -> float:
+    """EEU of a policy sorted descendingly on eus after replacing the eu at `position` with `value`"""
+    others, accept = np.delete(eus, position), np.delete(acceptance, position)
+    t = int(np.count_nonzero(others > value))
+    others = np.insert(others, t, value)
+    accept = np.insert(accept, t, acceptance[position])
+    return float(_policy_sums(others, accept)[1][-1])
+
+
+def _replaced_eeus_serial(
+    eus: np.ndarray,
+    acceptance: np.ndarray,
+    p: np.ndarray,
+    s: np.ndarray,
+    positions: np.ndarray,
+    values: np.ndarray,
+) -> np.ndarray:
+    n = len(eus)
+    m = acceptance[positions]
+    q = 1.0 - m
+    count = np.searchsorted(-eus, -values, side="left")
+    # the new position of the outcome in the policy without it
+    t = count - (positions < count)
+    forward = t <= positions
+    after = np.minimum(t + 1, n)
+    with np.errstate(all="ignore"):
+        # outcomes between the new and old positions get delayed by one step
+        moved_forward = (
+            s[t]
+            + values * m * p[t]
+            + q * (s[positions] - s[t])
+            + s[n]
+            - s[positions + 1]
+        )
+        # outcomes between the old and new positions get offered one step earlier
+        moved_back = (
+            s[positions]
+            + (s[after] - s[positions + 1]) / q
+            + values * m * p[after] / q
+            + s[n]
+            - s[after]
+        )
+    result = np.where(forward, moved_forward, moved_back)
+    for i in np.flatnonzero(~forward & (q < 1e-9)).tolist():
+        result[i] = _replaced_eeu(eus, acceptance, int(positions[i]), float(values[i]))
+    return result
+
+
+def _replaced_eeus(
+    eus: np.ndarray,
+    acceptance: np.ndarray,
+    p: np.ndarray,
+    s: np.ndarray,
+    positions: np.ndarray,
+    values: np.ndarray,
+    max_workers: int | None = 0,
+) -> np.ndarray:
+    """
+    EEUs of a policy after replacing the eu of a single outcome (evaluated for many replacements at once).
+
+    Args:
+        eus: Expected utilities of the outcomes in the policy (sorted descendingly)
+        acceptance: Acceptance probabilities of the same outcomes
+        p: Reaching probabilities of the policy (see `_policy_sums`)
+        s: Cumulative EEUs of the policy (see `_policy_sums`)
+        positions: The position in the policy of the outcome changed in every replacement
+        values: The new eu of this outcome in every replacement
+        max_workers: Number of threads to use for more than `PARALLEL_MIN_ANSWERS` replacements (zero for none)
+
+    Returns:
+        The EEU of the policy (after sorting it again) for every replacement
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    values = np.asarray(values, dtype=float)
+    if max_workers == 0 or len(values) < PARALLEL_MIN_ANSWERS:
+        return _replaced_eeus_serial(eus, acceptance, p, s, positions, values)
+    n_chunks = max_workers if max_workers else (os.cpu_count() or 1)
+    chunks = np.array_split(np.arange(len(values)), n_chunks)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(
+            lambda c: _replaced_eeus_serial(
+                eus, acceptance, p, s, positions[c], values[c]
+            ),
+            chunks,
+        )
+        return np.concatenate(list(results))
+
+
 class BaseVOIElicitor(BaseElicitor):
     """
     Base class for all value of information (VOI) elicitation algorithms
@@ -134,20 +250,36 @@ class BaseVOIElicitor(BaseElicitor):
 
         """
 
-    def init_query_eeus(self) -> None:
-        """Updates the heap eeu_query which has records of (-EEU, quesion)"""
-        queries = self.queries
+    def _query_eeus(self, qindices: list[int]) -> list[float]:
+        """
+        Finds the eeu values associated with the given queries (see `_query_eeu`).
+
+        Args:
+            qindices: Indices of the queries in the queries list
+
+        Remarks:
+            - Should return - EEU for every query in the same order
+            - By default it calls `_query_eeu` for every query. Override it to evaluate all queries at once.
+        """
         eu_policy, eeu = self.eu_policy, self.current_eeu
-        eeu_query = []
-        for qindex, current in enumerate(queries):
-            outcome, query, cost = current
-            if query is None or outcome is None:
-                continue
-            outcome_index = self.indices[outcome]
-            qeeu = self._query_eeu(
-                query, qindex, outcome, cost, outcome_index, eu_policy, eeu
+        results = []
+        for qindex in qindices:
+            outcome, query, cost = self.queries[qindex]
+            results.append(
+                self._query_eeu(
+                    query, qindex, outcome, cost, self.indices[outcome], eu_policy, eeu
+                )
             )
-            eeu_query.append((qeeu, qindex))
+        return results
+
+    def init_query_eeus(self) -> None:
+        """Updates the heap eeu_query which has records of (-EEU, quesion)"""
+        qindices = [
+            qindex
+            for qindex, (outcome, query, _) in enumerate(self.queries)
+            if query is not None and outcome is not None
+        ]
+        eeu_query = list(zip(self._query_eeus(qindices), qindices))
         heapify(eeu_query)
         self.eeu_query = eeu_query
 
@@ -419,6 +551,18 @@ class VOIElicitor(BaseVOIElicitor):
     """
     The Optimal Querying Agent (OQA) proposed by [Baarslag and Kaisers]_
 
+    Args:
+        max_workers: The number of threads used to evaluate queries when their answers are more than
+                     `PARALLEL_MIN_ANSWERS` (`None` for one per CPU). Zero (default) evaluates them in the caller.
+        **kwargs: Passed to `BaseVOIElicitor`
+
+    Remarks:
+        - The optimal policy offers outcomes in descending order of their expected utilities.
+        - The EEU after every answer of every query is evaluated at once (using the cumulative sums of the policy)
+          instead of rebuilding the policy for each answer.
+        - The expected utilities after every answer of a query are cached and only recalculated when the
+          utility distribution of the outcome of the query changes.
+
 
     .. [Baarslag and Kaisers] Tim Baarslag and Michael Kaisers. 2017. The Value
        of Information in Automated Negotiation: A Decision Model for Eliciting
@@ -429,87 +573,93 @@ class VOIElicitor(BaseVOIElicitor):
 
     """
 
+    def __init__(self, *args, max_workers: int | None = 0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_workers = max_workers
+        # eus, acceptance probabilities, reaching probabilities and cumulative eeus of the current policy
+        self._policy: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = (
+            None
+        )
+        # query index -> (answers, utility distribution, eus after every answer, answer probabilities)
+        self._answer_eus: dict[int, tuple] = dict()
+
     def eeu(self, policy: np.ndarray, eus: np.ndarray) -> float:
         """Expected Expected Negotiator for following the policy"""
-        p = np.ones(len(policy) + 1)
         m = self.opponent_model.acceptance_probabilities()[policy]
-        r = 1 - m
-        eup = -eus * m
-        p[1:-1] = np.cumprod(r[:-1])
-        try:
-            result = np.sum(eup * p[:-1])
-        except FloatingPointError:
-            result = 0.0
-            try:
-                result = eup[0] * p[0]
-                for i in range(1, len(eup)):
-                    try:
-                        result += eup[0] * p[i]
-                    except Exception:
-                        break
-            except FloatingPointError:
-                result = 0.0
-        return round(float(result), 6)
+        _, s = _policy_sums(-np.asarray(eus, dtype=float), m)
+        return round(float(s[-1]), 6)
 
     def init_optimal_policy(self) -> None:
         """Gets the optimal policy given Negotiator utility_priors"""
-        nmi = self._nmi
-        n_outcomes = nmi.n_outcomes
-        # remaining_steps = nmi.remaining_steps if nmi.remaining_steps is not None else nmi.n_outcomes
-        D = n_outcomes
-        indices = set(list(range(n_outcomes)))
-        p = self.opponent_model.acceptance_probabilities()
-        eus = self.eus
-        eeus1outcome = eus * p
-        best_indx = argmax(eeus1outcome)
-        eu_policy = [(-eus[best_indx], best_indx)]
-        indices.remove(best_indx)
-        D -= 1
-        best_eeu = eus[best_indx]
-        for _ in range(D):
-            if len(indices) < 1:
-                break
-            candidate_policies = [copy.copy(eu_policy) for _ in indices]
-            best_index, best_eeu, eu_policy = None, -10.0, None
-            for i, candidate_policy in zip(indices, candidate_policies):
-                heappush(candidate_policy, (-eus[i], i))
-                # now we have the sorted list of outcomes as a candidate policy
-                _policy = np.array([_[1] for _ in candidate_policy])
-                _eus = np.array([_[0] for _ in candidate_policy])
-                current_eeu = self.eeu(policy=_policy, eus=_eus)
-                if (
-                    current_eeu > best_eeu
-                ):  # all numbers are negative so really that means current_eeu > best_eeu
-                    best_eeu, best_index, eu_policy = current_eeu, i, candidate_policy
-            if best_index is not None:
-                indices.remove(best_index)
-        self.outcome_in_policy = {}
-        for i, (_, outcome) in enumerate(eu_policy):
-            self.outcome_in_policy[outcome] = i
-        heapify(eu_policy)
-        self.eu_policy, self.current_eeu = eu_policy, best_eeu
+        acceptance = np.asarray(
+            self.opponent_model.acceptance_probabilities(), dtype=float
+        )
+        order = np.argsort(-self.eus, kind="stable")
+        eus, acceptance = np.asarray(self.eus, dtype=float)[order], acceptance[order]
+        p, s = _policy_sums(eus, acceptance)
+        self._policy = (eus, acceptance, p, s)
+        order = order.tolist()
+        self.outcome_in_policy = {outcome: i for i, outcome in enumerate(order)}
+        # sorted on -EU so it is also a heap
+        self.eu_policy = [(-eu, outcome) for eu, outcome in zip(eus.tolist(), order)]
+        self.current_eeu = round(float(s[-1]), 6)
+
+    def _answers_of(self, qindex: int) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the eu of the outcome of a query after every answer and the probabilities of these answers"""
+        outcome, query, _ = self.queries[qindex]
+        current_util = self.preferences(outcome)
+        cached = self._answer_eus.get(qindex, None)
+        if (
+            cached is not None
+            and cached[0] is query.answers
+            and cached[1] is current_util
+        ):
+            return cached[2], cached[3]
+        eus = np.asarray(
+            [
+                float(answer.constraint.marginal(outcome) & current_util)
+                for answer in query.answers
+            ],
+            dtype=float,
+        )
+        probs = np.asarray(query.probs, dtype=float)
+        n = min(len(eus), len(probs))
+        self._answer_eus[qindex] = (query.answers, current_util, eus[:n], probs[:n])
+        return eus[:n], probs[:n]
+
+    def _query_eeus(self, qindices: list[int]) -> list[float]:
+        if not qindices:
+            return []
+        if self._policy is None:
+            self.init_optimal_policy()
+        assert self._policy is not None
+        answers = [self._answers_of(_) for _ in qindices]
+        counts = np.asarray([len(_[0]) for _ in answers])
+        positions = np.repeat(
+            [
+                self.outcome_in_policy[self.indices[self.queries[_][0]]]
+                for _ in qindices
+            ],
+            counts,
+        )
+        values = np.concatenate([_[0] for _ in answers])
+        probs = np.concatenate([_[1] for _ in answers])
+        eeus = np.round(
+            _replaced_eeus(*self._policy, positions, values, self.max_workers), 6
+        )
+        with np.errstate(all="ignore"):
+            expected = np.bincount(
+                np.repeat(np.arange(len(qindices)), counts),
+                weights=probs * eeus,
+                minlength=len(qindices),
+            )
+        costs = np.asarray([self.queries[_][2] for _ in qindices], dtype=float)
+        return (costs - expected).tolist()
 
     def _query_eeu(
         self, query, qindex, outcome, cost, outcome_index, eu_policy, eeu
     ) -> float:
-        current_util = self.preferences(outcome)
-        answers = query.answers
-        answer_probabilities = query.probs
-        answer_eeus = []
-        for answer in answers:
-            self.init_optimal_policy()
-            policy_record_index = self.outcome_in_policy[outcome_index]
-            eu_policy = copy.deepcopy(self.eu_policy)
-            new_util = (
-                -float(answer.constraint.marginal(outcome) & current_util),
-                outcome_index,
-            )
-            eu_policy[policy_record_index] = new_util
-            heapify(eu_policy)
-            _policy = np.array([_[1] for _ in eu_policy])
-            _eus = np.array([_[0] for _ in eu_policy])
-            answer_eeus.append(self.eeu(policy=_policy, eus=_eus))
-        return cost - sum(a * b for a, b in zip(answer_probabilities, answer_eeus))
+        return self._query_eeus([qindex])[0]
 
 
 class VOIFastElicitor(BaseVOIElicitor):
@@ -2,11 +2,12 @@
 from __future__ import annotations
 import json
 import random
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator
 
 from negmas import warnings
 
@@ -19,6 +20,8 @@ __all__ = [
     "EventSource",
     "EventSink",
     "EventLogger",
+    "EVENT_LOG_FORMATS",
+    "read_events",
     "Notification",
     "Notifier",
     "Notifiable",
@@ -35,18 +38,33 @@ class Event:
 
 
 class EventSource:
-    """An object capable of raising events"""
+    """An object capable of raising events
+
+    Remarks:
+        - Listeners are informed in the order of registration (listeners of the event type first then listeners
+          of all types). Set `shuffle_listeners` to inform them in a random order instead.
+    """
+
+    shuffle_listeners: bool = False
+    """If True, listeners are informed in a random order for every event"""
 
     def __init__(self):
         super().__init__()
         self.__sinks: dict[str | None, list[EventSink]] = defaultdict(list)
+        # listeners of every registered type (including listeners of all types)
+        self.__dispatch: dict[str, tuple[EventSink, ...]] = dict()
+        # listeners of all types (used for types with no listeners of their own)
+        self.__wildcard: tuple[EventSink, ...] = tuple()
 
     def announce(self, event: Event):
         """Raises an event and informs all event sinks that are registered for notifications
         on this event type"""
-
-        sinks = self.__sinks.get(event.type, []) + self.__sinks.get(None, [])
-        random.shuffle(sinks)
+        sinks = self.__dispatch.get(event.type, self.__wildcard)
+        if not sinks:
+            return
+        if self.shuffle_listeners:
+            sinks = list(sinks)
+            random.shuffle(sinks)
         for sink in sinks:
             sink.on_event(event=event, sender=self)
 
@@ -60,6 +78,11 @@ class EventSource:
                       that receives an event: `Event` and a sender: `EventSource`)
         """
         self.__sinks[event_type].append(listener)
+        self.__wildcard = tuple(self.__sinks.get(None, []))
+        types = self.__sinks.keys() if event_type is None else (event_type,)
+        for t in types:
+            if t is not None:
+                self.__dispatch[t] = tuple(self.__sinks[t]) + self.__wildcard
 
 
 class EventSink:
@@ -79,6 +102,35 @@ def myvars(x):
     }
 
 
+EVENT_LOG_FORMATS = ("jsonl", "msgpack")
+"""Supported formats of event logs (msgpack needs the msgpack package)"""
+
+
+def _simplify(x):
+    if x is None:
+        return None
+    if isinstance(x, (str, int, float)):
+        return x
+    if isinstance(x, Issue):
+        return dict(name=x.name, values=x.values)
+    if isinstance(x, dict):
+        return {k: _simplify(v) for k, v in x.items()}
+    for y in ("id", "name"):
+        if hasattr(x, y):
+            return getattr(x, y)
+    if isinstance(x, Iterable):
+        return list(_simplify(_) for _ in x)
+    return str(x)
+
+
+def _log_format(file_name: Path, format: str | None) -> str:
+    if format is None:
+        format = "msgpack" if file_name.suffix in (".msgpack", ".mpk") else "jsonl"
+    if format not in EVENT_LOG_FORMATS:
+        raise ValueError(f"Unknown event log format {format}: {EVENT_LOG_FORMATS}")
+    return format
+
+
 class EventLogger(EventSink):
     """
     Logs events to a file
@@ -86,41 +138,105 @@ class EventLogger(EventSink):
     Args:
         file_name: Name of the file to save events into
         types: The types of events to save. If None, all events will be saved
+        buffer_size: Number of events kept in memory before writing them to the file in one batch
+        flush_every: If given, a background thread writes buffered events every this number of seconds
+        format: "jsonl" for one JSON object per line or "msgpack" for a stream of msgpack objects (needs the
+                msgpack package). If None, msgpack is used for files with a .msgpack or .mpk suffix.
+
+    Remarks:
+        - The file is kept open while logging. Call `flush` to write buffered events or `close` to write them
+          and close the file (logging again reopens it in append mode).
+        - Every event is saved as a dict with the keys sender, time, type and data. Use `read_events` to read
+          them back.
     """
 
-    def __init__(self, file_name: str | Path, types: list[str] | None = None):
+    def __init__(
+        self,
+        file_name: str | Path,
+        types: list[str] | None = None,
+        buffer_size: int = 1000,
+        flush_every: float | None = None,
+        format: str | None = None,
+    ):
         file_name = Path(file_name)
         file_name.parent.mkdir(parents=True, exist_ok=True)
         self._file_name = file_name
         self._types = set(types) if types else None
         self._start = time.perf_counter()
+        self._format = _log_format(file_name, format)
+        self._buffer_size = max(1, buffer_size)
+        self._flush_every = flush_every
+        self._init_writer()
+
+    def _init_writer(self):
+        self._buffer: list[bytes] = []
+        self._file = None
+        self._lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._stopped = threading.Event()
+        if self._format == "msgpack":
+            import msgpack
+
+            self._encode = msgpack.Packer(use_bin_type=True).pack
+        else:
+            self._encode = lambda d: (json.dumps(d) + "\n").encode("utf-8")
 
     def reset_timer(self):
         self._start = time.perf_counter()
 
+    def _flush_periodically(self):
+        while not self._stopped.wait(self._flush_every):
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered events to the file"""
+        with self._lock:
+            if not self._buffer:
+                return
+            if self._file is None:
+                self._file = open(self._file_name, "ab")
+            self._file.write(b"".join(self._buffer))
+            self._file.flush()
+            self._buffer = []
+
+    def close(self):
+        """Writes all buffered events and closes the file"""
+        self._stopped.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self._flusher = None
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._stopped = threading.Event()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __getstate__(self):
+        # buffered events are not saved and no events are written here (pickling happens in forked checkpoint
+        # writers too). Owners should call `flush` before saving (see `CheckpointMixin.checkpoint_flush`)
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in ("_buffer", "_file", "_lock", "_flusher", "_stopped", "_encode")
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_writer()
+
     def on_event(self, event: Event, sender: EventSource):
         if not self._file_name:
             return
         if self._types is not None and event.type not in self._types:
             return
-
-        def _simplify(x):
-            if x is None:
-                return None
-            if isinstance(x, (str, int, float)):
-                return x
-            if isinstance(x, Issue):
-                return dict(name=x.name, values=x.values)
-            if isinstance(x, dict):
-                return {k: _simplify(v) for k, v in x.items()}
-            for y in ("id", "name"):
-                if hasattr(x, y):
-                    return getattr(x, y)
-            if isinstance(x, Iterable):
-                return list(_simplify(_) for _ in x)
-            return str(x)
-            # return _simplify(myvars(x))
-
         try:
             sid = sender.id if hasattr(sender, "id") else serialize(sender)  # type: ignore
             d = dict(
@@ -129,12 +245,54 @@ class EventLogger(EventSink):
                 type=event.type,
                 data=_simplify(event.data),
             )
-            with open(self._file_name, "a") as f:
-                f.write(f"{json.dumps(d)},\n")
+            record = self._encode(d)
         except Exception as e:
             warnings.warn(
                 f"Failed to log {str(event)}: {str(e)}", warnings.NegmasLoggingWarning
             )
+            return
+        with self._lock:
+            self._buffer.append(record)
+            full = len(self._buffer) >= self._buffer_size
+            if self._flush_every is not None and self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, daemon=True
+                )
+                self._flusher.start()
+        if full:
+            self.flush()
+
+
+def read_events(
+    file_name: str | Path, types: Iterable[str] | None = None, format: str | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Reads the events saved by an `EventLogger` one by one.
+
+    Args:
+        file_name: The event log
+        types: If given, only events of these types are returned
+        format: The format of the log (see `EventLogger`)
+
+    Remarks:
+        - Logs written by older versions of negmas (a JSON object followed by a comma per line) can be read too.
+        - Events are streamed from the file so logs larger than the available memory can be processed.
+    """
+    file_name = Path(file_name)
+    format = _log_format(file_name, format)
+    types = set(types) if types is not None else None
+    with open(file_name, "rb") as f:
+        if format == "msgpack":
+            import msgpack
+
+            records = msgpack.Unpacker(f, raw=False)
+        else:
+            records = (
+                json.loads(line.rstrip().rstrip(b",")) for line in f if line.strip()
+            )
+        for d in records:
+            if types is None or d["type"] in types:
+                yield d
 
 
 @dataclass
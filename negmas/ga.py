@@ -1,9 +1,9 @@
 """Implements GA-based negotiation mechanisms"""
 
 from __future__ import annotations
-import copy
 import random
 
+import numpy as np
 from attrs import define, field
 
 from negmas.common import MechanismAction, NegotiatorMechanismInterface
@@ -12,6 +12,51 @@ from negmas.negotiators.simple import SorterNegotiator
 from .mechanisms import Mechanism, MechanismState, MechanismStepResult
 from .outcomes import Outcome
 
+DOMINANCE_CHUNK = 1024
+"""Number of points compared with all others at once when finding dominance relations"""
+
+MAX_ENCODED_VALUES = 100_000
+"""Maximum total number of issue values for which the population is encoded as a matrix of value indices"""
+
+
+def fast_non_dominated_sort(
+    costs: np.ndarray, max_fronts: int | None = None
+) -> list[np.ndarray]:
+    """
+    Sorts points into Pareto fronts (the fast non-dominated sort of NSGA-II).
+
+    Args:
+        costs: A matrix with one row per point and one column per objective (lower is better)
+        max_fronts: If given, only this number of fronts is returned
+
+    Returns:
+        A list of fronts each is an array of row indices. The first front contains all non-dominated points,
+        the second contains points only dominated by points in the first front, etc.
+    """
+    costs = np.asarray(costs)
+    n = len(costs)
+    if n == 0:
+        return []
+    # dominates[i, j] is True if point i dominates point j
+    dominates = np.empty((n, n), dtype=bool)
+    for start in range(0, n, DOMINANCE_CHUNK):
+        c = costs[start : start + DOMINANCE_CHUNK, None, :]
+        dominates[start : start + DOMINANCE_CHUNK] = (c <= costs[None]).all(-1) & (
+            c < costs[None]
+        ).any(-1)
+    n_dominating = dominates.sum(0)
+    remaining = np.ones(n, dtype=bool)
+    fronts: list[np.ndarray] = []
+    current = np.flatnonzero(n_dominating == 0)
+    while len(current):
+        fronts.append(current)
+        if max_fronts is not None and len(fronts) >= max_fronts:
+            break
+        remaining[current] = False
+        n_dominating = n_dominating - dominates[current].sum(0)
+        current = np.flatnonzero(remaining & (n_dominating == 0))
+    return fronts
+
 
 @define
 class GAState(MechanismState):
@@ -30,6 +75,15 @@ class GAMechanism(
         **kwargs: keyword arguments to be passed to the base Mechanism
         n_population: The number of outcomes for each generation
         mutate_rate: The rate of mutation
+
+    Remarks:
+        - If all issues are discrete and have at most `MAX_ENCODED_VALUES` values in total, the population is
+          kept in `genes` as an integer matrix with one row per outcome and one column per issue (the index of
+          the value of the issue). Crossover and mutation work on whole generations at once.
+        - Otherwise (e.g. continuous issues or huge integer ranges), `genes` is `None` and the population is
+          kept as a list of outcomes that is crossed over and mutated one outcome at a time.
+        - `ranks` is a matrix with one row per distinct outcome in the population (see `ranked_outcomes`) and
+          one column per negotiator giving the rank of the outcome for the negotiator (0 is the best).
     """
 
     def generate(self, n: int) -> list[Outcome]:
@@ -49,25 +103,97 @@ class GAMechanism(
 
         self.mutate_rate = mutate_rate
 
+        self._rng = np.random.default_rng(random.getrandbits(64))
+        self._values: list[list] | None = None
+        if (
+            all(_.is_discrete() for _ in self.issues)
+            and sum(_.cardinality for _ in self.issues) <= MAX_ENCODED_VALUES
+        ):
+            self._values = [list(_.all) for _ in self.issues]
+            self._indices = [{v: i for i, v in enumerate(_)} for _ in self._values]
+            self._cardinalities = np.asarray(
+                [len(_) for _ in self._values], dtype=np.int64
+            )
+
+        self.genes: np.ndarray | None = None
+        self._population: list[Outcome] = []
         self.population = self.generate(self.n_population)
 
         self.dominant_outcomes = self.population[:]
         self._current_state.dominant_outcomes = self.dominant_outcomes  # type: ignore
 
-        self.ranks = {}
+        self.ranked_outcomes: list[Outcome] = []
+        self.ranks = np.empty((0, 0), dtype=np.int64)
+
+    @property
+    def encoded(self) -> bool:
+        """Whether the population is kept as a matrix of value indices (see `genes`)"""
+        return self._values is not None
+
+    def encode(self, outcomes: list[Outcome]) -> np.ndarray:
+        """Encodes outcomes as a matrix of value indices (one row per outcome)"""
+        if self._values is None:
+            raise ValueError(
+                "Cannot encode outcomes of continuous or very large outcome spaces"
+            )
+        genes = np.empty((len(outcomes), len(self._indices)), dtype=np.int64)
+        for r, outcome in enumerate(outcomes):
+            for c, v in enumerate(outcome):
+                genes[r, c] = self._indices[c][v]
+        return genes
+
+    def decode(self, genes: np.ndarray) -> list[Outcome]:
+        """Decodes a matrix of value indices to outcomes"""
+        values = self._values
+        if values is None:
+            raise ValueError(
+                "Cannot decode outcomes of continuous or very large outcome spaces"
+            )
+        return [
+            tuple(values[c][i] for c, i in enumerate(row)) for row in genes.tolist()
+        ]
+
+    @property
+    def population(self) -> list[Outcome]:
+        """The outcomes in the current generation"""
+        if self.genes is None:
+            return self._population
+        return self.decode(self.genes)
+
+    @population.setter
+    def population(self, outcomes: list[Outcome]) -> None:
+        if self.encoded:
+            self.genes = self.encode(outcomes)
+        else:
+            self._population = list(outcomes)
+
+    def _crossover_genes(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Uniform crossover of rows of two gene matrices"""
+        mask = self._rng.random(first.shape) < 0.5
+        return np.where(mask, second, first)
+
+    def _mutate_genes(self, genes: np.ndarray) -> np.ndarray:
+        """Uniform crossover of the rows of a gene matrix with random outcomes"""
+        randoms = self._rng.integers(0, self._cardinalities, size=genes.shape)
+        return self._crossover_genes(genes, randoms)
 
     def crossover(self, outcome1: Outcome, outcome2: Outcome) -> Outcome:
         """Uniform crossover"""
-        outcome = list(copy.deepcopy(outcome1))
-        for i in range(len(self.issues)):
-            if bool(random.getrandbits(1)):
-                outcome[i] = outcome2[i]
-
-        return tuple(outcome)
+        if not self.encoded:
+            outcome = list(outcome1)
+            for i in range(len(self.issues)):
+                if bool(random.getrandbits(1)):
+                    outcome[i] = outcome2[i]
+            return tuple(outcome)
+        return self.decode(
+            self._crossover_genes(self.encode([outcome1]), self.encode([outcome2]))
+        )[0]
 
     def mutate(self, outcome: Outcome) -> Outcome:
         """Uniform crossover with random outcome"""
-        return self.crossover(outcome, self.generate(1)[0])
+        if not self.encoded:
+            return self.crossover(outcome, self.generate(1)[0])
+        return self.decode(self._mutate_genes(self.encode([outcome])))[0]
 
     def select(self, outcomes: list[Outcome]) -> list[Outcome]:
         """Select Pareto optimal outcomes"""
@@ -75,52 +201,59 @@ class GAMechanism(
 
     def next_generation(self, parents: list[Outcome]) -> list[Outcome]:
         """Generate the next generation from parents"""
-        self.population = parents[:]
-        for _ in range(self.n_population - len(self.dominant_outcomes)):
-            if random.random() > self.mutate_rate and len(self.dominant_outcomes) >= 2:
-                self.population.append(
-                    self.crossover(*random.sample(self.dominant_outcomes, 2))
-                )
-            else:
-                self.population.append(
-                    self.mutate(random.choice(self.dominant_outcomes))
-                )
+        if not self.encoded:
+            self.population = parents[:]
+            for _ in range(self.n_population - len(parents)):
+                if not parents:
+                    break
+                if random.random() > self.mutate_rate and len(parents) >= 2:
+                    self._population.append(self.crossover(*random.sample(parents, 2)))
+                else:
+                    self._population.append(self.mutate(random.choice(parents)))
+            return self.population
+        parent_genes = self.encode(parents)
+        n_parents, n = len(parent_genes), self.n_population - len(parents)
+        if n <= 0 or n_parents == 0:
+            self.genes = parent_genes
+            return self.population
+        rng = self._rng
+        first = rng.integers(0, n_parents, n)
+        crossed = rng.random(n) > self.mutate_rate
+        if n_parents >= 2:
+            # a second parent different from the first
+            second = (first + rng.integers(1, n_parents, n)) % n_parents
+            children = self._crossover_genes(parent_genes[first], parent_genes[second])
+        else:
+            crossed[:] = False
+            children = parent_genes[first]
+        mutated = ~crossed
+        children[mutated] = self._mutate_genes(children[mutated])
+        self.genes = np.concatenate((parent_genes, children))
         return self.population
 
     def update_ranks(self):
-        self.ranks.clear()
-        outcomes = {}
-        for outcome in self.population:
-            outcomes[str(outcome)] = outcome  # merge duplicates
-            self.ranks[str(outcome)] = {}
-
-        # get ranking from agents
-        for neg in self.negotiators:
-            sorted_outcomes = list(outcomes.values())
+        """Asks every negotiator to rank the distinct outcomes of the population"""
+        if self.genes is None:
+            outcomes = list(dict.fromkeys(self._population))  # merge duplicates
+        else:
+            outcomes = self.decode(np.unique(self.genes, axis=0))
+        self.ranked_outcomes = outcomes
+        index = {outcome: i for i, outcome in enumerate(outcomes)}
+        self.ranks = np.empty((len(outcomes), len(self.negotiators)), dtype=np.int64)
+        positions = np.arange(len(outcomes))
+        for j, neg in enumerate(self.negotiators):
+            sorted_outcomes = list(outcomes)
             neg.sort(sorted_outcomes, descending=True)
-            for i, outcome in enumerate(sorted_outcomes):
-                self.ranks[str(outcome)][neg] = i
+            order = np.fromiter(
+                (index[_] for _ in sorted_outcomes), dtype=np.int64, count=len(outcomes)
+            )
+            self.ranks[order, j] = positions
 
     def update_dominant_outcomes(self):
         """Return dominant outcomes of population"""
-        self.dominant_outcomes.clear()
-        outcomes = {}
-        for outcome in self.population:
-            outcomes[str(outcome)] = outcome  # merge duplicates
-
-        # get dominant outcomes
-        # naive approach (should be improved)
-        for target in outcomes.keys():
-            for outcome in outcomes.keys():
-                if target == outcome:
-                    continue
-                for neg in self.negotiators:
-                    if self.ranks[target][neg] < self.ranks[outcome][neg]:
-                        break
-                else:
-                    break
-            else:
-                self.dominant_outcomes.append(outcomes[target])
+        fronts = fast_non_dominated_sort(self.ranks, max_fronts=1)
+        dominant = fronts[0] if fronts else np.empty(0, dtype=np.int64)
+        self.dominant_outcomes = [self.ranked_outcomes[_] for _ in dominant.tolist()]
         self._current_state.dominant_outcomes = self.dominant_outcomes  # type: ignore
 
     def __call__(  # type: ignore
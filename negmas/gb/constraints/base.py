@@ -5,14 +5,17 @@ from __future__ import annotations
 
 
 from abc import ABC, abstractmethod
+from typing import Sequence
 
-from attrs import define
+from attrs import define, field
 
 from negmas.gb.common import GBState, ThreadState
+from negmas.outcomes.common import Outcome
 
 __all__ = [
     "OfferingConstraint",
     "LocalOfferingConstraint",
+    "IncrementalOfferingConstraint",
     "AnyOfferingConstraint",
     "AllOfferingConstraints",
 ]
@@ -54,6 +57,67 @@ class LocalOfferingConstraint(OfferingConstraint, ABC):
         return self(state.threads[source], [_.threads[source] for _ in history])
 
 
+@define
+class IncrementalOfferingConstraint(LocalOfferingConstraint, ABC):
+    """
+    A local offering constraint that keeps a summary of past offers instead of scanning the history on every check.
+
+    Remarks:
+        - Subclasses implement `reset`, `update` (called once for every past offer in order) and `check`.
+        - The summary is synchronized with the history passed to `__call__` or `eval_globally`: Only offers added
+          to the history since the last call are passed to `update`. If the history got shorter (e.g. a new
+          negotiation), the summary is rebuilt.
+    """
+
+    _n_seen: int = field(default=0, init=False)
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forgets all past offers"""
+
+    @abstractmethod
+    def update(self, offer: Outcome | None) -> None:
+        """Adds an offer to the past offers"""
+
+    @abstractmethod
+    def check(self, offer: Outcome | None) -> bool:
+        """Checks whether the offer is valid given all past offers"""
+
+    def _sync(self, offers: Sequence[Outcome | None]) -> None:
+        if len(offers) < self._n_seen:
+            self.reset()
+            self._n_seen = 0
+        for offer in offers[self._n_seen :]:
+            self.update(offer)
+        self._n_seen = len(offers)
+
+    def __call__(self, state: ThreadState, history: list[ThreadState]) -> bool:
+        self._sync(_ThreadOffers(history))
+        return self.check(state.new_offer)
+
+    def eval_globally(self, source: str, state: GBState, history: list[GBState]):
+        self._sync(_ThreadOffers(history, source))
+        return self.check(state.threads[source].new_offer)
+
+
+class _ThreadOffers(Sequence):
+    """A lazy view of the offers of one thread in a history of (thread or mechanism) states"""
+
+    __slots__ = ("_history", "_source")
+
+    def __init__(self, history: Sequence, source: str | None = None):
+        self._history, self._source = history, source
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[_] for _ in range(*i.indices(len(self)))]
+        s = self._history[i]
+        return (s if self._source is None else s.threads[self._source]).new_offer
+
+
 @define
 class AnyOfferingConstraint(OfferingConstraint):
     constraints: list[OfferingConstraint]
@@ -1,30 +1,37 @@
 from __future__ import annotations
 import sys
 
-from attrs import define
+from attrs import define, field
 
-from ..common import ThreadState
-from .base import LocalOfferingConstraint
+from ...outcomes.common import Outcome
+from .base import IncrementalOfferingConstraint
 
 __all__ = ["RepeatFinalOfferOnly"]
 
 
 @define
-class RepeatFinalOfferOnly(LocalOfferingConstraint):
+class RepeatFinalOfferOnly(IncrementalOfferingConstraint):
     n: int = sys.maxsize
+    _past: set[Outcome | None] = field(factory=set, init=False)
+    _last: Outcome | None = field(default=None, init=False)
+    # outcomes offered up to the first repetition of an offer (None if no offer was repeated yet)
+    _before_repeat: set[Outcome | None] | None = field(default=None, init=False)
 
-    def __call__(self, state: ThreadState, history: list[ThreadState]) -> bool:
-        offer = state.new_offer
+    def reset(self) -> None:
+        self._past, self._last, self._before_repeat = set(), None, None
+
+    def update(self, offer: Outcome | None) -> None:
+        if self._before_repeat is None and self._past and offer == self._last:
+            self._before_repeat = set(self._past)
+        self._past.add(offer)
+        self._last = offer
+
+    def check(self, offer: Outcome | None) -> bool:
         if not offer:
             return False
-        outcomes = [_.new_offer for _ in history]
-        if outcomes:
-            for a, b in zip(outcomes[:-1], outcomes[1:]):
-                if a == offer:
-                    break
-                if a == b:
-                    return False
-        past = set(outcomes)
-        if history and len(past) >= self.n:
-            past = past.difference({history[-1].new_offer})
-        return offer not in past
+        # once an offer is repeated, only outcomes offered before the repetition can be offered
+        if self._before_repeat is not None and offer not in self._before_repeat:
+            return False
+        if offer not in self._past:
+            return True
+        return self._n_seen > 0 and len(self._past) >= self.n and offer == self._last
@@ -1,23 +1,31 @@
 from __future__ import annotations
 import sys
 
-from attrs import define
+from attrs import define, field
 
-from ..common import ThreadState
-from .base import LocalOfferingConstraint
+from ...outcomes.common import Outcome
+from .base import IncrementalOfferingConstraint
 
 __all__ = ["RepeatLastOfferOnly"]
 
 
 @define
-class RepeatLastOfferOnly(LocalOfferingConstraint):
+class RepeatLastOfferOnly(IncrementalOfferingConstraint):
     n: int = sys.maxsize
+    _past: set[Outcome | None] = field(factory=set, init=False)
+    _last: Outcome | None = field(default=None, init=False)
 
-    def eval(self, state: ThreadState, history: list[ThreadState]) -> bool:
-        offer = state.new_offer
+    def reset(self) -> None:
+        self._past, self._last = set(), None
+
+    def update(self, offer: Outcome | None) -> None:
+        self._past.add(offer)
+        self._last = offer
+
+    def check(self, offer: Outcome | None) -> bool:
         if not offer:
             return False
-        past = {_.new_offer for _ in history}
-        if history and len(past) >= self.n:
-            past = past.difference({history[-1].new_offer})
-        return offer not in past
+        if offer not in self._past:
+            return True
+        # the last offer can be repeated once n different outcomes were offered
+        return self._n_seen > 0 and len(self._past) >= self.n and offer == self._last
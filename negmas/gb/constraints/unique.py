@@ -1,13 +1,24 @@
 from __future__ import annotations
-from ..common import ThreadState
-from .base import LocalOfferingConstraint
+
+from attrs import define, field
+
+from ...outcomes.common import Outcome
+from .base import IncrementalOfferingConstraint
 
 __all__ = ["UniqueOffers"]
 
 
-class UniqueOffers(LocalOfferingConstraint):
-    def __call__(self, state: ThreadState, history: list[ThreadState]) -> bool:
-        offer = state.new_offer
+@define
+class UniqueOffers(IncrementalOfferingConstraint):
+    _past: set[Outcome | None] = field(factory=set, init=False)
+
+    def reset(self) -> None:
+        self._past = set()
+
+    def update(self, offer: Outcome | None) -> None:
+        self._past.add(offer)
+
+    def check(self, offer: Outcome | None) -> bool:
         if not offer:
             return False
-        return offer not in {_.new_offer for _ in history}
+        return offer not in self._past
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from collections import defaultdict
+from collections import defaultdict, deque
 from sys import maxsize
 from typing import Literal
 
@@ -16,18 +16,73 @@ INFINITE = maxsize
 __all__ = ["TAUEvaluationStrategy", "INFINITE"]
 
 
+# the (outcome, negotiator) pairs offered and accepted in a single step
+_Registration = tuple[list[tuple[Outcome, str]], list[tuple[Outcome, str]]]
+
+
+def _add(table: dict[Outcome | None, dict[str, int]], outcome: Outcome, nid: str):
+    counts = table.get(outcome, None)
+    if counts is None:
+        table[outcome] = {nid: 1}
+        return
+    counts[nid] = counts.get(nid, 0) + 1
+
+
+def _remove(table: dict[Outcome | None, dict[str, int]], outcome: Outcome, nid: str):
+    counts = table[outcome]
+    n = counts[nid] - 1
+    if n > 0:
+        counts[nid] = n
+        return
+    del counts[nid]
+    if not counts:
+        del table[outcome]
+
+
 @define
 class TAUEvaluationStrategy(EvaluationStrategy):
     """
     Implements the Tentative-Accept Unique-Offers Generalized Bargaining Protocol.
+
+    Remarks:
+        - For every outcome, the number of times each negotiator offered and accepted it (during the last
+          `cardinality` steps) is kept up to date. Only outcomes offered or accepted in the current step are
+          checked for agreement.
     """
 
     n_outcomes: int = INFINITE
     cardinality: int = INFINITE
-    _accepted: dict[Outcome | None, set[str]] = field(factory=lambda: defaultdict(set))
-    _offered: dict[Outcome | None, set[str]] = field(factory=lambda: defaultdict(set))
+    _accepted: dict[Outcome | None, dict[str, int]] = field(factory=dict)
+    _offered: dict[Outcome | None, dict[str, int]] = field(factory=dict)
     _repeating: dict[str, bool] = field(factory=lambda: defaultdict(bool))
     _last: dict[str, Outcome | None] = field(factory=lambda: defaultdict(Outcome))
+    _window: deque[_Registration] = field(factory=deque)
+    _n_registered: int = 0
+
+    def _register(self, s: GBState) -> _Registration | None:
+        """Counts the offers and acceptances of a state. Returns None if the negotiation is ended"""
+        offers, acceptances = [], []
+        for source, t in s.threads.items():
+            offer = t.new_offer
+            if offer is None:
+                return None
+            _add(self._offered, offer, source)
+            offers.append((offer, source))
+            for responder, response in t.new_responses.items():
+                if response == ResponseType.END_NEGOTIATION:
+                    return None
+                if response == ResponseType.ACCEPT_OFFER:
+                    _add(self._accepted, offer, responder)
+                    acceptances.append((offer, responder))
+        self._n_registered += 1
+        return offers, acceptances
+
+    def _unregister(self, registration: _Registration) -> None:
+        offers, acceptances = registration
+        for outcome, nid in offers:
+            _remove(self._offered, outcome, nid)
+        for outcome, nid in acceptances:
+            _remove(self._accepted, outcome, nid)
 
     def __call__(
         self, negotiator_ids: list[str], state: GBState, history: list[GBState]
@@ -46,44 +101,36 @@ class TAUEvaluationStrategy(EvaluationStrategy):
         if state.step > self.n_outcomes:
             return None
 
-        # now we can start checking for agreement
-        accepted, offered = self._accepted, self._offered
-
-        def register(negotiator, offer, responses):
-            """Register the offer and response in offered/accepted dicts"""
-            if offer is None:
-                return False
-            offered[offer].add(negotiator)
-            for responder, response in responses.items():
-                if response == ResponseType.END_NEGOTIATION:
-                    return False
-                if response == ResponseType.ACCEPT_OFFER:
-                    accepted[offer].add(responder)
-            return True
-
-        def registerall(s: GBState):
-            """Updates offered/accepted dicts given a state"""
-            for source, t in s.threads.items():
-                offer, responses = t.new_offer, t.new_responses
-                if not register(source, offer, responses):
-                    return False
-            return True
-
-        # re-calcuate accepted, offered if we need to use only a part of the history
+        # only the last `cardinality` states (including this one) are used if the history is bounded
         nh, c = len(history), self.cardinality
-        if 0 < c <= nh:
-            accepted, offered = defaultdict(set), defaultdict(set)
-            for s in history[nh - c + 1 :]:
-                if not registerall(s):
+        windowed = 0 < c < INFINITE
+        if windowed and self._n_registered != nh:
+            # we were not called for every state in the history. Recount the window
+            self._accepted, self._offered = dict(), dict()
+            self._window.clear()
+            self._n_registered = max(0, nh - c + 1)
+            for s in history[nh - c + 1 if c <= nh else 0 :]:
+                registration = self._register(s)
+                if registration is None:
                     return None
+                self._window.append(registration)
 
-        if not registerall(state):
+        registration = self._register(state)
+        if registration is None:
             return None
+        if windowed:
+            self._window.append(registration)
+            while len(self._window) > c:
+                self._unregister(self._window.popleft())
 
-        outcomes = set(accepted.keys()).union(set(offered.keys()))
+        # an agreement can only be reached on an outcome offered or accepted now
         n_negotiators = len(negotiator_ids)
-
-        for outcome in outcomes:
-            if len(accepted[outcome]) == len(offered[outcome]) == n_negotiators:
-                return outcome
+        accepted, offered = self._accepted, self._offered
+        for outcomes in registration:
+            for outcome, _ in outcomes:
+                if (
+                    len(accepted.get(outcome, ())) == n_negotiators
+                    and len(offered.get(outcome, ())) == n_negotiators
+                ):
+                    return outcome
         return "continue"
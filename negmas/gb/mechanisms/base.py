@@ -1,9 +1,11 @@
 from __future__ import annotations
+from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from random import shuffle
 from time import perf_counter
 from typing import TYPE_CHECKING, Any, Callable
 
-from attrs import define
+from attrs import define, field
 
 from negmas.common import TraceElement
 from negmas.helpers import humanize_time
@@ -35,6 +37,8 @@ class GBThread:
     state: ThreadState
     evaluator: LocalEvaluationStrategy | None = None
     constraint: LocalOfferingConstraint | None = None
+    # time used by negotiators during the last run (merged into the mechanism by `run_threads`)
+    _times: dict[str, float] = field(factory=lambda: defaultdict(float))
 
     @property
     def accepted_offers(self) -> list[Outcome]:
@@ -49,17 +53,15 @@ class GBThread:
         if action is None:
             strt = perf_counter()
             offer = self.negotiator.propose(mechanism_state)
-            self.mechanism._negotiator_times[self.negotiator.id] += (
-                perf_counter() - strt
-            )
+            self._times[self.negotiator.id] += perf_counter() - strt
         else:
             offer = action.get(source, None)
             if not offer:
                 offer = None
         # assert offer is None or isinstance(offer, Outcome)
         self.state.new_offer = offer
-        if self.constraint and not self.constraint(
-            mechanism_state.threads[source], [_.threads[source] for _ in history]
+        if self.constraint and not self.constraint.eval_globally(
+            source, mechanism_state, history
         ):
             self.state.new_offer = offer = None
 
@@ -68,7 +70,7 @@ class GBThread:
                 for n in self.responders:
                     strt = perf_counter()
                     n.on_partner_ended(source)
-                    self.mechanism._negotiator_times[n.id] += perf_counter() - strt
+                    self._times[n.id] += perf_counter() - strt
             self.state.new_responses = dict()
             return (
                 self.state,
@@ -85,17 +87,17 @@ class GBThread:
             for n in self.responders:
                 strt = perf_counter()
                 n.on_partner_proposal(mechanism_state, source, offer)
-                self.mechanism._negotiator_times[n.id] += perf_counter() - strt
+                self._times[n.id] += perf_counter() - strt
         responses = []
         for responder in self.responders:
             strt = perf_counter()
             responses.append(responder.respond(mechanism_state, source=source))
-            self.mechanism._negotiator_times[responder.id] += perf_counter() - strt
+            self._times[responder.id] += perf_counter() - strt
         if self.mechanism._extra_callbacks:
             for n, r in zip(self.responders, responses):
                 strt = perf_counter()
                 n.on_partner_response(mechanism_state, n.id, offer, r)
-                self.mechanism._negotiator_times[n.id] += perf_counter() - strt
+                self._times[n.id] += perf_counter() - strt
         if all(_ == ResponseType.ACCEPT_OFFER for _ in responses):
             self.state.accepted_offers.append(offer)
         self.state.new_responses = dict(
@@ -129,6 +131,8 @@ class BaseGBMechanism(Mechanism[GBNMI, GBState, GBAction, GBNegotiator]):
         parallel: bool = True,
         sync_calls: bool = False,
         initial_state: GBState | None = None,
+        max_workers: int | None = 0,
+        executor: Executor | None = None,
         **kwargs,
     ):
         super().__init__(
@@ -140,6 +144,10 @@ class BaseGBMechanism(Mechanism[GBNMI, GBState, GBAction, GBNegotiator]):
         )
         self._current_state: GBState
         self._parallel = parallel
+        self._max_workers = max_workers
+        self._executor = executor
+        # created on the first concurrent step and kept until the negotiation ends
+        self._pool: ThreadPoolExecutor | None = None
         self._threads: list[GBThread] = []
         self._ignore_negotiator_exceptions = ignore_negotiator_exceptions
         self._dynamic_entry = dynamic_entry
@@ -174,32 +182,69 @@ class BaseGBMechanism(Mechanism[GBNMI, GBState, GBAction, GBNegotiator]):
     def run_threads(
         self, action: dict[str, GBAction] | None = None
     ) -> dict[str, tuple[ThreadState, GBResponse | None]]:
-        def _do_run(idd, thread: GBThread):
+        """
+        Runs all threads for one step.
+
+        Remarks:
+            - Serial mechanisms run threads in the order negotiators joined.
+            - Parallel mechanisms run threads in a random order. If `max_workers` is not zero (or an `executor` is
+              given), threads run concurrently and negotiators in different threads may see the offers of other
+              threads in this step or not (as if they really ran at the same time).
+            - Results and the time used by negotiators are always merged in the (randomized) thread order.
+        """
+
+        def _do_run(thread: GBThread):
             if self.verbosity > 2:
                 print(
                     f"{self.name}: Thread {thread.negotiator.name} starts after {humanize_time(perf_counter() - self._start_time, show_ms=True) if self._start_time else 0}",
                     flush=True,
                 )
-            r = thread.run(action)
-            state: GBState = self.state  #
-            state.last_thread = idd
-            return r
-
-        if not self._parallel:
-            threads = self._threads
-            return {
-                thread.negotiator.id: _do_run(thread.negotiator.id, thread)
-                for thread in threads
-            }
-        # todo: make this really parallel
-        indices = [_ for _ in range(len(self._threads))]
-        shuffle(indices)
-        threads = [self._threads[_] for _ in indices]
+            return thread.run(action)
+
+        threads = self._threads
+        if self._parallel:
+            indices = [_ for _ in range(len(self._threads))]
+            shuffle(indices)
+            threads = [self._threads[_] for _ in indices]
+        concurrent = self._parallel and (
+            self._executor is not None or self._max_workers != 0
+        )
+        if not concurrent or len(threads) < 2:
+            runs = [_do_run(t) for t in threads]
+        else:
+            pool = self._executor
+            if pool is None:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self._max_workers or len(threads),
+                        thread_name_prefix=f"{self.name}-thread",
+                    )
+                pool = self._pool
+            futures = [pool.submit(_do_run, t) for t in threads]
+            runs = [_.result() for _ in futures]
         results = dict()
-        for t in threads:
-            results[t.negotiator.id] = _do_run(t.negotiator.id, t)
+        state: GBState = self.state  #
+        for t, r in zip(threads, runs):
+            results[t.negotiator.id] = r
+            for nid, used in t._times.items():
+                self._negotiator_times[nid] += used
+            t._times.clear()
+            state.last_thread = t.negotiator.id
         return results
 
+    def on_negotiation_end(self) -> None:
+        super().on_negotiation_end()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # thread pools cannot be pickled (e.g. in checkpoints). A new pool is created when needed
+        state["_pool"] = None
+        state["_executor"] = None
+        return state
+
     @property
     def full_trace(self) -> list[TraceElement]:
         def response(state: GBState):
@@ -716,6 +761,18 @@ class GBMechanism(BaseGBMechanism):
 
 
 class ParallelGBMechanism(GBMechanism):
+    """
+    A GB mechanism running its threads in a random order in every step.
+
+    Remarks:
+        - By default, threads run one after the other in the caller. Pass `max_workers` (`None` for one worker per
+          thread) to run them concurrently on a thread pool kept until the negotiation ends. Only do that with
+          negotiators that are thread-safe (negotiators in different threads may run at the same time).
+        - Pass an `executor` (e.g. a `ThreadPoolExecutor` reused across mechanisms) to run threads on it.
+          The executor must share memory with the mechanism (i.e. be thread based) because negotiators and
+          thread states are updated in place. It is not saved with the mechanism (e.g. in checkpoints).
+    """
+
     def __init__(self, *args, **kwargs):
         kwargs["parallel"] = True
         super().__init__(*args, **kwargs)
@@ -12,6 +12,7 @@ from .types import *
 from .strings import *
 from .logging import *
 from .timeout import *
+from .limits import *
 from .misc import *
 from .numba_checks import *
 
@@ -20,6 +21,7 @@ __all__ = (
     + strings.__all__
     + logging.__all__
     + timeout.__all__
+    + limits.__all__
     + misc.__all__
     + numba_checks.__all__
     # + ["prob", "inout", "numeric"]
@@ -0,0 +1,427 @@
+"""
+Low level support for writing and reading checkpoints (compression, differential checkpoints, zero-copy checkpoints
+and background writing).
+"""
+
+from __future__ import annotations
+
+import atexit
+import bz2
+import gzip
+import hashlib
+import lzma
+import mmap
+import os
+import pickle
+import struct
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from os import PathLike
+from pathlib import Path
+from typing import Any, Callable
+
+import dill
+import numpy as np
+
+from negmas.warnings import NegmasIOWarning, warn
+
+__all__ = [
+    "CHECKPOINT_COMPRESSIONS",
+    "CHECKPOINT_BACKGROUND_MODES",
+    "compress_bytes",
+    "decompress_bytes",
+    "make_delta",
+    "apply_delta",
+    "write_checkpoint",
+    "read_checkpoint",
+    "wait_for_checkpoints",
+]
+
+CHECKPOINT_COMPRESSIONS = ("gzip", "bz2", "lzma", "zstd", "lz4")
+"""Supported compression methods (zstd and lz4 need the zstandard and lz4 packages)"""
+CHECKPOINT_BACKGROUND_MODES = ("thread", "fork")
+"""Supported ways to write checkpoints without blocking the caller"""
+
+DELTA_MAGIC = b"NMDELTA1"
+ZERO_COPY_MAGIC = b"NMZCOPY1"
+BUFFER_ALIGNMENT = 64
+"""Alignment (in bytes) of the out-of-band buffers stored in zero-copy checkpoints"""
+MIN_CHUNK, MAX_CHUNK, CHUNK_MASK, WINDOW = 1 << 10, 1 << 16, (1 << 12) - 1, 48
+MAX_CACHED_BASES = 4
+
+_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "lzma"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"\x04\x22\x4d\x18", "lz4"),
+)
+_GEAR = np.random.default_rng(1234).integers(0, 1 << 32, 256, dtype=np.uint64)
+
+# raw (uncompressed) contents of recently used base checkpoints
+_bases: OrderedDict[str, bytes] = OrderedDict()
+# background writers (threads or PIDs of forked processes) not joined yet with the path they write
+# and the exceptions raised by threads
+_pending: list[tuple[threading.Thread | int, Path, list[BaseException]]] = []
+_lock = threading.Lock()
+
+
+def compress_bytes(data: bytes, method: str | None) -> bytes:
+    """Compresses the data using the given method (one of `CHECKPOINT_COMPRESSIONS` or None for no compression)"""
+    if method is None:
+        return data
+    if method == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if method == "bz2":
+        return bz2.compress(data)
+    if method == "lzma":
+        return lzma.compress(data)
+    if method == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+    if method == "lz4":
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    raise ValueError(
+        f"Unknown compression {method}. Supported: {CHECKPOINT_COMPRESSIONS}"
+    )
+
+
+def decompress_bytes(data: bytes) -> bytes:
+    """Decompresses data compressed by `compress_bytes` (the method is detected from the data)"""
+    for magic, method in _MAGIC:
+        if not data.startswith(magic):
+            continue
+        if method == "gzip":
+            return gzip.decompress(data)
+        if method == "bz2":
+            return bz2.decompress(data)
+        if method == "lzma":
+            return lzma.decompress(data)
+        if method == "zstd":
+            import zstandard
+
+            return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    return data
+
+
+def _chunks(data: bytes) -> list[int]:
+    """Content defined chunking: returns the end of every chunk of the data"""
+    n = len(data)
+    if n <= MIN_CHUNK:
+        return [n]
+    gear = _GEAR[np.frombuffer(data, dtype=np.uint8)]
+    csum = np.cumsum(gear, dtype=np.uint64)
+    # rolling sum of the gear values of the last WINDOW bytes
+    h = csum[WINDOW:] - csum[:-WINDOW]
+    candidates = np.flatnonzero((h & CHUNK_MASK) == 0) + WINDOW + 1
+    ends, last = [], 0
+    for c in candidates.tolist():
+        if c - last < MIN_CHUNK:
+            continue
+        while c - last > MAX_CHUNK:
+            last += MAX_CHUNK
+            ends.append(last)
+        ends.append(c)
+        last = c
+    while n - last > MAX_CHUNK:
+        last += MAX_CHUNK
+        ends.append(last)
+    if last < n:
+        ends.append(n)
+    return ends
+
+
+def make_delta(base: bytes, data: bytes) -> list[tuple[int, int] | bytes]:
+    """
+    Encodes `data` as a list of references to ranges of `base` (offset, length) and literal bytes.
+
+    Remarks:
+        - Both are split into content-defined chunks so that changes in one part of the data do not
+          affect the chunks found in other parts.
+    """
+    index: dict[bytes, tuple[int, int]] = dict()
+    start = 0
+    for end in _chunks(base):
+        index.setdefault(hashlib.blake2b(base[start:end]).digest(), (start, end))
+        start = end
+    ops: list[tuple[int, int] | bytearray] = []
+    start = 0
+    for end in _chunks(data):
+        chunk = data[start:end]
+        found = index.get(hashlib.blake2b(chunk).digest(), None)
+        if found is None or base[found[0] : found[1]] != chunk:
+            if ops and isinstance(ops[-1], bytearray):
+                ops[-1] += chunk
+            else:
+                ops.append(bytearray(chunk))
+        elif ops and isinstance(ops[-1], tuple) and sum(ops[-1]) == found[0]:
+            ops[-1] = (ops[-1][0], ops[-1][1] + end - start)
+        else:
+            ops.append((found[0], end - start))
+        start = end
+    return [bytes(_) if isinstance(_, bytearray) else _ for _ in ops]
+
+
+def apply_delta(base: bytes, ops: list[tuple[int, int] | bytes]) -> bytes:
+    """Reconstructs the data encoded by `make_delta`"""
+    return b"".join(
+        _ if isinstance(_, bytes) else base[_[0] : _[0] + _[1]] for _ in ops
+    )
+
+
+def _cache_base(path: Path, data: bytes) -> None:
+    with _lock:
+        _bases[str(path.absolute())] = data
+        _bases.move_to_end(str(path.absolute()))
+        while len(_bases) > MAX_CACHED_BASES:
+            _bases.popitem(last=False)
+
+
+def _read_raw(path: Path) -> bytes:
+    """Reads the serialized object in a checkpoint (applying deltas if needed)"""
+    with _lock:
+        cached = _bases.get(str(path.absolute()), None)
+    if cached is not None:
+        return cached
+    with open(path, "rb") as f:
+        data = decompress_bytes(f.read())
+    if not data.startswith(DELTA_MAGIC):
+        return data
+    base_name, ops = pickle.loads(data[len(DELTA_MAGIC) :])
+    base = path.parent / base_name
+    base_data = _read_raw(base)
+    _cache_base(base, base_data)
+    return apply_delta(base_data, ops)
+
+
+class _BufferPickler(dill.Pickler):
+    """A dill pickler that passes the memory of numpy arrays out-of-band (dill always pickles them in-band)"""
+
+    def reducer_override(self, obj):
+        if type(obj) is np.ndarray:
+            # non-contiguous and object arrays fall back to in-band pickling
+            return obj.__reduce_ex__(5)
+        return NotImplemented
+
+
+def _dumps(obj: Any, zero_copy: bool) -> tuple[bytes, list[memoryview | bytes]]:
+    """Pickles the object returning the pickle and its out-of-band buffers (only used if `zero_copy`)"""
+    if not zero_copy:
+        return dill.dumps(obj), []
+    buffers: list[pickle.PickleBuffer] = []
+    f = BytesIO()
+    _BufferPickler(f, protocol=5, buffer_callback=buffers.append).dump(obj)
+    return f.getvalue(), [_.raw() for _ in buffers]
+
+
+def _aligned(n: int) -> int:
+    return (n + BUFFER_ALIGNMENT - 1) // BUFFER_ALIGNMENT * BUFFER_ALIGNMENT
+
+
+def _write_zero_copy(f, data: bytes, buffers: list[memoryview | bytes]) -> None:
+    """
+    Writes a pickle and its out-of-band buffers.
+
+    Remarks:
+        - The layout is: magic, the length of the pickle and the number of buffers, the (offset, length) of every
+          buffer, the pickle and then the buffers each starting at a multiple of `BUFFER_ALIGNMENT`.
+    """
+    header = len(ZERO_COPY_MAGIC) + 16 * (len(buffers) + 1)
+    table, offset = [], header + len(data)
+    for b in buffers:
+        offset = _aligned(offset)
+        table += [offset, len(b)]
+        offset += len(b)
+    f.write(ZERO_COPY_MAGIC)
+    f.write(struct.pack(f"<{len(table) + 2}Q", len(data), len(buffers), *table))
+    f.write(data)
+    offset = header + len(data)
+    for b, start in zip(buffers, table[::2]):
+        f.write(bytes(start - offset))
+        f.write(b)
+        offset = start + len(b)
+
+
+def _read_zero_copy(path: Path) -> Any:
+    """Loads a zero-copy checkpoint memory mapping its buffers"""
+    with open(path, "rb") as f:
+        # a private (copy-on-write) mapping keeps loaded arrays writable without changing the file
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    start = len(ZERO_COPY_MAGIC)
+    n_data, n_buffers = struct.unpack_from("<2Q", mapped, start)
+    table = struct.unpack_from(f"<{2 * n_buffers}Q", mapped, start + 16)
+    start += 16 * (n_buffers + 1)
+    data = decompress_bytes(bytes(view[start : start + n_data]))
+    buffers = [view[o : o + n] for o, n in zip(table[::2], table[1::2])]
+    return dill.loads(data, buffers=buffers)
+
+
+def read_checkpoint(path: PathLike | str) -> Any:
+    """Loads an object from a checkpoint written by `write_checkpoint`"""
+    wait_for_checkpoints()
+    path = Path(path)
+    with open(path, "rb") as f:
+        zero_copy = f.read(len(ZERO_COPY_MAGIC)) == ZERO_COPY_MAGIC
+    if zero_copy:
+        return _read_zero_copy(path)
+    return dill.loads(_read_raw(path))
+
+
+def _write(
+    obj: Any,
+    pickled: tuple[bytes, list[memoryview | bytes]] | None,
+    path: Path,
+    compression: str | None,
+    base: Path | None,
+    on_written: Callable[[], None] | None,
+    zero_copy: bool = False,
+) -> None:
+    data, buffers = _dumps(obj, zero_copy) if pickled is None else pickled
+    if base is None:
+        contents = data
+    else:
+        contents = DELTA_MAGIC + pickle.dumps(
+            (base.name, make_delta(_read_raw(base), data)),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    tmp = path.parent / f".{path.name}.tmp"
+    with open(tmp, "wb") as f:
+        if zero_copy:
+            _write_zero_copy(f, compress_bytes(contents, compression), buffers)
+        else:
+            f.write(compress_bytes(contents, compression))
+    os.replace(tmp, path)
+    with _lock:
+        _bases.pop(str(path.absolute()), None)
+    if on_written is not None:
+        on_written()
+
+
+def write_checkpoint(
+    obj: Any,
+    path: PathLike | str,
+    compression: str | None = None,
+    base: PathLike | str | None = None,
+    background: str | None = None,
+    on_written: Callable[[], None] | None = None,
+    zero_copy: bool = False,
+) -> Path:
+    """
+    Writes an object to a checkpoint file.
+
+    Args:
+        obj: The object to save
+        path: The file to write to
+        compression: One of `CHECKPOINT_COMPRESSIONS` or None for no compression
+        base: If given, only the difference from the checkpoint saved in this file (which must be in the
+              same folder) is written
+        background: If given, the checkpoint is written without blocking the caller. "thread" serializes the
+                    object in the caller and writes it in a background thread while "fork" forks the process and
+                    lets the (copy-on-write) child serialize and write it.
+        on_written: Called (in the writer) after the checkpoint is written (e.g. to write its information)
+        zero_copy: If True, the memory of numpy arrays is stored out-of-band (pickle protocol 5) as aligned
+                   blobs that are memory-mapped (copy-on-write) instead of copied when the checkpoint is loaded
+
+    Returns:
+        The path of the checkpoint file
+
+    Remarks:
+        - At most one background checkpoint is written at a time. Starting a new one waits for the previous.
+        - Use `wait_for_checkpoints` to wait for all checkpoints being written in the background.
+        - "fork" is only available on POSIX systems (others fall back to "thread").
+        - Compression of zero-copy checkpoints only applies to the pickle (the arrays are stored uncompressed).
+          Zero-copy checkpoints cannot be differential.
+    """
+    if compression is not None and compression not in CHECKPOINT_COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression}. Supported: {CHECKPOINT_COMPRESSIONS}"
+        )
+    if background is not None and background not in CHECKPOINT_BACKGROUND_MODES:
+        raise ValueError(
+            f"Unknown background mode {background}. Supported: {CHECKPOINT_BACKGROUND_MODES}"
+        )
+    if zero_copy and base is not None:
+        raise ValueError("Zero-copy checkpoints cannot be differential")
+    path = Path(path)
+    base = Path(base) if base is not None else None
+    if background is None:
+        _write(obj, None, path, compression, base, on_written, zero_copy)
+        return path
+    wait_for_checkpoints()
+    if background == "fork" and hasattr(os, "fork"):
+        if base is not None:
+            # the child cannot share the bases it reads with us
+            _cache_base(base, _read_raw(base))
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _write(obj, None, path, compression, base, on_written, zero_copy)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        with _lock:
+            _bases.pop(str(path.absolute()), None)
+        _pending.append((pid, path, []))
+        return path
+    data, buffers = _dumps(obj, zero_copy)
+    # the caller may change the arrays while the thread is writing them
+    pickled = (data, [bytes(_) for _ in buffers])
+    errors: list[BaseException] = []
+
+    def write():
+        try:
+            _write(None, pickled, path, compression, base, on_written, zero_copy)
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=write, daemon=True)
+    thread.start()
+    _pending.append((thread, path, errors))
+    return path
+
+
+def wait_for_checkpoints(raise_errors: bool = False) -> None:
+    """
+    Waits for all checkpoints being written in the background
+
+    Args:
+        raise_errors: If True, an `OSError` is raised if any of them failed. Otherwise a warning is issued for each.
+
+    Remarks:
+        - Writing a background checkpoint calls this first so the failure of a checkpoint is reported (as a warning)
+          at the latest when the next one is written (or when the process exits).
+    """
+    failed = []
+    while _pending:
+        writer, path, errors = _pending.pop(0)
+        if isinstance(writer, threading.Thread):
+            writer.join()
+            if errors:
+                failed.append(f"{path} ({errors[0]!r})")
+            continue
+        try:
+            _, status = os.waitpid(writer, 0)
+        except ChildProcessError:
+            continue
+        code = os.waitstatus_to_exitcode(status)
+        if code != 0:
+            failed.append(f"{path} (writer process exited with {code})")
+    if not failed:
+        return
+    if raise_errors:
+        raise OSError(f"Failed to write checkpoints: {', '.join(failed)}")
+    for f in failed:
+        warn(f"Failed to write checkpoint {f}", NegmasIOWarning)
+
+
+atexit.register(wait_for_checkpoints)
@@ -8,6 +8,7 @@ at least two versions
 from __future__ import annotations
 
 import base64
+import functools
 import itertools
 import json
 import os
@@ -17,9 +18,7 @@ from pathlib import Path
 from typing import Any, Iterable
 
 import dill as pickle
-import inflect
 import numpy as np
-import pandas as pd
 import stringcase
 import yaml
 
@@ -55,7 +54,12 @@ def is_nonzero_file(fpath: PathLike) -> bool:
     return os.path.isfile(fpath) and os.path.getsize(fpath) > 0
 
 
-_inflect_engine = inflect.engine()
+@functools.lru_cache(maxsize=None)
+def _inflect_engine():
+    """The inflection engine (created on first use because importing inflect is slow)"""
+    import inflect
+
+    return inflect.engine()
 
 
 class ConfigReader:
@@ -103,7 +107,7 @@ class ConfigReader:
                 else:
                     myconfig[k] = obj
             elif isinstance(v, Iterable) and not isinstance(v, str):
-                singular = _inflect_engine.singular_noun(k)
+                singular = _inflect_engine().singular_noun(k)
                 if singular is False:
                     singular = k
                 if class_name is None:
@@ -401,6 +405,8 @@ def dump(
         with open(file_name, "wb") as f:
             pickle.dump(d, f)
     elif file_name.suffix == ".csv":
+        import pandas as pd
+
         if not isinstance(d, pd.DataFrame):
             try:
                 d = pd.DataFrame(d)
@@ -440,6 +446,8 @@ def load(file_name: str | os.PathLike | pathlib.Path) -> Any:
         with open(file_name, "rb") as f:
             d = pickle.load(f)
     elif file_name.suffix == ".csv":
+        import pandas as pd
+
         d = pd.read_csv(file_name).to_dict()  # type: ignore
     else:
         raise ValueError(f"Unknown extension {file_name.suffix} for {file_name}")
@@ -470,6 +478,8 @@ def add_records(
         - If col_names are not given, the function will try to normalize the input data if it
           was a dict or a list of dicts
     """
+    import pandas as pd
+
     if col_names is None and (
         isinstance(data, dict)
         or (isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict))
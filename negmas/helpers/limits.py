@@ -0,0 +1,235 @@
+"""
+Utilities for limiting resources used by worker processes
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import shutil
+import signal
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from attrs import define
+
+from negmas import warnings
+from negmas.exceptions import NegMASException
+
+try:
+    import resource
+except ImportError:  # not available on windows
+    resource = None
+
+__all__ = [
+    "ResourceLimits",
+    "ResourceLimitExceeded",
+    "set_worker_limits",
+    "call_with_limits",
+    "RunMarkers",
+]
+
+# signals used to interrupt a task exceeding its limits
+_CPU_SIGNAL = getattr(signal, "SIGXCPU", None)
+_RSS_SIGNAL = getattr(signal, "SIGUSR1", None)
+
+# exit codes of processes terminated by the executor itself (not crashes)
+_CLEAN_EXIT_CODES = (0, -signal.SIGTERM)
+
+
+class ResourceLimitExceeded(NegMASException):
+    """Raised inside a worker when a task exceeds one of its `ResourceLimits`"""
+
+
+@define(frozen=True)
+class ResourceLimits:
+    """Limits applied to every worker process running tournament tasks.
+
+    Args:
+        max_memory: Maximum address space of the worker in bytes (RLIMIT_AS). Allocations beyond it raise `MemoryError`.
+        max_cpu_time: Maximum CPU seconds allowed for a single task (RLIMIT_CPU relative to the start of the task).
+        max_rss: Maximum resident set size in bytes. Polled from a background thread every `rss_poll_interval` seconds.
+        rss_poll_interval: Seconds between successive checks of `max_rss`.
+
+    Remarks:
+        - `max_memory` and `max_cpu_time` need the `resource` module and are ignored (with a warning) on platforms without it.
+        - A task exceeding any of the limits raises `ResourceLimitExceeded` within the worker which stays usable.
+    """
+
+    max_memory: int | None = None
+    max_cpu_time: float | None = None
+    max_rss: int | None = None
+    rss_poll_interval: float = 0.1
+
+    @property
+    def empty(self) -> bool:
+        return (
+            self.max_memory is None
+            and self.max_cpu_time is None
+            and self.max_rss is None
+        )
+
+
+def _raise_cpu(signum, frame):
+    raise ResourceLimitExceeded("CPU time limit exceeded")
+
+
+def _raise_rss(signum, frame):
+    raise ResourceLimitExceeded("Resident memory (RSS) limit exceeded")
+
+
+def set_worker_limits(limits: ResourceLimits | None) -> None:
+    """
+    Applies process-wide limits. Intended as the `initializer` of a process pool.
+
+    Remarks:
+        - Only `max_memory` is process-wide. CPU and RSS limits are applied per task by `call_with_limits`.
+    """
+    if limits is None or limits.max_memory is None:
+        return
+    if resource is None:
+        warnings.warn(
+            "Cannot limit worker memory on this platform (no resource module)",
+            warnings.NegmasUnexpectedValueWarning,
+        )
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = int(limits.max_memory)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+class _RSSWatcher(threading.Thread):
+    """Polls the RSS of the current process and signals the main thread when it exceeds a limit"""
+
+    def __init__(self, max_rss: int, interval: float):
+        super().__init__(daemon=True)
+        self.max_rss, self.interval = max_rss, interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        import psutil
+
+        process = psutil.Process()
+        while not self.stopped.wait(self.interval):
+            if process.memory_info().rss > self.max_rss:
+                os.kill(os.getpid(), _RSS_SIGNAL)  # type: ignore
+                return
+
+
+def call_with_limits(
+    limits: ResourceLimits | None,
+    marker: str | Path | None,
+    f: Callable,
+    /,
+    *args,
+    **kwargs,
+) -> Any:
+    """
+    Calls `f` with the given arguments inside a worker enforcing per-task limits.
+
+    Args:
+        limits: The limits to enforce (`None` for no limits)
+        marker: A file created for the duration of the call (see `RunMarkers`). `None` to create no marker
+        f: The callable to run
+        args: Positional arguments passed to `f`
+        kwargs: Keyword arguments passed to `f`
+
+    Raises:
+        ResourceLimitExceeded: If any of the limits is exceeded while running `f`
+    """
+    if marker is not None:
+        Path(marker).write_text(str(os.getpid()))
+    if limits is None or limits.empty:
+        try:
+            return f(*args, **kwargs)
+        finally:
+            if marker is not None:
+                Path(marker).unlink(missing_ok=True)
+    in_main = threading.current_thread() is threading.main_thread()
+    old_handlers, old_cpu, watcher = dict(), None, None
+    try:
+        if (
+            limits.max_cpu_time is not None
+            and resource is not None
+            and _CPU_SIGNAL is not None
+            and in_main
+        ):
+            old_handlers[_CPU_SIGNAL] = signal.signal(_CPU_SIGNAL, _raise_cpu)
+            old_cpu = resource.getrlimit(resource.RLIMIT_CPU)
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            soft = math.ceil(usage.ru_utime + usage.ru_stime + limits.max_cpu_time)
+            hard = old_cpu[1]
+            if hard != resource.RLIM_INFINITY:
+                soft = min(soft, hard)
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        if limits.max_rss is not None and _RSS_SIGNAL is not None and in_main:
+            old_handlers[_RSS_SIGNAL] = signal.signal(_RSS_SIGNAL, _raise_rss)
+            watcher = _RSSWatcher(limits.max_rss, limits.rss_poll_interval)
+            watcher.start()
+        try:
+            return f(*args, **kwargs)
+        except MemoryError as e:
+            raise ResourceLimitExceeded(f"Memory limit exceeded: {e}") from e
+    finally:
+        if watcher is not None:
+            watcher.stopped.set()
+        if old_cpu is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, old_cpu)  # type: ignore
+        for s, h in old_handlers.items():
+            signal.signal(s, h)
+        if marker is not None:
+            Path(marker).unlink(missing_ok=True)
+
+
+class RunMarkers:
+    """
+    Keeps track of the tasks in-flight inside pool workers using marker files.
+
+    A marker is created by `call_with_limits` when a task starts and removed when it ends. After a
+    worker dies abruptly (leading to a broken pool), the remaining markers tell which tasks were
+    running and the exit codes of the pool processes tell which of them crashed the worker.
+    """
+
+    def __init__(self):
+        self.path = Path(tempfile.mkdtemp(prefix="negmas-runs-"))
+
+    def marker(self, key: str) -> str:
+        return str(self.path / key)
+
+    def in_flight(self) -> dict[str, int | None]:
+        """Returns a mapping from the key of each task in-flight to the PID of its worker"""
+        result = dict()
+        for p in self.path.glob("*"):
+            try:
+                result[p.name] = int(p.read_text())
+            except (ValueError, OSError):
+                result[p.name] = None
+            p.unlink(missing_ok=True)
+        return result
+
+    def crashed(self, processes: dict[int, Any] | None) -> tuple[set[str], set[str]]:
+        """
+        Finds tasks in-flight when a pool broke.
+
+        Args:
+            processes: A mapping from PIDs to `multiprocessing.Process` objects of the broken pool.
+
+        Returns:
+            A tuple of the keys of tasks whose worker crashed and keys of all other tasks in-flight
+        """
+        running = self.in_flight()
+        culprits = set()
+        for key, pid in running.items():
+            if pid is None or not processes or pid not in processes:
+                continue
+            code = processes[pid].exitcode
+            if code is not None and code not in _CLEAN_EXIT_CODES:
+                culprits.add(key)
+        return culprits, set(running.keys()) - culprits
+
+    def cleanup(self):
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -5,17 +5,26 @@ A set of logging utility functions that can be used by agents developed for the
 
 from __future__ import annotations
 
+import atexit
 import datetime
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
+import threading
+import weakref
+from collections import OrderedDict
+from os import PathLike
 from pathlib import Path
 
 import colorlog
 
 from negmas.config import negmas_config
 
-__all__ = ["create_loggers"]
+__all__ = ["create_loggers", "LogPipeline", "get_log_pipeline"]
 LOGS_BASE_DIR = Path(negmas_config("log_base", Path.home() / "negmas" / "logs"))
 COMMON_LOG_FILE_NAME = str(
     Path(LOGS_BASE_DIR)
@@ -119,3 +128,213 @@ def create_loggers(
         file_logger.setFormatter(file_formatter)
         logger.addHandler(file_logger)
     return logger
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records without formatting them (formatting happens in the listener thread)"""
+
+    def __init__(self, pipeline: LogPipeline):
+        super().__init__(pipeline._queue)
+        self._pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._pipeline._listener is None:
+            self._pipeline.start()
+        super().enqueue(record)
+
+
+class _DemuxHandler(logging.Handler):
+    """Writes every record to the file registered for its logger (runs in the listener thread)"""
+
+    def __init__(self, pipeline: LogPipeline):
+        super().__init__()
+        self._pipeline = pipeline
+        self._handlers: OrderedDict[str, logging.Handler] = OrderedDict()
+
+    def _handler(self, name: str) -> logging.Handler | None:
+        try:
+            handler = self._handlers[name]
+            self._handlers.move_to_end(name)
+            return handler
+        except KeyError:
+            pass
+        file_name = self._pipeline.files.get(name, None)
+        if file_name is None:
+            return None
+        p = self._pipeline
+        if p.max_bytes > 0:
+            handler = logging.handlers.RotatingFileHandler(
+                file_name, maxBytes=p.max_bytes, backupCount=p.backup_count, delay=True
+            )
+            if p.compress:
+                handler.namer = _gzip_namer
+                handler.rotator = _gzip_rotator
+        else:
+            handler = logging.FileHandler(file_name, delay=True)
+        handler.setFormatter(self.formatter)
+        self._handlers[name] = handler
+        while len(self._handlers) > p.max_open_files:
+            self._handlers.popitem(last=False)[1].close()
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno < self._pipeline.levels.get(record.name, logging.NOTSET):
+            # logged only for the screen
+            return
+        handler = self._handler(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+    def close(self) -> None:
+        for handler in self._handlers.values():
+            handler.close()
+        self._handlers.clear()
+        super().close()
+
+
+class LogPipeline:
+    """
+    Routes the records of many file loggers through a single queue written by a background thread.
+
+    Args:
+        format_str: the format of logged items
+        max_bytes: If positive, log files are rotated when they reach this size
+        backup_count: Number of rotated files to keep for every log (when `max_bytes` is positive)
+        compress: If given, rotated files are compressed with gzip
+        max_open_files: Maximum number of log files kept open at the same time (others are reopened when needed)
+
+    Remarks:
+        - Loggers are created using `get_logger`. Logging only puts the record in a queue. Formatting and writing
+          to disk happen in the listener thread which writes every record to the file of its logger.
+        - Call `flush` to wait until all queued records are written and `stop` to also close all files. The pipeline
+          restarts automatically when one of its loggers logs again.
+        - Loggers created with a `screen_level` also write records to the screen (stderr) directly in the
+          caller (without going through the queue).
+    """
+
+    def __init__(
+        self,
+        format_str: str = "%(asctime)s - %(levelname)s - %(message)s",
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        compress: bool = False,
+        max_open_files: int = 64,
+    ):
+        self.format_str = format_str
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.max_open_files = max(1, max_open_files)
+        self.files: dict[str, str] = dict()
+        self.levels: dict[str, int] = dict()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._handler = _LazyQueueHandler(self)
+        self._listener: logging.handlers.QueueListener | None = None
+        self._demux: _DemuxHandler | None = None
+        _pipelines.add(self)
+
+    def get_logger(
+        self,
+        name: str,
+        file_name: PathLike | str,
+        level: int = logging.DEBUG,
+        screen_level: int | None = None,
+    ) -> logging.Logger:
+        """
+        Returns a logger that writes (through this pipeline) to the given file
+
+        Args:
+            name: The name of the logger
+            file_name: The file to write to
+            level: The level of the file logger
+            screen_level: If given, records of this level (or higher) are also written to the screen
+        """
+        file_name = str(file_name)
+        os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+        self.files[name] = file_name
+        self.levels[name] = level
+        logger = logging.getLogger(name)
+        logger.setLevel(level if screen_level is None else min(level, screen_level))
+        logger.propagate = False
+        logger.handlers = [self._handler]
+        if screen_level is not None:
+            screen = logging.StreamHandler()
+            screen.setLevel(screen_level)
+            screen.setFormatter(logging.Formatter(self.format_str))
+            logger.addHandler(screen)
+        self.start()
+        return logger
+
+    def start(self) -> None:
+        """Starts the listener thread (if it is not running)"""
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._demux = _DemuxHandler(self)
+            self._demux.setFormatter(logging.Formatter(self.format_str))
+            self._listener = logging.handlers.QueueListener(self._queue, self._demux)
+            self._listener.start()
+
+    def flush(self) -> None:
+        """Waits until all queued records are written"""
+        with self._lock:
+            listener, demux = self._listener, self._demux
+            if listener is None or demux is None:
+                return
+            listener.stop()
+            for handler in demux._handlers.values():
+                handler.flush()
+            self._listener = logging.handlers.QueueListener(self._queue, demux)
+            self._listener.start()
+
+    def stop(self) -> None:
+        """Writes all queued records, stops the listener thread and closes all files"""
+        with self._lock:
+            listener, demux = self._listener, self._demux
+            if listener is not None:
+                listener.stop()
+            if demux is not None:
+                demux.close()
+            self._listener, self._demux = None, None
+
+
+_pipelines: weakref.WeakSet[LogPipeline] = weakref.WeakSet()
+_shared_pipelines: dict[tuple[int, int, bool], LogPipeline] = dict()
+
+
+def get_log_pipeline(
+    max_bytes: int = 0, backup_count: int = 0, compress: bool = False
+) -> LogPipeline:
+    """
+    Returns the `LogPipeline` shared by all users with the given rotation settings (creating it if needed).
+
+    Remarks:
+        - Sharing pipelines keeps a single listener thread for all worlds (and their agents) in the process.
+    """
+    key = (max_bytes, backup_count, compress)
+    pipeline = _shared_pipelines.get(key, None)
+    if pipeline is None:
+        pipeline = _shared_pipelines[key] = LogPipeline(
+            max_bytes=max_bytes, backup_count=backup_count, compress=compress
+        )
+    return pipeline
+
+
+@atexit.register
+def _stop_pipelines() -> None:
+    for pipeline in list(_pipelines):
+        pipeline.stop()
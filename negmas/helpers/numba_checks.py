@@ -1,23 +1,40 @@
 from __future__ import annotations
 import functools
+from importlib.util import find_spec
 
 DISABLE_NUMBA = False
-try:
-    from numba import jit  # type: ignore
+NUMBA_OK = not DISABLE_NUMBA and find_spec("numba") is not None
 
-    NUMBA_OK = not DISABLE_NUMBA
-except Exception:
-    NUMBA_OK = False
 
-    def jit(nopython=True):
-        def jit_decorator(f):
-            @functools.wraps(f)
-            def wrapper(*args, **kwargs):
-                return f(*args, **kwargs)
+def jit(nopython=True):
+    """
+    Compiles the decorated function with numba if it is available.
 
-            return wrapper
+    Remarks:
+        - numba is imported (and the function compiled) on the first call because importing numba is slow.
+          If numba cannot be imported, the function is used as it is.
+    """
 
-        return jit_decorator
+    def jit_decorator(f):
+        compiled = None
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            nonlocal compiled
+            if compiled is None:
+                compiled = f
+                if NUMBA_OK:
+                    try:
+                        from numba import jit as numba_jit  # type: ignore
+
+                        compiled = numba_jit(nopython=nopython)(f)
+                    except Exception:
+                        pass
+            return compiled(*args, **kwargs)
+
+        return wrapper
+
+    return jit_decorator
 
 
 __all__ = ["jit", "NUMBA_OK"]
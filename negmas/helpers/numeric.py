@@ -12,7 +12,6 @@ import random
 from typing import Iterable, TypeVar
 
 import numpy as np
-from scipy.stats import tmean
 
 T = TypeVar("T")
 
@@ -121,6 +120,8 @@ def truncated_mean(
     scores = scores[~np.isnan(scores)]
 
     if isinstance(limits, str) and limits.lower() == "mean":
+        from scipy.stats import tmean
+
         return tmean(scores, None) if not return_limits else (tmean(scores, None), None)  # type: ignore
     if isinstance(limits, str) and limits.lower() == "median":
         return np.median(scores) if not return_limits else (np.median(scores), None)  # type: ignore (seems ok)
@@ -9,7 +9,6 @@ import numbers
 import random
 
 import numpy as np
-import scipy.stats as stats
 
 from negmas.common import Distribution
 
@@ -208,6 +207,8 @@ class ScipyDistribution(Distribution):
     """
 
     def __init__(self, type: str, **kwargs) -> None:
+        import scipy.stats as stats
+
         dist = getattr(stats, type.lower(), None)
         if dist is None:
             raise ValueError(f"Unknown distribution {type}")
@@ -237,6 +238,8 @@ class ScipyDistribution(Distribution):
         return self._type
 
     def _make_dist(self, type: str, loc: float, scale: float):
+        import scipy.stats as stats
+
         dist = getattr(stats, type.lower(), None)
         if dist is None:
             raise ValueError(f"Unknown distribution {type}")
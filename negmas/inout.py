@@ -3,8 +3,13 @@ Defines import/export functionality
 """
 
 from __future__ import annotations
+import hashlib
 import math
+import os
+import pickle
+import uuid
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from os import PathLike, listdir
 from pathlib import Path
 from random import shuffle
@@ -12,6 +17,8 @@ from typing import Any, Callable, Iterable, Sequence
 
 from attrs import define, field
 
+from negmas import __version__
+from negmas.config import negmas_config
 from negmas.helpers.inout import dump, load
 from negmas.helpers.types import get_full_type_name
 from negmas.outcomes.outcome_space import make_os
@@ -54,6 +61,121 @@ __all__ = [
 
 STATS_MAX_CARDINALITY = 10_000_000_000
 GENIUSWEB_UFUN_TYPES = ("LinearAdditiveUtilitySpace",)
+SCENARIO_CACHE_DIR = Path(
+    negmas_config("scenario_cache", Path.home() / "negmas" / "cache" / "scenarios")
+).expanduser()
+"""Folder of the caches of parsed scenarios (see `Scenario.load`). Caches are pickles so this folder must only be
+writable by the user"""
+SCENARIO_CACHE_VERSION = (1, __version__)
+"""Caches written with a different version are ignored"""
+SCENARIO_SOURCE_SUFFIXES = (".xml", ".yml", ".yaml", ".json")
+
+
+def _source_stats(folder: Path) -> list[tuple[str, int, int]]:
+    """Names, sizes and modification times of the files a scenario may be parsed from"""
+    stats = []
+    for f in sorted(folder.iterdir()):
+        if f.suffix not in SCENARIO_SOURCE_SUFFIXES or f.name.startswith("."):
+            continue
+        stat = f.stat()
+        stats.append((f.name, stat.st_size, stat.st_mtime_ns))
+    return stats
+
+
+def _source_hashes(folder: Path, stats: list[tuple[str, int, int]]) -> list[str]:
+    return [hashlib.sha256((folder / _[0]).read_bytes()).hexdigest() for _ in stats]
+
+
+def _scenario_cache_path(folder: Path) -> Path:
+    """The file caching the scenarios parsed from a folder (inside `SCENARIO_CACHE_DIR`)"""
+    key = hashlib.sha256(str(folder.resolve()).encode()).hexdigest()
+    return SCENARIO_CACHE_DIR / f"{key}.pkl"
+
+
+def _write_scenario_cache(folder: Path, cached: dict[str, Any]) -> None:
+    path = _scenario_cache_path(folder)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # atomic so that processes loading the same scenario never read a partial cache
+        os.replace(tmp, path)
+    except Exception:
+        # a read-only cache folder or a scenario that cannot be pickled is just not cached
+        tmp.unlink(missing_ok=True)
+
+
+def _read_scenario_cache(
+    folder: Path, stats: list[tuple[str, int, int]]
+) -> dict[str, Any] | None:
+    """Reads the cache of the folder returning `None` if it does not exist or any source file changed"""
+    try:
+        with open(_scenario_cache_path(folder), "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != SCENARIO_CACHE_VERSION:
+        return None
+    if cached["stats"] == stats:
+        return cached
+    # files may be touched without being changed (e.g. by copying or checking out a library)
+    if [_[:2] for _ in cached["stats"]] != [_[:2] for _ in stats]:
+        return None
+    if cached["hashes"] != _source_hashes(folder, stats):
+        return None
+    cached["stats"] = stats
+    _write_scenario_cache(folder, cached)
+    return cached
+
+
+def _load_cached(
+    folder: PathLike | str,
+    key: tuple,
+    parse: Callable[[], Scenario | None] | None,
+    cache: bool = True,
+) -> Scenario | None:
+    """
+    Loads a scenario from the cache of its folder parsing (and caching) it if needed.
+
+    Args:
+        folder: The scenario folder
+        key: Identifies the loader and its parameters (a folder caches one scenario per key)
+        parse: Parses the scenario. If `None`, only the cache is checked
+        cache: If `False`, `parse` is called directly
+    """
+    if not cache:
+        return parse() if parse is not None else None
+    folder = Path(folder)
+    stats = _source_stats(folder)
+    cached = _read_scenario_cache(folder, stats)
+    if cached is not None and key in cached["scenarios"]:
+        scenario = cached["scenarios"][key]
+        # as if it was parsed again
+        for u in scenario.ufuns:
+            prefix = f"{u.name}-" if u.id.startswith(f"{u.name}-") else ""
+            u.id = f"{prefix}{uuid.uuid4()}"
+        return scenario
+    if parse is None:
+        return None
+    hashes: list[str] = []
+    if cached is None:
+        # hashed before parsing so that changes during parsing invalidate the cache
+        hashes = _source_hashes(folder, stats)
+    scenario = parse()
+    if scenario is None:
+        return None
+    if cached is None:
+        cached = dict(
+            version=SCENARIO_CACHE_VERSION, stats=stats, hashes=hashes, scenarios=dict()
+        )
+    cached["scenarios"][key] = scenario
+    _write_scenario_cache(folder, cached)
+    return scenario
+
+
+def _load_scenario(path: PathLike | str, safe_parsing: bool, cache: bool):
+    return Scenario.load(path, safe_parsing=safe_parsing, cache=cache)
 
 
 def scenario_size(self: Scenario):
@@ -529,27 +651,94 @@ class Scenario:
         ignore_discount=False,
         ignore_reserved=False,
         safe_parsing=True,
+        cache=False,
     ) -> Scenario | None:
-        return load_genius_domain_from_folder(
-            folder_name=str(path),
-            ignore_discount=ignore_discount,
-            ignore_reserved=ignore_reserved,
-            safe_parsing=safe_parsing,
+        return _load_cached(
+            path,
+            ("genius", ignore_discount, ignore_reserved, safe_parsing),
+            lambda: load_genius_domain_from_folder(
+                folder_name=str(path),
+                ignore_discount=ignore_discount,
+                ignore_reserved=ignore_reserved,
+                safe_parsing=safe_parsing,
+            ),
+            cache,
         )
 
     @classmethod
-    def load(cls, folder: Path | str, safe_parsing=False) -> Scenario | None:
+    def load(
+        cls, folder: Path | str, safe_parsing=False, cache=False
+    ) -> Scenario | None:
         """
         Loads the scenario from a folder with supported formats: XML, YML
+
+        Args:
+            folder: The scenario folder
+            safe_parsing: Applies more stringent checks during parsing
+            cache: Use (and create) a cache of the parsed scenario (see `SCENARIO_CACHE_DIR`)
+
+        Remarks:
+            - The cache is stored in `SCENARIO_CACHE_DIR` (configurable with the `scenario_cache` config key) and
+              never in the scenario folder. It is unpickled when loading so only enable it if this folder is only
+              writable by you.
+            - The cache is invalidated when any of the source files in the folder changes (checked
+              using their sizes and modification times then their hashes if the latter changed).
+            - Failing to write the cache (e.g. in a read-only folder) is not an error.
         """
-        for finder, loader in (
-            (find_domain_and_utility_files_yaml, cls.from_yaml_folder),
-            (find_domain_and_utility_files_xml, cls.from_genius_folder),
-            (find_domain_and_utility_files_geniusweb, cls.from_geniusweb_folder),
-        ):
-            domain, _ = finder(folder)
-            if domain is not None:
-                return loader(folder, safe_parsing=safe_parsing)
+
+        def parse():
+            for finder, loader in (
+                (find_domain_and_utility_files_yaml, cls.from_yaml_folder),
+                (find_domain_and_utility_files_xml, cls.from_genius_folder),
+                (find_domain_and_utility_files_geniusweb, cls.from_geniusweb_folder),
+            ):
+                domain, _ = finder(folder)
+                if domain is not None:
+                    return loader(folder, safe_parsing=safe_parsing)
+
+        return _load_cached(folder, ("load", safe_parsing), parse, cache)
+
+    @classmethod
+    def load_many(
+        cls,
+        paths: Iterable[Path | str],
+        n_jobs: int | None = None,
+        safe_parsing=False,
+        cache=False,
+    ) -> list[Scenario | None]:
+        """
+        Loads scenarios from several folders parsing the ones that are not cached in parallel.
+
+        Args:
+            paths: The scenario folders
+            n_jobs: Number of worker processes. `None` uses all CPUs and 0 or 1 loads in this process
+            safe_parsing: Applies more stringent checks during parsing
+            cache: Use (and create) a cache of each parsed scenario (see `load` for when it is safe to use)
+
+        Returns:
+            The scenarios in the same order as `paths` (`None` for folders that cannot be loaded).
+        """
+        paths = list(paths)
+        scenarios = [
+            _load_cached(_, ("load", safe_parsing), None, cache) for _ in paths
+        ]
+        missing = [i for i, s in enumerate(scenarios) if s is None]
+        if (n_jobs is not None and n_jobs <= 1) or len(missing) < 2:
+            for i in missing:
+                scenarios[i] = cls.load(
+                    paths[i], safe_parsing=safe_parsing, cache=cache
+                )
+            return scenarios
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            loaded = pool.map(
+                _load_scenario,
+                [paths[_] for _ in missing],
+                [safe_parsing] * len(missing),
+                [cache] * len(missing),
+            )
+            for i, s in zip(missing, loaded):
+                scenarios[i] = s
+        return scenarios
 
     @classmethod
     def is_loadable(cls, path: PathLike | str):
@@ -590,13 +779,25 @@ class Scenario:
         ignore_reserved=False,
         use_reserved_outcome=False,
         safe_parsing=True,
+        cache=False,
     ) -> Scenario | None:
-        return load_geniusweb_domain_from_folder(
-            folder_name=str(path),
-            ignore_discount=ignore_discount,
-            use_reserved_outcome=use_reserved_outcome,
-            ignore_reserved=ignore_reserved,
-            safe_parsing=safe_parsing,
+        return _load_cached(
+            path,
+            (
+                "geniusweb",
+                ignore_discount,
+                ignore_reserved,
+                use_reserved_outcome,
+                safe_parsing,
+            ),
+            lambda: load_geniusweb_domain_from_folder(
+                folder_name=str(path),
+                ignore_discount=ignore_discount,
+                use_reserved_outcome=use_reserved_outcome,
+                ignore_reserved=ignore_reserved,
+                safe_parsing=safe_parsing,
+            ),
+            cache,
         )
 
     @staticmethod
@@ -626,16 +827,22 @@ class Scenario:
         ignore_discount=False,
         ignore_reserved=False,
         safe_parsing=True,
+        cache=False,
     ) -> Scenario | None:
-        domain, ufuns = find_domain_and_utility_files_yaml(path)
-        if not domain:
-            return None
-        return cls.from_yaml_files(
-            domain=domain,
-            ufuns=ufuns,
-            ignore_discount=ignore_discount,
-            ignore_reserved=ignore_reserved,
-            safe_parsing=safe_parsing,
+        def parse():
+            domain, ufuns = find_domain_and_utility_files_yaml(path)
+            if not domain:
+                return None
+            return cls.from_yaml_files(
+                domain=domain,
+                ufuns=ufuns,
+                ignore_discount=ignore_discount,
+                ignore_reserved=ignore_reserved,
+                safe_parsing=safe_parsing,
+            )
+
+        return _load_cached(
+            path, ("yaml", ignore_discount, ignore_reserved, safe_parsing), parse, cache
         )
 
     @classmethod
@@ -133,6 +133,13 @@ class Mechanism(
         extra_checkpoint_info: Any extra information to save with the checkpoint in the corresponding json file as
                                a dictionary with string keys
         exist_ok: IF true, checkpoints override existing checkpoints with the same filename.
+        checkpoint_compression: Compression method for checkpoints (gzip, bz2, lzma, zstd or lz4). None for no compression.
+        checkpoint_background: Write checkpoints in a background "thread" or a forked process ("fork") instead of
+                               stalling the simulation. None to write them synchronously.
+        checkpoint_differential: If positive (and single_checkpoint is False), every full checkpoint is followed by
+                                 this number of differential checkpoints storing only the changes from it.
+        checkpoint_zero_copy: If true, numpy arrays are saved in checkpoints as separate blobs that are memory-mapped
+                              instead of copied when the checkpoint is loaded.
         name: Name of the mechanism session. Should be unique. If not given, it will be generated.
         genius_port: the port used to connect to Genius for all negotiators in this mechanism (0 means any).
         id: An optional system-wide unique identifier. You should not change
@@ -171,6 +178,10 @@ class Mechanism(
         type_name: str | None = None,
         verbosity: int = 0,
         ignore_negotiator_exceptions=False,
+        checkpoint_compression: str | None = None,
+        checkpoint_background: str | None = None,
+        checkpoint_differential: int = 0,
+        checkpoint_zero_copy: bool = False,
     ):
         check_one_and_only(outcome_space, issues, outcomes)
         outcome_space = ensure_os(outcome_space, issues, outcomes)
@@ -189,6 +200,10 @@ class Mechanism(
             info=extra_checkpoint_info,
             exist_ok=exist_ok,
             single=single_checkpoint,
+            compression=checkpoint_compression,
+            background=checkpoint_background,
+            differential=checkpoint_differential,
+            zero_copy=checkpoint_zero_copy,
         )
         self.__last_second_tried = 0
         self._hidden_time_limit = (
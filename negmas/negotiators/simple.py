@@ -2,7 +2,7 @@ from __future__ import annotations
 import itertools
 import math
 from random import sample
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Sequence
 
 import numpy as np
 
@@ -128,6 +128,47 @@ class BinaryComparatorNegotiator(Negotiator):
             raise ValueError("Cannot compare outcomes without a ufun")
         return self._preferences.is_better(first, second)  # type: ignore
 
+    def is_better_many(
+        self, firsts: Sequence[Outcome | None], second: Outcome | None
+    ) -> list[bool | None]:
+        """
+        Compares many outcomes with the same outcome.
+
+        Args:
+            firsts: Outcomes to be compared with `second`
+            second: The outcome to compare with
+
+        Returns:
+            A list with the result of `is_better` (first, second) for every outcome in `firsts`
+
+        Remarks:
+            - If neither `is_better` nor the comparison methods of the ufun are overridden, `second` is evaluated
+              once and every outcome in `firsts` is evaluated once (instead of twice per comparison).
+              Otherwise, this just calls `is_better` for every outcome.
+        """
+        if not self.has_preferences:
+            raise ValueError("Cannot compare outcomes without a ufun")
+        if not _compares_utilities(self):
+            return [self.is_better(_, second) for _ in firsts]
+        u = self._preferences
+        s = float(u(second))  # type: ignore
+        return [float(u(_)) - s > 0 for _ in firsts]  # type: ignore
+
+
+def _compares_utilities(negotiator: BinaryComparatorNegotiator) -> bool:
+    """Is `is_better` of the negotiator equivalent to comparing the values of its (crisp) ufun?"""
+    from ..preferences import BaseUtilityFunction, Preferences, UtilityFunction
+
+    pref = negotiator._preferences
+    t = type(pref)
+    return (
+        type(negotiator).is_better is BinaryComparatorNegotiator.is_better
+        and isinstance(pref, UtilityFunction)
+        and t.is_better is Preferences.is_better
+        and t.is_not_worse is UtilityFunction.is_not_worse
+        and t.difference is BaseUtilityFunction.difference
+    )
+
 
 class NLevelsComparatorNegotiator(Negotiator):
     """
@@ -4,8 +4,6 @@ import pathlib
 import uuid
 from typing import TYPE_CHECKING, Callable, Protocol, TypeVar, Generic
 
-from matplotlib.markers import CARETDOWN, CARETLEFT, CARETRIGHT, CARETUP
-
 from negmas.common import MechanismState, NegotiatorMechanismInterface, TraceElement
 from negmas.gb import ResponseType
 from negmas.helpers.misc import make_callable
@@ -114,10 +112,11 @@ PARETO_ALPHA = 0.4
 NASH_ALPHA = 0.4
 KALAI_ALPHA = 0.4
 KS_ALPHA = 0.4
-KALAI_MARKER = CARETDOWN
-KS_MARKER = CARETUP
-WELFARE_MARKER = CARETRIGHT
-NASH_MARKER = CARETLEFT
+# matplotlib.markers.CARETDOWN, CARETUP, CARETRIGHT and CARETLEFT (not imported to keep importing negmas fast)
+KALAI_MARKER = 7
+KS_MARKER = 6
+WELFARE_MARKER = 5
+NASH_MARKER = 4
 KALAI_COLOR = "green"
 KS_COLOR = "cyan"
 WELFARE_COLOR = "blue"
@@ -197,6 +197,9 @@ class ExpDiscountedUFun(DiscountedUtilityFunction):
         return self.ufun.type + "_exponentially_discounted"
 
     def __getattr__(self, item):
+        # ufun is not set yet while unpickling
+        if item == "ufun":
+            raise AttributeError(item)
         return getattr(self.ufun, item)
 
     def __str__(self):
@@ -335,6 +338,9 @@ class LinDiscountedUFun(DiscountedUtilityFunction):
         )
 
     def __getattr__(self, item):
+        # ufun is not set yet while unpickling
+        if item == "ufun":
+            raise AttributeError(item)
         return getattr(self.ufun, item)
 
     def __str__(self):
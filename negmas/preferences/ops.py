@@ -8,8 +8,6 @@ from typing import TYPE_CHECKING, Any, Iterable, Literal, Sequence, TypeVar, ove
 import numpy as np
 from attrs import define, field
 from numpy.typing import NDArray
-from scipy import spatial
-from scipy.stats import rankdata
 
 from negmas import warnings
 from negmas.helpers.numba_checks import jit  # type: ignore
@@ -437,6 +435,8 @@ def pareto_frontier_chatgpt(
     points = -points
     indices = np.arange(n_points, dtype=np.int32)
     points = np.asarray(points)
+    from scipy import spatial
+
     hull = spatial.ConvexHull(points)
     pareto_points = []
     pareto_indices = []
@@ -511,6 +511,8 @@ def pareto_frontier_convex_hull(
         """
         Iteratively filter points based on the convex hull heuristic
         """
+        from scipy import spatial
+
         pareto_groups = []
 
         # loop while there are points remaining
@@ -1928,6 +1930,8 @@ def get_ranks(
     vals = np.asarray([ufun(_) for _ in alloutcomes + [None]])
     if changed:
         ufun.reserved_value = None  # type: ignore
+    from scipy.stats import rankdata
+
     ranks = rankdata(vals, method="dense") - 1.0
     if normalize:
         ranks = ranks / np.max(ranks)
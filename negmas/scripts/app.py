@@ -33,6 +33,7 @@ from negmas.tournaments import (
     create_tournament,
     evaluate_tournament,
     run_tournament,
+    run_worker,
 )
 
 try:
@@ -532,18 +533,32 @@ def display_results(results, metric, significance):
     default=False,
     help="Run a distributed tournament using dask",
 )
+@click.option(
+    "--tcp",
+    default=-1,
+    type=int,
+    help="Run a distributed tournament using the built-in TCP work-queue (no dask) starting the given number of "
+    "local workers. Workers on other machines can be started using `negmas tournament worker`. Negative to disable",
+)
 @click.option(
     "--ip",
     default="127.0.0.1",
-    help="The IP address for a dask scheduler to run the distributed tournament."
-    " Effective only if --distributed",
+    help="The IP address for a dask scheduler to run the distributed tournament (or to listen on for --tcp)."
+    " Effective only if --distributed or --tcp",
 )
 @click.option(
     "--port",
     default=8786,
     type=int,
-    help="The IP port number a dask scheduler to run the distributed tournament."
-    " Effective only if --distributed",
+    help="The IP port number a dask scheduler to run the distributed tournament (or to listen on for --tcp)."
+    " Effective only if --distributed or --tcp",
+)
+@click.option(
+    "--authkey",
+    default=None,
+    envvar="NEGMAS_TCP_AUTHKEY",
+    help="The key workers use to authenticate with the coordinator (--tcp only). Required when listening on a "
+    "non-loopback --ip",
 )
 @click.option(
     "--compact/--debug",
@@ -581,8 +596,10 @@ def run(
     verbosity,
     parallel,
     distributed,
+    tcp,
     ip,
     port,
+    authkey,
     compact,
     path,
     log,
@@ -606,7 +623,11 @@ def run(
     if saved_log_folder is not None:
         log = saved_log_folder
     parallelism = "distributed" if distributed else "parallel" if parallel else "serial"
-    prog_callback = print_world_progress if verbosity > 1 and not distributed else None
+    if tcp >= 0:
+        parallelism = f"tcp:{tcp}"
+    prog_callback = (
+        print_world_progress if verbosity > 1 and not distributed and tcp < 0 else None
+    )
     tpath = str(pathlib.Path(log) / name)
     start = perf_counter()
     run_tournament(
@@ -618,6 +639,7 @@ def run(
         scheduler_ip=ip,
         scheduler_port=port,
         print_exceptions=verbosity > 1,
+        authkey=authkey,
     )
     end_time = humanize_time(perf_counter() - start)
     if eval:
@@ -628,6 +650,35 @@ def run(
     print(f"Finished in {end_time}")
 
 
+@tournament.command(help="Runs a worker for a tournament served over TCP (see run --tcp)")
+@click.option("--ip", default="127.0.0.1", help="The IP address of the coordinator")
+@click.option("--port", default=8786, type=int, help="The port of the coordinator")
+@click.option(
+    "--authkey",
+    default=None,
+    envvar="NEGMAS_TCP_AUTHKEY",
+    help="The key used to authenticate with the coordinator",
+)
+@click.option(
+    "--path",
+    default="",
+    help="A path to be added to PYTHONPATH in which all competitors are stored. You can path a : separated list of "
+    "paths on linux/mac and a ; separated list in windows",
+)
+@click.option(
+    "--verbosity",
+    default=1,
+    type=int,
+    help="verbosity level (from 0 == silent to 1 == task progress)",
+)
+def worker(ip, port, authkey, path, verbosity):
+    if len(path) > 0:
+        sys.path.append(path)
+    start = perf_counter()
+    n = run_worker(host=ip, port=port, authkey=authkey, verbose=verbosity > 0)
+    print(f"Ran {n} tasks in {humanize_time(perf_counter() - start)}")
+
+
 @tournament.command(help="Evaluates a tournament and returns the results")
 @click.argument("path", type=click.Path(dir_okay=True, file_okay=False))
 @click.option(
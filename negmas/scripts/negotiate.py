@@ -1,26 +1,27 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-import pandas as pd
+import functools
+import glob
+import json
 import sys
 import random
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from pathlib import Path
 from time import perf_counter
 from negmas.inout import serialize
 
-import matplotlib
 import typer
-from matplotlib import functools
-from matplotlib import pyplot as plt
-from pandas.core.window.numba_ import Callable
 from rich import print
+from rich.console import Console
+from rich.progress import track
 from stringcase import titlecase
 
 from negmas.genius.ginfo import get_java_class
 from negmas.genius.negotiator import GeniusNegotiator
 from negmas.helpers import get_class
-from negmas.helpers.inout import dump
+from negmas.helpers.inout import dump, load
 from negmas.helpers.strings import camel_case, humanize_time, shortest_unique_names
 from negmas.helpers.types import get_full_type_name
 from negmas.inout import Scenario
@@ -38,6 +39,9 @@ from negmas.preferences.ops import (
 from negmas.preferences.generators import generate_multi_issue_ufuns
 
 app = typer.Typer()
+batch_app = typer.Typer()
+# status messages of batches (stdout may carry their records)
+batch_status = Console(stderr=True, soft_wrap=True)
 
 GENIUSMARKER = "genius"
 
@@ -710,6 +714,9 @@ def run(
         plot_path = save_path / "session.png"
         plot_path.parent.mkdir(parents=True, exist_ok=True)
     if plot:
+        import matplotlib
+        from matplotlib import pyplot as plt
+
         if plot_backend:
             matplotlib.use(plot_backend)
             matplotlib.interactive(plot_interactive)
@@ -739,6 +746,8 @@ def run(
             mng.full_screen_toggle()
             plt.show()
     if save_path and save_history:
+        import pandas as pd
+
         if hasattr(session, "full_trace"):
             hist = pd.DataFrame(
                 session.full_trace,  # type: ignore
@@ -757,5 +766,306 @@ def run(
         dump(hist, save_path / "history.csv", compact=True, sort_keys=False)
 
 
+def _add_paths(paths: list[str]) -> None:
+    for p in paths:
+        if p not in sys.path:
+            sys.path.append(p)
+
+
+def batch_id(scenario: str, negotiators: tuple[str, ...], repetition: int) -> str:
+    """The key identifying a negotiation in the output of a batch (used for resuming)"""
+    return f"{scenario}|{','.join(negotiators)}|{repetition}"
+
+
+def run_batch_negotiation(
+    scenario: str,
+    negotiators: tuple[str, ...],
+    repetition: int,
+    protocol: str = "SAO",
+    steps: int | None = None,
+    timelimit: float | None = None,
+    normalize: bool = True,
+    params: dict[str, Any] | None = None,
+    raise_exceptions: bool = False,
+) -> dict[str, Any]:
+    """
+    Runs a single negotiation of a batch and returns its record.
+
+    Args:
+        scenario: The folder to load the scenario from (any format supported by `Scenario.load`)
+        negotiators: Negotiator types (as accepted by the `run` command) in the order of the ufuns of the scenario
+        repetition: The repetition index (only used to identify the record)
+        protocol: The protocol (mechanism) to use
+        steps: Number of steps allowed (`None` for no limit)
+        timelimit: Number of seconds allowed (`None` for no limit)
+        normalize: Normalize ufuns to the range (0-1)
+        params: Extra mechanism initialization parameters
+        raise_exceptions: Raise exceptions instead of recording them in the `error` field
+
+    Returns:
+        A json-serializable dict with the agreement, utilities, reserved values, steps and time of the negotiation.
+    """
+    record: dict[str, Any] = dict(
+        id=batch_id(scenario, negotiators, repetition),
+        scenario=scenario,
+        negotiators=list(negotiators),
+        repetition=repetition,
+        error=None,
+    )
+    try:
+        current_scenario = Scenario.load(scenario)
+        if current_scenario is None:
+            raise ValueError(f"Cannot load a scenario from {scenario}")
+        if normalize:
+            current_scenario.normalize()
+        if len(negotiators) != len(current_scenario.ufuns):
+            raise ValueError(
+                f"{len(negotiators)} negotiators cannot negotiate in a scenario with {len(current_scenario.ufuns)} ufuns"
+            )
+        current_scenario.mechanism_type = get_protocol(protocol)
+        names = shortest_unique_names(list(negotiators), guarantee_unique=True)
+        agents = [
+            get_negotiator(_)(name=name)  # type: ignore
+            for _, name in zip(negotiators, names, strict=True)
+        ]
+        session = current_scenario.make_session(
+            agents,
+            n_steps=steps if steps is not None else float("inf"),
+            time_limit=timelimit if timelimit is not None else float("inf"),
+            ignore_negotiator_exceptions=not raise_exceptions,
+            **(params if params else dict()),
+        )
+        _start = perf_counter()
+        state = session.run()
+        duration = perf_counter() - _start
+    except Exception as e:
+        if raise_exceptions:
+            raise
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+    record.update(
+        agreement=state.agreement,
+        utilities=[float(u(state.agreement)) for u in current_scenario.ufuns],
+        reserved_values=[
+            float(u.reserved_value) if u.reserved_value is not None else None
+            for u in current_scenario.ufuns
+        ],
+        step=session.current_step,
+        relative_time=session.relative_time,
+        time=duration,
+        timedout=state.timedout,
+        broken=state.broken,
+    )
+    return serialize(record)
+
+
+def _expand_scenarios(patterns: list[str]) -> list[str]:
+    scenarios = []
+    for pattern in patterns:
+        paths = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in paths:
+            try:
+                loadable = Scenario.is_loadable(path)
+            except Exception:
+                loadable = False
+            if loadable:
+                scenarios.append(str(path))
+            else:
+                batch_status.print(
+                    f"[yellow]Ignoring {path}: not a scenario folder[/yellow]"
+                )
+    return scenarios
+
+
+def _finished_ids(output: Path) -> set[str]:
+    """Ids of negotiations successfully recorded in an existing output file"""
+    done = set()
+    if not output.exists():
+        return done
+    with open(output) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # a line partially written when a previous batch was interrupted
+                continue
+            if record.get("error", None) is None:
+                done.add(record["id"])
+    return done
+
+
+@batch_app.command()
+def batch(
+    scenarios: Optional[list[str]] = typer.Argument(
+        None,
+        help="Scenario folders or glob patterns matching them (e.g. 'scenarios/*')",
+        show_default=False,
+    ),
+    spec: Optional[Path] = typer.Option(
+        None,
+        "--spec",
+        help="A json/yaml file with any of the keys: scenarios, negotiators, repetitions, protocol, steps, timelimit, params. Its values override the corresponding options.",
+        rich_help_panel="Basic Options",
+    ),
+    negotiators: list[str] = typer.Option(
+        ["AspirationNegotiator,NaiveTitForTatNegotiator"],
+        "--negotiators",
+        "-n",
+        help="Comma-separated negotiator types for one negotiation (one per ufun). Pass multiple times to run several combinations",
+        rich_help_panel="Basic Options",
+    ),
+    repetitions: int = typer.Option(
+        1,
+        "--repetitions",
+        "-r",
+        help="Number of times to run every combination of scenario and negotiators",
+        rich_help_panel="Basic Options",
+    ),
+    protocol: str = typer.Option(
+        "SAO",
+        "--protocol",
+        "--mechanism",
+        "-p",
+        "-m",
+        help="The protocol (Mechanism to use)",
+        rich_help_panel="Basic Options",
+    ),
+    extra_params: str = typer.Option(
+        "",
+        "--params",
+        help="Mechanism initialization parameters as comma-separated `key=value` pairs.",
+        rich_help_panel="Basic Options",
+    ),
+    steps: Optional[int] = typer.Option(
+        None,
+        "--steps",
+        "-s",
+        help="Number of Steps allowed in every negotiation",
+        rich_help_panel="Deadline",
+    ),
+    timelimit: Optional[float] = typer.Option(
+        None,
+        "--time",
+        "--timelimit",
+        "-t",
+        help="Number of Seconds allowed in every negotiation",
+        rich_help_panel="Deadline",
+    ),
+    normalize: bool = typer.Option(
+        True,
+        help="Normalize ufuns to the range (0-1)",
+        rich_help_panel="Scenario Overrides",
+    ),
+    jobs: int = typer.Option(
+        -1,
+        "--jobs",
+        "-j",
+        help="Number of worker processes. 0 runs all negotiations in this process and a negative number uses all CPUs",
+        rich_help_panel="Execution",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="A JSON Lines file to append one record per negotiation to",
+        show_default="Print records",  # type: ignore
+        rich_help_panel="Output Control",
+    ),
+    resume: bool = typer.Option(
+        True,
+        help="Skip negotiations already recorded (without errors) in the output file",
+        rich_help_panel="Output Control",
+    ),
+    progress: bool = typer.Option(
+        True, help="Show Progress Bar", rich_help_panel="Output Control"
+    ),
+    path: list[Path] = typer.Option(
+        list(),
+        help="One or more extra paths to look for negotiator and mechanism classes.",
+        rich_help_panel="Advanced",
+    ),
+    raise_exceptions: bool = typer.Option(
+        False, help="Raise Exceptions on Failure", rich_help_panel="Advanced"
+    ),
+):
+    """
+    Runs negotiations for every combination of scenario, negotiators and repetition writing one JSON line for each.
+    """
+    params: dict[str, Any] = dict()
+    if extra_params:
+        params = eval("dict(" + extra_params + ")")
+    patterns = list(scenarios) if scenarios else []
+    combinations = [tuple(_.split(",")) for _ in negotiators]
+    if spec is not None:
+        specs = load(spec)
+        patterns = [str(_) for _ in specs.get("scenarios", patterns)]
+        combinations = [
+            tuple(_.split(",")) if isinstance(_, str) else tuple(_)
+            for _ in specs.get("negotiators", combinations)
+        ]
+        repetitions = specs.get("repetitions", repetitions)
+        protocol = specs.get("protocol", protocol)
+        steps = specs.get("steps", steps)
+        timelimit = specs.get("timelimit", timelimit)
+        params = params | specs.get("params", dict())
+    paths = [str(_) for _ in path]
+    _add_paths(paths)
+    tasks = [
+        (s, c, r)
+        for s in _expand_scenarios(patterns)
+        for c in combinations
+        for r in range(repetitions)
+    ]
+    if not tasks:
+        batch_status.print("[red]Nothing to run: no scenarios found[/red]")
+        raise typer.Exit(1)
+    n_tasks = len(tasks)
+    if output is not None and resume:
+        done = _finished_ids(output)
+        tasks = [_ for _ in tasks if batch_id(*_) not in done]
+        if len(tasks) < n_tasks:
+            batch_status.print(
+                f"Resuming: {n_tasks - len(tasks)} of {n_tasks} negotiations done"
+            )
+    kwargs = dict(
+        protocol=protocol,
+        steps=steps,
+        timelimit=timelimit,
+        normalize=normalize,
+        params=params,
+        raise_exceptions=raise_exceptions,
+    )
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+    out = open(output, "a") if output is not None else sys.stdout
+    pool = None
+    try:
+        if jobs == 0:
+            records = (run_batch_negotiation(*_, **kwargs) for _ in tasks)  # type: ignore
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=jobs if jobs > 0 else None,
+                initializer=_add_paths,
+                initargs=(paths,),
+            )
+            futures = [pool.submit(run_batch_negotiation, *_, **kwargs) for _ in tasks]
+            records = (_.result() for _ in as_completed(futures))
+        # records are written as soon as they are available so that an interrupted batch can be resumed
+        for record in track(
+            records,
+            total=len(tasks),
+            description="Negotiations",
+            disable=not progress or output is None,
+            console=batch_status,
+        ):
+            out.write(json.dumps(record, default=str) + "\n")
+            out.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if output is not None:
+            out.close()
+
+
 if __name__ == "__main__":
     app()
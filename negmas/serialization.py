@@ -5,12 +5,13 @@ Implements serialization to and from strings and secondary storage.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Any, Iterable
+from types import FunctionType
+from typing import Any, Callable, Iterable
 
 import cloudpickle
 import numpy as np
-from pandas import json_normalize
 
 from negmas import warnings
 
@@ -43,6 +44,98 @@ SPECIAL_FIELDS = ("_NamedObject__uuid", "_NamedObject__name")
 SPECIAL_FIELDS_SHORT_NAMES = ("id", "name")
 
 
+# types whose values are always encoded as they are (ints are handled separately, see `_MAX_SAFE_INT`)
+_SIMPLE_TYPES = frozenset((type(None), bool, float, str))
+# ints with fewer digits than the minimum allowed by `sys.set_int_max_str_digits` are always json serializable
+_MAX_SAFE_INT = 10**640
+
+# flags describing which branches of `serialize` can apply to values of a type
+_DICT, _TYPE, _PATH, _SEQUENCE, _STR, _BYTES, _FUNCTION, _INT64, _FLOAT = (
+    1 << _ for _ in range(9)
+)
+# flags of types already encoded
+_type_flags: dict[type, int] = dict()
+
+
+def _compute_flags(isa: Callable[[Any], bool], cached: bool) -> int:
+    flags = 0
+    if isa(dict):
+        flags |= _DICT
+    if isa(type):
+        flags |= _TYPE
+    if isa(Path):
+        flags |= _PATH
+    if isa((list, tuple)) and not isa(str):
+        flags |= _SEQUENCE
+    if isa(str):
+        flags |= _STR
+    if isa(bytes):
+        flags |= _BYTES
+    if isa((FunctionType, functools.partial)):
+        flags |= _FUNCTION
+    if isa(np.int64):
+        flags |= _INT64
+    # json serializes all floats (including subclasses) using float.__repr__
+    if cached and isa(float):
+        flags |= _FLOAT
+    return flags
+
+
+def _flags(value) -> int:
+    """Returns the flags of the type of the value (computed once per type)"""
+    t = type(value)
+    if value.__class__ is not t:
+        # isinstance() honours overridden __class__ attributes so we cannot use the type
+        return _compute_flags(functools.partial(isinstance, value), False)
+    flags = _type_flags.get(t, None)
+    if flags is None:
+        flags = _type_flags[t] = _compute_flags(functools.partial(issubclass, t), True)
+    return flags
+
+
+def _add_to_mem(x, objmem):
+    if not objmem:
+        objmem = {id(x)}
+    else:
+        objmem.add(id(x))
+    return objmem
+
+
+def _good_field(k: str, v, objmem, keep_private, ignore_methods, ignore_lambda):
+    if not isinstance(k, str):
+        return True
+    if objmem and id(v) in objmem:
+        return False
+    if (ignore_lambda or ignore_methods) and _flags(v) & _FUNCTION:
+        if ignore_lambda and is_lambda_or_partial_function(v):
+            return False
+        if ignore_methods and is_not_lambda_nor_partial_function(v):
+            return False
+    return keep_private or not (k != PYTHON_CLASS_IDENTIFIER and k.startswith("_"))
+
+
+def _adjust_dict(d):
+    if not isinstance(d, dict):
+        return d
+    for a, b in zip(SPECIAL_FIELDS, SPECIAL_FIELDS_SHORT_NAMES):
+        if a in d.keys():
+            if b in d.keys() and d[b] != d[a]:
+                warnings.warn(
+                    f"Field {a} and {b} already exist and are not equal.",
+                    warnings.NegmasSarializationWarning,
+                )
+            d[b] = d[a]
+            del d[b]
+    return d
+
+
+def _get_type_field(value, shorten_type_field):
+    t = value.__class__.__name__
+    if shorten_type_field and t.startswith("negmas."):
+        return t
+    return value.__class__.__module__ + "." + t
+
+
 def serialize(
     value,
     deep=True,
@@ -73,77 +166,54 @@ def serialize(
         - If the `value` object has a `to_dict` member, it will be called to
           do the conversion, otherwise its `__dict__` or `__slots__` member
           will be used.
+        - The checks that depend only on the type of a value are done once per type and cached. None, bools,
+          floats, strings and (not huge) ints are returned as they are without any further checks.
 
     See Also:
           `deserialize`, `PYTHON_CLASS_IDENTIFIER`
 
     """
+    t = type(value)
+    if t in _SIMPLE_TYPES or (t is int and -_MAX_SAFE_INT < value < _MAX_SAFE_INT):
+        return value
+    flags = _flags(value)
 
-    def add_to_mem(x, objmem):
-        if not objmem:
-            objmem = {id(x)}
-        else:
-            objmem.add(id(x))
-        return objmem
-
-    def good_field(k: str, v, objmem):
-        if not isinstance(k, str):
-            return True
-        if objmem and id(v) in objmem:
-            return False
-        if ignore_lambda and is_lambda_or_partial_function(v):
-            return False
-        if ignore_methods and is_not_lambda_nor_partial_function(v):
-            return False
-        if not isinstance(k, str):
-            return False
-        return keep_private or not (k != PYTHON_CLASS_IDENTIFIER and k.startswith("_"))
-
-    def adjust_dict(d):
-        if not isinstance(d, dict):
-            return d
-        for a, b in zip(SPECIAL_FIELDS, SPECIAL_FIELDS_SHORT_NAMES):
-            if a in d.keys():
-                if b in d.keys() and d[b] != d[a]:
-                    warnings.warn(
-                        f"Field {a} and {b} already exist and are not equal.",
-                        warnings.NegmasSarializationWarning,
-                    )
-                d[b] = d[a]
-                del d[b]
-        return d
-
-    if value is None:
-        return None
-
-    def get_type_field(value):
-        t = value.__class__.__name__
-        if shorten_type_field and t.startswith("negmas."):
-            return t
-        return value.__class__.__module__ + "." + t
-
-    if isinstance(value, dict):
+    if flags & _DICT:
         if not deep:
-            return adjust_dict({k: v for k, v in value.items()})
-        return adjust_dict(
+            return _adjust_dict({k: v for k, v in value.items()})
+        return _adjust_dict(
             {
                 k: serialize(v, deep=deep, add_type_field=add_type_field, objmem=objmem)
                 for k, v in value.items()
-                if good_field(k, v, objmem)
+                if _good_field(
+                    k, v, objmem, keep_private, ignore_methods, ignore_lambda
+                )
             }
         )
-    if isinstance(value, Iterable) and not deep:
+    if not deep and isinstance(value, Iterable):
         # add_to_mem(value)
         return value
-    if isinstance(value, type):
+    if flags & _TYPE:
         return TYPE_START + get_full_type_name(value)
-    if isinstance(value, Path):
+    if flags & _PATH:
         return PATH_START + str(value)
     # if isinstance(value, np.ndarray):
     #     return value.tolist()
-    if isinstance(value, (list, tuple)) and not isinstance(value, str):
-        objmem = add_to_mem(value, objmem)
-        return adjust_dict(
+    if flags & _SEQUENCE:
+        objmem = _add_to_mem(value, objmem)
+        if t is list or t is tuple:
+            # short-circuits simple members
+            return t(
+                [
+                    _
+                    if type(_) in _SIMPLE_TYPES
+                    else serialize(
+                        _, deep=deep, add_type_field=add_type_field, objmem=objmem
+                    )
+                    for _ in value
+                ]
+            )
+        return _adjust_dict(
             type(value)(
                 serialize(_, deep=deep, add_type_field=add_type_field, objmem=objmem)
                 for _ in value
@@ -153,13 +223,15 @@ def serialize(
         converted = value.to_dict()  # type: ignore
         if isinstance(converted, dict):
             if add_type_field and (PYTHON_CLASS_IDENTIFIER not in converted.keys()):
-                converted[PYTHON_CLASS_IDENTIFIER] = get_type_field(value)
-            return adjust_dict({k: v for k, v in converted.items()})
+                converted[PYTHON_CLASS_IDENTIFIER] = _get_type_field(
+                    value, shorten_type_field
+                )
+            return _adjust_dict({k: v for k, v in converted.items()})
         else:
-            return adjust_dict(converted)
-    if isinstance(value, str):
+            return _adjust_dict(converted)
+    if flags & _STR:
         return value
-    if isinstance(value, bytes):
+    if flags & _BYTES:
         if (
             value.startswith(FUNCTION_START)
             or value.startswith(LAMBDA_START)
@@ -173,43 +245,46 @@ def serialize(
             )
         return value
 
-    if is_lambda_or_partial_function(value):
-        return LAMBDA_START + cloudpickle.dumps(value)
+    if flags & _FUNCTION:
+        if is_lambda_or_partial_function(value):
+            return LAMBDA_START + cloudpickle.dumps(value)
 
-    if is_not_lambda_nor_partial_function(value):
-        return FUNCTION_START + cloudpickle.dumps(value)
+        if is_not_lambda_nor_partial_function(value):
+            return FUNCTION_START + cloudpickle.dumps(value)
 
     if hasattr(value, "__dict__"):
         if deep:
-            objmem = add_to_mem(value, objmem)
+            objmem = _add_to_mem(value, objmem)
             d = {
                 k: serialize(v, deep=deep, add_type_field=add_type_field, objmem=objmem)
                 for k, v in value.__dict__.items()
-                if good_field(k, v, objmem)
+                if _good_field(
+                    k, v, objmem, keep_private, ignore_methods, ignore_lambda
+                )
             }
         else:
-            d = {k: v for k, v in value.__dict__.items() if good_field(k, v, objmem)}
+            d = {
+                k: v
+                for k, v in value.__dict__.items()
+                if _good_field(
+                    k, v, objmem, keep_private, ignore_methods, ignore_lambda
+                )
+            }
         if add_type_field:
-            d[PYTHON_CLASS_IDENTIFIER] = get_type_field(value)
-        return adjust_dict(d)
+            d[PYTHON_CLASS_IDENTIFIER] = _get_type_field(value, shorten_type_field)
+        return _adjust_dict(d)
 
     if hasattr(value, "__slots__"):
         if deep:
-            objmem = add_to_mem(value, objmem)
-            d = dict(
-                zip(
-                    (k for k in value.__slots__),  # type: ignore
-                    (
-                        serialize(
-                            getattr(value, _),
-                            deep=deep,
-                            add_type_field=add_type_field,
-                            objmem=objmem,
-                        )
-                        for _ in value.__slots__  # type: ignore
-                    ),
+            objmem = _add_to_mem(value, objmem)
+            d = {
+                k: v
+                if type(v := getattr(value, k)) in _SIMPLE_TYPES
+                else serialize(
+                    v, deep=deep, add_type_field=add_type_field, objmem=objmem
                 )
-            )
+                for k in value.__slots__  # type: ignore
+            }
         else:
             d = dict(
                 zip(
@@ -218,12 +293,12 @@ def serialize(
                 )
             )
         if add_type_field:
-            d[PYTHON_CLASS_IDENTIFIER] = get_type_field(value)
-        return adjust_dict(d)
-    if isinstance(value, np.int64):  # type: ignore
+            d[PYTHON_CLASS_IDENTIFIER] = _get_type_field(value, shorten_type_field)
+        return _adjust_dict(d)
+    if flags & _INT64:  # type: ignore
         return int(value)
     # a builtin
-    if is_jsonable(value):
+    if flags & _FLOAT or is_jsonable(value):
         return value
     try:
         vv = CLOUDPICKLE_START + cloudpickle.dumps(value)
@@ -267,6 +342,8 @@ def to_flat_dict(
     for k, v in d.items():
         if isinstance(v, list) or isinstance(v, tuple):
             d[k] = str(v)
+    from pandas import json_normalize
+
     return json_normalize(d, errors="ignore", sep="_").to_dict(orient="records")[0]
 
 
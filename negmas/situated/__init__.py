@@ -85,6 +85,7 @@ from .mechanismfactory import *
 from .mixins import *
 from .monitors import *
 from .save import *
+from .stats import *
 from .world import *
 from .simple import *
 from .neg import *
@@ -104,6 +105,7 @@ __all__ = (
     + mixins.__all__
     + monitors.__all__
     + save.__all__
+    + stats.__all__
     + world.__all__
     + simple.__all__
     + neg.__all__
@@ -369,6 +369,8 @@ class AgentWorldInterface:
             - If a set of sections is given, and two records in different sections had the same key, only one of them
               will be returned
             - Key queries use regular expressions and match from the beginning using the standard re.match function
+            - Querying a single section with a `None` query returns a read-only snapshot of the section. Records
+              themselves are not copied and must not be modified.
 
         """
         if not self._world.bulletin_board:
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 import re
 import uuid
 from typing import Any, Callable, Iterable
@@ -10,6 +9,31 @@ from negmas.helpers.inout import ConfigReader
 __all__ = ["BulletinBoard"]
 
 
+def _readonly(self, *args, **kwargs):
+    raise TypeError("Bulletin-board snapshots are read-only")
+
+
+class _Snapshot(dict):
+    """A read-only copy of a section of the bulletin-board (records are shared, not copied)"""
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+
+    def __reduce__(self):
+        return _Snapshot, (dict(self),)
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self)
+
+
+def _hashable(x: Any) -> bool:
+    try:
+        hash(x)
+    except TypeError:
+        return False
+    return True
+
+
 class BulletinBoard(EventSource, ConfigReader):
     """
     The bulletin-board which carries all public information. It consists of sections each with a dictionary of records.
@@ -31,18 +55,178 @@ class BulletinBoard(EventSource, ConfigReader):
         """
         super().__init__()
         self._data: dict[str, dict[str, Any]] = {}
-
-    def add_section(self, name: str) -> None:
+        # section -> field -> field value -> keys of records with this value
+        self._indexes: dict[str, dict[str, dict[Any, dict[str, None]]]] = {}
+        # section -> key -> (field, value) pairs the record was indexed under (records may be changed in place)
+        self._indexed: dict[str, dict[str, list[tuple[str, Any]]]] = {}
+        # section -> keys of records that cannot be indexed (not dicts or unhashable fields)
+        self._unindexed: dict[str, dict[str, None]] = {}
+        # section -> value -> keys (hashable values) and section -> id(value) -> key (others)
+        self._by_value: dict[str, dict[Any, dict[str, None]]] = {}
+        self._by_id: dict[str, dict[int, str]] = {}
+        # section -> read-only copy returned by `query(section, None)` until the section changes
+        self._snapshots: dict[str, _Snapshot] = {}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if any(
+            _ not in state
+            for _ in ("_indexes", "_indexed", "_unindexed", "_by_value", "_snapshots")
+        ):
+            # pickled by an older version: records are added again (keeping the indexed fields if known)
+            fields = {k: list(v) for k, v in state.get("_indexes", {}).items()}
+            data, self._data = self._data, {}
+            self._indexes, self._indexed, self._unindexed = {}, {}, {}
+            self._by_value, self._by_id, self._snapshots = {}, {}, {}
+            for section, records in data.items():
+                self.add_section(section, fields.get(section, ()))
+                for key, value in records.items():
+                    self._add_record(section, key, value)
+            return
+        # object ids are not preserved by pickling
+        self._by_id = {
+            section: {id(v): k for k, v in sec.items() if not _hashable(v)}
+            for section, sec in self._data.items()
+        }
+
+    def add_section(self, name: str, indexes: Iterable[str] = ()) -> None:
         """
         Adds a section to the bulletin Board
 
         Args:
             name: Section name
+            indexes: Fields of (dict) records to index. Queries on indexed fields do not scan the section.
 
         Returns:
 
         """
         self._data[name] = {}
+        self._indexes[name] = {}
+        self._indexed[name] = {}
+        self._unindexed[name] = {}
+        self._by_value[name] = {}
+        self._by_id[name] = {}
+        self._snapshots.pop(name, None)
+        for field in indexes:
+            self.add_index(name, field)
+
+    def add_index(self, section: str, field: str) -> None:
+        """
+        Indexes a field of the records of a section
+
+        Args:
+            section: Section name
+            field: The field (key of dict records) to index
+
+        Remarks:
+
+            - Queries (dicts) that condition on at least one indexed field only check records with matching values.
+            - Records that are not dicts or have unhashable values for an indexed field are always checked.
+            - A record changed in place must be recorded again (with the same key) to update the indexes.
+        """
+        indexes = self._indexes.setdefault(section, {})
+        if field in indexes:
+            return
+        indexes[field] = {}
+        for k, v in self._data[section].items():
+            self._index_record(section, k, v, (field,))
+
+    def _index_record(self, section: str, key: str, value: Any, fields) -> None:
+        indexes = self._indexes[section]
+        if not isinstance(value, dict):
+            if fields:
+                self._unindexed[section][key] = None
+            return
+        indexed = self._indexed.setdefault(section, {})
+        for field in fields:
+            x = value.get(field, None)
+            if not _hashable(x):
+                self._unindexed[section][key] = None
+                continue
+            indexes[field].setdefault(x, {})[key] = None
+            indexed.setdefault(key, []).append((field, x))
+
+    def _add_record(self, section: str, key: str, value: Any) -> None:
+        sec = self._data[section]
+        if key in sec:
+            self._pop_record(section, key)
+        sec[key] = value
+        self._snapshots.pop(section, None)
+        if section not in self._indexes:
+            # the section was created directly in `data`
+            self._indexes[section], self._unindexed[section] = {}, {}
+            self._indexed[section] = {}
+            self._by_value[section], self._by_id[section] = {}, {}
+        self._index_record(section, key, value, self._indexes[section].keys())
+        if _hashable(value):
+            self._by_value[section].setdefault(value, {})[key] = None
+        else:
+            self._by_id[section][id(value)] = key
+
+    def _pop_record(self, section: str, key: str) -> None:
+        sec = self._data[section]
+        value = sec.pop(key)
+        self._snapshots.pop(section, None)
+        if section not in self._indexes:
+            return
+        self._unindexed[section].pop(key, None)
+        # the values the record was indexed under (it may have been changed in place since)
+        indexes = self._indexes[section]
+        for field, x in self._indexed.get(section, {}).pop(key, ()):
+            index = indexes[field]
+            keys = index.get(x, None)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del index[x]
+        if _hashable(value):
+            keys = self._by_value[section].get(value, None)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._by_value[section][value]
+        elif self._by_id[section].get(id(value), None) == key:
+            del self._by_id[section][id(value)]
+
+    def _key_of(self, section: str, value: Any) -> str | None:
+        sec = self._data[section]
+        if section in self._indexes:
+            if _hashable(value):
+                keys = self._by_value[section].get(value, None)
+                if keys:
+                    return next(iter(keys))
+            else:
+                key = self._by_id[section].get(id(value), None)
+                if key is not None and sec.get(key, None) is value:
+                    return key
+            if _hashable(value):
+                return None
+        for k, v in sec.items():
+            if v == value:
+                return k
+        return None
+
+    def _candidates(self, section: str, query: dict) -> Iterable[str] | None:
+        indexes = self._indexes.get(section, None)
+        if not indexes:
+            return None
+        best = None
+        for field, x in query.items():
+            index = indexes.get(field, None)
+            if index is None or not _hashable(x):
+                continue
+            keys = index.get(x, None)
+            if not keys:
+                best = ()
+                break
+            if best is None or len(keys) < len(best):
+                best = keys
+        if best is None:
+            return None
+        unindexed = self._unindexed[section]
+        if not unindexed:
+            return best
+        return list(best) + [_ for _ in unindexed if _ not in best]
 
     def query(
         self, section: str | list[str] | None, query: Any, query_keys=False
@@ -66,6 +250,9 @@ class BulletinBoard(EventSource, ConfigReader):
             - If a set of sections is given, and two records in different sections had the same key, only one of them
               will be returned
             - Key queries use regular expressions and match from the beginning using the standard re.match function
+            - Querying a single section with a `None` query returns a read-only snapshot of the section. Records
+              themselves are not copied and must not be modified.
+            - Dict queries on fields indexed using `add_index` (or `add_section`) only check matching records.
 
         """
         if section is None:
@@ -93,9 +280,18 @@ class BulletinBoard(EventSource, ConfigReader):
         if sec is None:
             return {}
         if query is None:
-            return copy.deepcopy(sec)
+            snapshot = self._snapshots.get(section, None)
+            if snapshot is None:
+                snapshot = self._snapshots[section] = _Snapshot(sec)
+            return snapshot
         if query_keys:
             return {k: v for k, v in sec.items() if re.match(str(query), k) is not None}
+        if isinstance(query, dict):
+            keys = self._candidates(section, query)
+            if keys is not None:
+                return {
+                    k: sec[k] for k in keys if BulletinBoard.satisfies(sec[k], query)
+                }
         return {k: v for k, v in sec.items() if BulletinBoard.satisfies(v, query)}
 
     @classmethod
@@ -140,6 +336,10 @@ class BulletinBoard(EventSource, ConfigReader):
             key: The key
             value: The value
 
+        Remarks:
+            - Recording a value under an existing key replaces it. This is also how a record changed in place
+              is re-indexed (see `add_index`).
+
         """
         if key is None:
             try:
@@ -148,7 +348,7 @@ class BulletinBoard(EventSource, ConfigReader):
                 skey = str(uuid.uuid4())
         else:
             skey = key
-        self._data[section][skey] = value
+        self._add_record(section, skey, value)
         self.announce(
             Event("new_record", data={"section": section, "key": skey, "value": value})
         )
@@ -193,10 +393,7 @@ class BulletinBoard(EventSource, ConfigReader):
         if sec is None:
             return False
         if value is not None:
-            for k, v in sec.items():
-                if v == value:
-                    key = k
-                    break
+            key = self._key_of(section, value)
         if key is not None:
             try:
                 self.announce(
@@ -205,7 +402,7 @@ class BulletinBoard(EventSource, ConfigReader):
                         data={"section": sec, "key": key, "value": sec[key]},
                     )
                 )
-                sec.pop(key, None)
+                self._pop_record(section, key)
                 return True
             except KeyError:
                 return False
@@ -226,7 +423,8 @@ class BulletinBoard(EventSource, ConfigReader):
                     data={"section": sec, "key": k, "value": sec[k]},
                 )
             )
-            sec.pop(k, None)
+            if k in sec:
+                self._pop_record(section, k)
         return True
 
     @property
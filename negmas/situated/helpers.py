@@ -1,9 +1,10 @@
 from __future__ import annotations
 from collections import defaultdict
+from typing import Any
 
 from .common import EDGE_COLORS, EDGE_TYPES
 
-__all__ = ["safe_min", "deflistdict", "show_edge_colors"]
+__all__ = ["safe_min", "deflistdict", "show_edge_colors", "ContractRecords"]
 
 
 def safe_min(a, b):
@@ -19,6 +20,92 @@ def deflistdict():
     return defaultdict(list)
 
 
+class ContractRecords(dict):
+    """
+    A dictionary of contract records (mapping contract IDs to records) that keeps running counts of its records.
+
+    Remarks:
+        - `n_signed` is the number of records with a nonnegative `signed_at` and `n_with_issues` is the number
+          of records with some `issues`.
+        - Counts are updated when records are added, replaced or removed. Changing the `signed_at` or `issues` of
+          a record already stored invalidates them (call `recount` after doing so).
+        - `keys_added` lists the IDs in the order they were added (an ID removed then added again appears twice)
+          so that new records can be found without scanning all records.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.keys_added: list[str] = []
+        super().__init__()
+        self.recount()
+        self.update(*args, **kwargs)
+
+    @staticmethod
+    def _counts(record: dict[str, Any]) -> tuple[int, int]:
+        return int(record.get("signed_at", -1) >= 0), int(bool(record.get("issues")))
+
+    def recount(self) -> None:
+        """Recalculates the counts by scanning all records"""
+        self.n_signed, self.n_with_issues = 0, 0
+        for record in self.values():
+            signed, with_issues = self._counts(record)
+            self.n_signed += signed
+            self.n_with_issues += with_issues
+
+    def _discount(self, record: dict[str, Any]) -> None:
+        signed, with_issues = self._counts(record)
+        self.n_signed -= signed
+        self.n_with_issues -= with_issues
+
+    def __setitem__(self, key: str, record: dict[str, Any]) -> None:
+        old = self.get(key, None)
+        if old is not None:
+            self._discount(old)
+        elif key not in self:
+            self.keys_added.append(key)
+        super().__setitem__(key, record)
+        signed, with_issues = self._counts(record)
+        self.n_signed += signed
+        self.n_with_issues += with_issues
+
+    def __delitem__(self, key: str) -> None:
+        self._discount(self[key])
+        super().__delitem__(key)
+
+    def pop(self, key: str, *args):
+        if key in self:
+            self._discount(self[key])
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, record = super().popitem()
+        self._discount(record)
+        return key, record
+
+    def setdefault(self, key: str, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.n_signed, self.n_with_issues = 0, 0
+        self.keys_added = []
+
+    def __reduce__(self):
+        return ContractRecords, (dict(self),), dict(keys_added=self.keys_added)
+
+    def copy(self) -> ContractRecords:
+        return ContractRecords(self)
+
+
 def show_edge_colors():
     """Plots the edge colors used with their meaning"""
     import matplotlib.pyplot as plt
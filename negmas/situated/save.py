@@ -1,6 +1,8 @@
 from __future__ import annotations
 import json
 import os
+from collections import defaultdict
+from itertools import islice
 from os import PathLike
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -13,7 +15,7 @@ from negmas.serialization import serialize
 if TYPE_CHECKING:
     from .world import World
 
-__all__ = ["save_stats"]
+__all__ = ["save_stats", "IncrementalStatsWriter"]
 
 
 def save_stats(
@@ -36,52 +38,13 @@ def save_stats(
 
     """
 
-    def is_json_serializable(x):
-        try:
-            json.dumps(x)
-        except Exception:
-            return False
-        return True
-
     logdir_ = Path(log_dir)
     os.makedirs(logdir_, exist_ok=True)
     if params is None:
-        d: dict = serialize(world, add_type_field=False, deep=False)  # type: ignore
-        to_del = []
-        for k, v in d.items():
-            if isinstance(v, list) or isinstance(v, tuple):
-                d[k] = str(v)
-            if not is_json_serializable(v):
-                to_del.append(k)
-        for k in to_del:
-            del d[k]
-        params = d
+        params = _world_params(world)
     if stats_file_name is None:
         stats_file_name = "stats"
-    agents: dict[str, dict[str, Any]] = {
-        k: dict(id=a.id, name=a.name, type=a.type_name, short_type=a.short_type_name)
-        for k, a in world.agents.items()
-    }
-    for k, v in agents.items():
-        agents[k]["neg_requests_sent"] = world.neg_requests_sent[k]
-        agents[k]["neg_requests_received"] = world.neg_requests_received[k]
-        agents[k]["neg_requests_rejected"] = world.neg_requests_rejected[k]
-        agents[k]["negs_registered"] = world.negs_registered[k]
-        agents[k]["negs_initiated"] = world.negs_initiated[k]
-        agents[k]["negs_succeeded"] = world.negs_succeeded[k]
-        agents[k]["negs_failed"] = world.negs_failed[k]
-        agents[k]["negs_timedout"] = world.negs_timedout[k]
-        agents[k]["contracts_concluded"] = world.contracts_concluded[k]
-        agents[k]["contracts_signed"] = world.contracts_signed[k]
-        agents[k]["contracts_dropped"] = world.contracts_dropped[k]
-        agents[k]["breaches_received"] = world.breaches_received[k]
-        agents[k]["breaches_committed"] = world.breaches_committed[k]
-        agents[k]["contracts_erred"] = world.contracts_erred[k]
-        agents[k]["contracts_nullified"] = world.contracts_nullified[k]
-        agents[k]["contracts_executed"] = world.contracts_executed[k]
-        agents[k]["contracts_breached"] = world.contracts_breached[k]
-
-    dump(agents, logdir_ / "agents")
+    _save_agents(world, logdir_)
     with open(logdir_ / "params.json", "w") as f_:
         f_.write(str(serialize(params)))
 
@@ -93,7 +56,7 @@ def save_stats(
     if hasattr(world, "info") and world.info is not None:
         dump(world.info, logdir_ / "info")
 
-    data = pd.DataFrame.from_dict(world.stats)
+    data = world.stats_df
     data.to_csv(str(logdir_ / f"{stats_file_name}.csv"), index_label="index")
 
     if world.save_negotiations:
@@ -141,3 +104,193 @@ def save_stats(
         else:
             with open(logdir_ / "contracts.csv", "w") as f:
                 f.write("")
+
+
+def _world_params(world: World) -> dict[str, Any]:
+    def is_json_serializable(x):
+        try:
+            json.dumps(x)
+        except Exception:
+            return False
+        return True
+
+    d: dict = serialize(world, add_type_field=False, deep=False)  # type: ignore
+    to_del = []
+    for k, v in d.items():
+        if isinstance(v, list) or isinstance(v, tuple):
+            d[k] = str(v)
+        if not is_json_serializable(v):
+            to_del.append(k)
+    for k in to_del:
+        del d[k]
+    return d
+
+
+def _save_agents(world: World, logdir_: Path) -> None:
+    agents: dict[str, dict[str, Any]] = {
+        k: dict(id=a.id, name=a.name, type=a.type_name, short_type=a.short_type_name)
+        for k, a in world.agents.items()
+    }
+    for k, v in agents.items():
+        agents[k]["neg_requests_sent"] = world.neg_requests_sent[k]
+        agents[k]["neg_requests_received"] = world.neg_requests_received[k]
+        agents[k]["neg_requests_rejected"] = world.neg_requests_rejected[k]
+        agents[k]["negs_registered"] = world.negs_registered[k]
+        agents[k]["negs_initiated"] = world.negs_initiated[k]
+        agents[k]["negs_succeeded"] = world.negs_succeeded[k]
+        agents[k]["negs_failed"] = world.negs_failed[k]
+        agents[k]["negs_timedout"] = world.negs_timedout[k]
+        agents[k]["contracts_concluded"] = world.contracts_concluded[k]
+        agents[k]["contracts_signed"] = world.contracts_signed[k]
+        agents[k]["contracts_dropped"] = world.contracts_dropped[k]
+        agents[k]["breaches_received"] = world.breaches_received[k]
+        agents[k]["breaches_committed"] = world.breaches_committed[k]
+        agents[k]["contracts_erred"] = world.contracts_erred[k]
+        agents[k]["contracts_nullified"] = world.contracts_nullified[k]
+        agents[k]["contracts_executed"] = world.contracts_executed[k]
+        agents[k]["contracts_breached"] = world.contracts_breached[k]
+
+    dump(agents, logdir_ / "agents")
+
+
+class IncrementalStatsWriter:
+    """
+    Saves the statistics of a running world incrementally.
+
+    Each call to `append` only appends the rows produced since the previous call to stats, negotiations,
+    breaches and contracts files (world parameters are written once). `compact` rewrites all files from
+    the current state of the world producing exactly the same files as `save_stats`.
+
+    Args:
+        world: The world
+        log_dir: The directory to save the stats into.
+        params: A parameter list to save with the world
+        stats_file_name: File name to use for stats file(s) without extension
+
+    Remarks:
+        - Records changed after being appended (e.g. contracts executed or breached later) are only
+          updated in the files by `compact` which should be called when the world ends.
+        - If new columns appear in a file, it is rewritten completely once.
+    """
+
+    def __init__(
+        self,
+        world: World,
+        log_dir: PathLike | str,
+        params: dict[str, Any] | None = None,
+        stats_file_name: str | None = None,
+    ):
+        self.world = world
+        self.log_dir = Path(log_dir)
+        self.params = params
+        self.stats_file_name = stats_file_name if stats_file_name else "stats"
+        self._columns: dict[str, list[str]] = dict()
+        self._n_written: dict[str, int] = defaultdict(int)
+        self._written_contracts: set[str] = set()
+        self._n_contracts_added = 0
+        self._started = False
+        self._compacted = False
+
+    def _write(self, name: str, data: pd.DataFrame, full: bool) -> bool:
+        """Writes (or appends) the data returning `False` if it has unknown columns"""
+        path = self.log_dir / f"{name}.csv"
+        columns = self._columns.get(name, None)
+        if full or columns is None:
+            data.to_csv(str(path), index_label="index")
+            self._columns[name] = list(data.columns)
+            return True
+        if not set(data.columns).issubset(columns):
+            return False
+        data.reindex(columns=columns).to_csv(str(path), mode="a", header=False)
+        return True
+
+    def _append_records(self, name: str, records: dict[str, dict[str, Any]]) -> None:
+        n = self._n_written[name]
+        if n == 0 and not records:
+            if not (self.log_dir / f"{name}.csv").exists():
+                with open(self.log_dir / f"{name}.csv", "w") as f:
+                    f.write("")
+            return
+        if len(records) <= n:
+            return
+        data = pd.DataFrame(list(islice(records.values(), n, None)))
+        data.index = range(n, n + len(data))
+        if not self._write(name, data, full=False):
+            self._write(name, pd.DataFrame(list(records.values())), full=True)
+        self._n_written[name] = len(records)
+
+    def _append_stats(self) -> None:
+        stats = self.world.stats_arrays
+        n = self._n_written["stats"]
+        n_rows = max((len(_) for _ in stats.values()), default=0)
+        if n_rows <= n and n > 0:
+            return
+        data = pd.DataFrame({k: v[n:] for k, v in stats.items()})
+        data.index = range(n, n + len(data))
+        if not self._write(self.stats_file_name, data, full=n == 0):
+            self._write(self.stats_file_name, pd.DataFrame.from_dict(stats), full=True)
+        self._n_written["stats"] = n_rows
+
+    def _append_contracts(self) -> None:
+        records = self.world._saved_contracts
+        added = records.keys_added
+        if self._n_contracts_added > len(added):
+            # the records were cleared
+            self._n_contracts_added = 0
+        # only contracts added since the last call are checked
+        new = {
+            k: records[k]
+            for k in added[self._n_contracts_added :]
+            if k in records and k not in self._written_contracts
+        }
+        self._n_contracts_added = len(added)
+        n = len(self._written_contracts)
+        if n == 0 and not new:
+            if not (self.log_dir / "contracts.csv").exists():
+                with open(self.log_dir / "contracts.csv", "w") as f:
+                    f.write("")
+            return
+        if not new:
+            return
+        data = pd.DataFrame(list(new.values()))
+        data.index = range(n, n + len(data))
+        if not self._write("contracts", data, full=False):
+            self._write("contracts", pd.DataFrame(list(records.values())), full=True)
+        self._written_contracts.update(new.keys())
+
+    def append(self) -> None:
+        """Appends all rows produced since the last call"""
+        world = self.world
+        self._compacted = False
+        if not self._started:
+            os.makedirs(self.log_dir, exist_ok=True)
+            params = self.params if self.params is not None else _world_params(world)
+            with open(self.log_dir / "params.json", "w") as f_:
+                f_.write(str(serialize(params)))
+            self._started = True
+        _save_agents(world, self.log_dir)
+        if world.info is not None:
+            dump(world.info, self.log_dir / "info")
+        self._append_stats()
+        if world.save_negotiations:
+            self._append_records("negotiations", world._saved_negotiations)
+        if world.save_resolved_breaches or world.save_unresolved_breaches:
+            self._append_records("breaches", world._saved_breaches)
+        if world.save_signed_contracts or world.save_cancelled_contracts:
+            self._append_contracts()
+
+    def compact(self) -> None:
+        """Rewrites all files from the current state of the world (same output as `save_stats`)"""
+        if self._compacted:
+            return
+        save_stats(
+            self.world,
+            self.log_dir,
+            params=self.params,
+            stats_file_name=self.stats_file_name,
+        )
+        self._columns.clear()
+        self._n_written.clear()
+        self._written_contracts.clear()
+        self._started = False
+        self._compacted = True
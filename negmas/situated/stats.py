@@ -0,0 +1,194 @@
+"""
+Storage of world statistics backed by preallocated NumPy arrays.
+"""
+
+from __future__ import annotations
+
+from numbers import Integral, Real
+from os import PathLike
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["StatsColumn", "StatsStore"]
+
+MIN_CAPACITY = 64
+"""Initial capacity of columns when the number of steps is not known"""
+MAX_PREALLOCATED = 100_000
+"""Maximum number of values preallocated for a column (columns grow beyond that when needed)"""
+
+
+def _kind(value: Any) -> str:
+    """The dtype kind needed to store a value (b, i, f or O)"""
+    if isinstance(value, (bool, np.bool_)):
+        return "b"
+    if isinstance(value, Integral):
+        return "i"
+    if value is None or isinstance(value, Real):
+        return "f"
+    return "O"
+
+
+_DTYPES = {"b": np.bool_, "i": np.int64, "f": np.float64, "O": object}
+
+
+class StatsColumn:
+    """
+    The values of a single statistic (one per step) stored in a preallocated NumPy array.
+
+    Args:
+        capacity: Number of values to preallocate. The array grows geometrically when full.
+        values: Initial values
+
+    Remarks:
+        - The column behaves like an append-only list (`append`, `extend`, `len`, indexing and iteration).
+        - The dtype is inferred from the values: bool, int64 or float64 for numbers and object otherwise.
+          Appending a value that does not fit the current dtype converts the column.
+        - `values` returns a read-only view. Appending never changes values already in a view so views can
+          safely be kept as snapshots.
+    """
+
+    __slots__ = ("_data", "_n")
+
+    def __init__(self, capacity: int = MIN_CAPACITY, values: Iterable = ()):
+        self._data: np.ndarray = np.empty(max(capacity, 1), dtype=np.float64)
+        self._n = 0
+        self.extend(values)
+
+    def _convert(self, kind: str) -> None:
+        current = self._data.dtype.kind
+        if self._n == 0:
+            self._data = np.empty(len(self._data), dtype=_DTYPES[kind])
+            return
+        kind = "f" if {current, kind} == {"i", "f"} else "O"
+        data = np.empty(len(self._data), dtype=_DTYPES[kind])
+        data[: self._n] = self._data[: self._n]
+        self._data = data
+
+    def append(self, value: Any) -> None:
+        if self._n >= len(self._data):
+            data = np.empty(max(2 * len(self._data), MIN_CAPACITY), self._data.dtype)
+            data[: self._n] = self._data[: self._n]
+            self._data = data
+        kind, current = _kind(value), self._data.dtype.kind
+        if kind != current and (
+            self._n == 0 or (current != "O" and not (kind == "i" and current == "f"))
+        ):
+            self._convert(kind)
+        try:
+            self._data[self._n] = value
+        except OverflowError:
+            self._convert("O")
+            self._data[self._n] = value
+        self._n += 1
+
+    def extend(self, values: Iterable) -> None:
+        for value in values:
+            self.append(value)
+
+    @property
+    def values(self) -> np.ndarray:
+        """A read-only view of the values"""
+        view = self._data[: self._n]
+        view.flags.writeable = False
+        return view
+
+    def padded(self, n: int) -> np.ndarray:
+        """Returns the values padded with NaN to length `n` (a read-only view if no padding is needed)"""
+        if self._n >= n:
+            return self.values
+        kind = self._data.dtype.kind
+        data = np.full(n, np.nan, dtype=np.float64 if kind in "if" else object)
+        data[: self._n] = self._data[: self._n]
+        data.flags.writeable = False
+        return data
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, item):
+        return self.values[item]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __repr__(self) -> str:
+        return f"StatsColumn({self.values.tolist()})"
+
+    def __getstate__(self):
+        return self.values.copy()
+
+    def __setstate__(self, state):
+        self._data, self._n = np.array(state), len(state)
+
+
+class StatsStore(dict):
+    """
+    A dictionary mapping statistic names to `StatsColumn` s (created on first access like a `defaultdict`).
+
+    Args:
+        n_steps: The expected number of values per statistic (used to preallocate columns). `None` if unknown.
+
+    Remarks:
+        - Assigning any iterable to a key stores its values in a new column.
+        - `views` returns read-only arrays padded to the same length (the format of `World.stats`).
+    """
+
+    def __init__(self, n_steps: int | None = None):
+        super().__init__()
+        self.n_steps = n_steps
+
+    @property
+    def capacity(self) -> int:
+        """The number of values preallocated for new columns"""
+        if not self.n_steps or self.n_steps < 0:
+            return MIN_CAPACITY
+        return min(int(self.n_steps), MAX_PREALLOCATED)
+
+    def __missing__(self, key: str) -> StatsColumn:
+        column = StatsColumn(self.capacity)
+        super().__setitem__(key, column)
+        return column
+
+    def __setitem__(self, key: str, values: Iterable) -> None:
+        if not isinstance(values, StatsColumn):
+            values = StatsColumn(self.capacity, values)
+        super().__setitem__(key, values)
+
+    def update(self, *args, **kwargs) -> None:
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def __reduce__(self):
+        return _make_store, (self.n_steps, dict(self))
+
+    @property
+    def length(self) -> int:
+        """The number of values in the longest column"""
+        return max((len(_) for _ in self.values()), default=0)
+
+    def views(self) -> dict[str, np.ndarray]:
+        """Returns read-only arrays of all statistics padded with NaN to the same length"""
+        n = self.length
+        return {k: v.padded(n) for k, v in self.items()}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Returns all statistics as a dataframe with one row per step"""
+        return pd.DataFrame.from_dict(self.views())
+
+    def to_parquet(self, path: PathLike | str, **kwargs) -> None:
+        """
+        Saves all statistics to a parquet file.
+
+        Remarks:
+            - Needs a parquet engine (pyarrow or fastparquet) to be installed.
+            - Extra keyword arguments are passed to `pandas.DataFrame.to_parquet`.
+        """
+        self.to_dataframe().to_parquet(path, **kwargs)
+
+
+def _make_store(n_steps: int | None, columns: dict[str, StatsColumn]) -> StatsStore:
+    store = StatsStore(n_steps)
+    store.update(columns)
+    return store
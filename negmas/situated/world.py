@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 import itertools
 import logging
 import math
@@ -10,6 +9,8 @@ import time
 import traceback
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable, Generic, TypeVar
 
@@ -26,9 +27,11 @@ from negmas.config import negmas_config
 from negmas.events import Event, EventLogger, EventSink, EventSource
 from negmas.genius import ANY_JAVA_PORT, DEFAULT_JAVA_PORT, get_free_tcp_port
 from negmas.helpers import (
+    LogPipeline,
     create_loggers,
     exception2str,
     get_class,
+    get_log_pipeline,
     humanize_time,
     unique_name,
 )
@@ -54,19 +57,19 @@ from .common import (
 )
 from .contract import Contract
 from .entity import Entity
-from .helpers import deflistdict
+from .helpers import ContractRecords, deflistdict
 from .mechanismfactory import MechanismFactory
 from .monitors import StatsMonitor, WorldMonitor
-from .save import save_stats
+from .save import IncrementalStatsWriter
+from .stats import StatsStore
 from .awi import AgentWorldInterface
 
 if TYPE_CHECKING:
+    import networkx as nx
     from matplotlib.axes import Axes
 
-try:
-    import networkx as nx
-except ImportError:
-    nx = None
+# networkx is imported only when graphs are generated because importing it is slow
+_HAS_NETWORKX = find_spec("networkx") is not None
 
 __all__ = ["World"]
 
@@ -174,7 +177,8 @@ class World(
         ignore_simulation_exceptions: Ignore simulation exceptions and keep running
         ignore_contract_execution_exceptions: Ignore contract execution exceptions and keep running
         safe_stats_monitoring: Never throw an exception for a failure to save stats or because of a Stats Monitor
-                               object
+                               object. Stats monitors receive copies of the stats (as lists) instead of read-only
+                               arrays (see `stats_arrays`).
 
         * Checkpoints *
 
@@ -186,7 +190,22 @@ class World(
         extra_checkpoint_info: Any extra information to save with the checkpoint in the corresponding json file as
                                a dictionary with string keys
         exist_ok: IF true, checkpoints override existing checkpoints with the same filename.
+        checkpoint_compression: Compression method for checkpoints (gzip, bz2, lzma, zstd or lz4). None for no compression.
+        checkpoint_background: Write checkpoints in a background "thread" or a forked process ("fork") instead of
+                               stalling the simulation. None to write them synchronously.
+        checkpoint_differential: If positive (and single_checkpoint is False), every full checkpoint is followed by
+                                 this number of differential checkpoints storing only the changes from it.
+        checkpoint_zero_copy: If true, numpy arrays are saved in checkpoints as separate blobs that are memory-mapped
+                              instead of copied when the checkpoint is loaded.
         genius_port: the port used to connect to Genius for all negotiators in this mechanism (0 means any).
+        parallel_negotiations: Number of threads used to step negotiations concurrently (0 or 1 to step them serially).
+                               Mechanisms sharing an agent are always stepped by the same thread and all world
+                               bookkeeping (contracts, edges, callbacks) is merged in the main thread in the same order
+                               used when stepping serially. Agents must tolerate their negotiators in *different*
+                               negotiations running concurrently with each other.
+        log_max_bytes: If positive, log files (of the world and its agents) are rotated when they reach this size
+        log_backup_count: Number of rotated log files to keep (when `log_max_bytes` is positive)
+        log_compress: If given, rotated log files are compressed with gzip
     """
 
     def __init__(
@@ -254,6 +273,14 @@ class World(
         debug: bool = False,
         name: str | None = None,
         id: str | None = None,
+        parallel_negotiations: int = 0,
+        checkpoint_compression: str | None = None,
+        checkpoint_background: str | None = None,
+        checkpoint_differential: int = 0,
+        checkpoint_zero_copy: bool = False,
+        log_max_bytes: int = 0,
+        log_backup_count: int = 0,
+        log_compress: bool = False,
     ):
         self._debug = debug
         if debug:
@@ -279,6 +306,10 @@ class World(
             info=extra_checkpoint_info,
             exist_ok=exist_ok,
             single=single_checkpoint,
+            compression=checkpoint_compression,
+            background=checkpoint_background,
+            differential=checkpoint_differential,
+            zero_copy=checkpoint_zero_copy,
         )
         self.name = (
             name.replace("/", ".")
@@ -325,17 +356,8 @@ class World(
         self.log_screen_level = log_screen_level
         self.log_to_screen = log_to_screen
         self.log_negotiations = log_negotiations
-        self.logger = (
-            create_loggers(
-                file_name=self.log_file_name,
-                module_name=None,
-                screen_level=log_screen_level if log_to_screen else None,
-                file_level=log_file_level,
-                app_wide_log_file=True,
-            )
-            if not no_logs
-            else None
-        )
+        self._log_rotation = (log_max_bytes, log_backup_count, log_compress)
+        self.logger = self._create_logger() if not no_logs else None
         self.ignore_contract_execution_exceptions = ignore_contract_execution_exceptions
         self.ignore_agent_exception = ignore_agent_exceptions
         self.times: dict[str, float] = defaultdict(float)
@@ -373,6 +395,7 @@ class World(
         self._log_negs = log_negotiations
         self.safe_stats_monitoring = safe_stats_monitoring
         self.shuffle_negotiations = shuffle_negotiations
+        self.parallel_negotiations = parallel_negotiations
         self.info = info if info is not None else dict()
 
         if isinstance(mechanisms, Collection) and not isinstance(mechanisms, dict):
@@ -381,7 +404,7 @@ class World(
         self.awi_type = get_class(awi_type, scope=globals())
 
         self._log_folder = str(self._log_folder)
-        self._stats: dict[str, list[Any]] = defaultdict(list)
+        self._stats = StatsStore(n_steps)
         self.__stepped_mechanisms: set[str] = set()
         self.__n_negotiations = 0
         self.__n_contracts_signed = 0
@@ -400,7 +423,7 @@ class World(
         self.__n_steps_success = 0
         self.__n_broken = 0
         self.__n_success = 0
-        self._saved_contracts: dict[str, dict[str, Any]] = {}
+        self._saved_contracts = ContractRecords()
         self._saved_negotiations: dict[str, dict[str, Any]] = {}
         self._saved_breaches: dict[str, dict[str, Any]] = {}
         self._started = False
@@ -522,6 +545,13 @@ class World(
             stats_file_name = _path(str(Path(self._log_folder) / "stats.csv"))
             self._stats_file_name = stats_file_name.name
             self._stats_dir_name = stats_file_name.parent
+        self._stats_writer = (
+            None
+            if self._stats_file_name is None
+            else IncrementalStatsWriter(
+                self, self._stats_dir_name, stats_file_name=self._stats_file_name
+            )
+        )
         # extra log information
         self._saved_details_level = saved_details_level
         self._extra_folder = Path(self._log_folder) if self._log_folder else None
@@ -585,7 +615,7 @@ class World(
     @property
     def stat_names(self, peragent: bool = False):
         """Returns names of all stats available"""
-        names = sorted(list(self.stats.keys()))
+        names = sorted(list(self._stats.keys()))
         if peragent:
             return names
         final = []
@@ -598,26 +628,56 @@ class World(
         return sorted(list(set(final)))
 
     @property
-    def stats(self) -> dict[str, Any]:
-        if len(self._stats) == 0:
-            return dict()
-        L = max(len(_) for _ in self._stats.values())
+    def stats(self) -> dict[str, list]:
+        """
+        All statistics collected so far (one value per step).
 
-        def extend(x, L):
-            n = len(x)
-            if n >= L:
-                return x
-            return x + [float("nan")] * (L - n)
+        Remarks:
+            - Values are lists of the same length (statistics collected for fewer steps are padded with NaN).
+              They are copies, so changing them does not change the statistics of the world.
+            - Use `stats_arrays` to avoid copying.
+        """
+        return {k: v.tolist() for k, v in self._stats.views().items()}
 
-        return {k: extend(v, L) for k, v in self._stats.items()}
+    @property
+    def stats_arrays(self) -> dict[str, np.ndarray]:
+        """
+        All statistics collected so far (one value per step) as numpy arrays.
+
+        Remarks:
+            - Values are read-only numpy arrays of the same length (statistics collected for fewer steps are
+              padded with NaN). They are views of the internal store and are not changed by later steps.
+        """
+        return self._stats.views()
+
+    @property
+    def stats_df(self) -> pd.DataFrame:
+        """All statistics collected so far as a dataframe with one row per step"""
+        return self._stats.to_dataframe()
+
+    def _n_signed_contracts(self) -> int:
+        """Number of saved contracts that were signed"""
+        if self._debug:
+            self._check_contract_counts()
+        return self._saved_contracts.n_signed
+
+    def _check_contract_counts(self) -> None:
+        """Checks the running counts of saved contracts against a full scan (used in debug mode)"""
+        records = self._saved_contracts
+        n_signed = len([_ for _ in records.values() if _["signed_at"] >= 0])
+        n_with_issues = len([_ for _ in records.values() if _["issues"]])
+        assert (
+            n_signed == records.n_signed
+        ), f"Found {n_signed} signed contracts but counted {records.n_signed}"
+        assert (
+            n_with_issues == records.n_with_issues
+        ), f"Found {n_with_issues} contracts with issues but counted {records.n_with_issues}"
 
     @property
     def breach_fraction(self) -> float:
         """Fraction of signed contracts that led to breaches"""
-        n_breaches = sum(self.stats["n_breaches"])
-        n_signed_contracts = len(
-            [_ for _ in self._saved_contracts.values() if _["signed_at"] >= 0]
-        )
+        n_breaches = sum(self.stats_arrays["n_breaches"])
+        n_signed_contracts = self._n_signed_contracts()
         return n_breaches / n_signed_contracts if n_signed_contracts != 0 else 0.0
 
     breach_rate = breach_fraction
@@ -629,14 +689,16 @@ class World(
         Args:
             ignore_no_issue: If true, only contracts resulting from negotiation (has some issues) will be counted
         """
+        if self._debug:
+            self._check_contract_counts()
         if ignore_no_issue:
-            return len([_ for _ in self._saved_contracts.values() if _["issues"]])
+            return self._saved_contracts.n_with_issues
         return len(self._saved_contracts)
 
     @property
     def agreement_fraction(self) -> float:
         """Fraction of negotiations ending in agreement and leading to signed contracts"""
-        n_negs = sum(self.stats["n_negotiations"])
+        n_negs = sum(self.stats_arrays["n_negotiations"])
         n_contracts = self.n_saved_contracts(True)
         return n_contracts / n_negs if n_negs != 0 else np.nan
 
@@ -647,9 +709,7 @@ class World(
         """Fraction of contracts concluded (through negotiation or otherwise)
         that were cancelled."""
         n_contracts = self.n_saved_contracts(False)
-        n_signed_contracts = len(
-            [_ for _ in self._saved_contracts.values() if _["signed_at"] >= 0]
-        )
+        n_signed_contracts = self._n_signed_contracts()
         return (1.0 - n_signed_contracts / n_contracts) if n_contracts != 0 else np.nan
 
     cancellation_rate = cancellation_fraction
@@ -664,9 +724,13 @@ class World(
         """
         if event:
             self.announce(event)
-        if self._no_logs or not self.logger:
+        if (
+            self._no_logs
+            or not self.logger
+            or not self.logger.isEnabledFor(logging.INFO)
+        ):
             return
-        self.logger.info(f"{self._log_header()}: " + s.strip())
+        self.logger.info("%s: %s", self._log_header(), s.strip())
 
     def set_bulletin_board(self, bulletin_board):
         self.bulletin_board = (
@@ -721,16 +785,36 @@ class World(
     def current_step(self):
         return self._current_step
 
+    @property
+    def _log_pipeline(self) -> LogPipeline:
+        """The pipeline writing log files in the background (shared by worlds with the same rotation settings)"""
+        return get_log_pipeline(*getattr(self, "_log_rotation", (0, 0, False)))
+
+    def _create_logger(self) -> logging.Logger:
+        """Creates the world logger (logging to files through the log pipeline and to the screen if needed)"""
+        if self.log_file_name is None:
+            return create_loggers(
+                file_name=None,
+                module_name=None,
+                screen_level=self.log_screen_level if self.log_to_screen else None,
+                file_level=self.log_file_level,
+                app_wide_log_file=True,
+            )
+        return self._log_pipeline.get_logger(
+            f"negmas.world.{self.id}",
+            self.log_file_name,
+            self.log_file_level,
+            screen_level=self.log_screen_level if self.log_to_screen else None,
+        )
+
     def _agent_logger(self, aid: str) -> logging.Logger:
         """Returns the logger associated with a given agent"""
         if aid not in self._agent_loggers.keys():
             self._agent_loggers[aid] = (
-                create_loggers(
-                    file_name=self._agent_log_folder / f"{aid}.txt",
-                    module_name=None,
-                    file_level=self.log_file_level,
-                    app_wide_log_file=False,
-                    module_wide_log_file=False,
+                self._log_pipeline.get_logger(
+                    f"negmas.world.{self.id}.{aid}",
+                    self._agent_log_folder / f"{aid}.txt",
+                    self.log_file_level,
                 )
                 if not self._no_logs
                 else None
@@ -750,7 +834,9 @@ class World(
         if self._no_logs:
             return
         logger = self._agent_logger(aid)
-        logger.debug(f"{self._log_header()}: " + s.strip())
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("%s: %s", self._log_header(), s.strip())
 
     def on_event(self, event: Event, sender: EventSource):
         """Received when an event is raised"""
@@ -788,7 +874,9 @@ class World(
         if self._no_logs or not self.logger:
             return
         logger = self._agent_logger(aid)
-        logger.info(f"{self._log_header()}: " + s.strip())
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("%s: %s", self._log_header(), s.strip())
 
     def logwarning_agent(
         self, aid: str, s: str | None, event: Event | None = None
@@ -807,7 +895,9 @@ class World(
         if self._no_logs or not self.logger:
             return
         logger = self._agent_logger(aid)
-        logger.warning(f"{self._log_header()}: " + s.strip())
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+        logger.warning("%s: %s", self._log_header(), s.strip())
 
     def logerror_agent(
         self, aid: str, s: str | None, event: Event | None = None
@@ -828,7 +918,9 @@ class World(
         if self._no_logs or not self.logger:
             return
         logger = self._agent_logger(aid)
-        logger.error(f"{self._log_header()}: " + s.strip())
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+        logger.error("%s: %s", self._log_header(), s.strip())
 
     def logdebug(self, s: str | None, event: Event | None = None) -> None:
         """logs debug-level information
@@ -842,9 +934,13 @@ class World(
             return
         if event:
             self.announce(event)
-        if self._no_logs or not self.logger:
+        if (
+            self._no_logs
+            or not self.logger
+            or not self.logger.isEnabledFor(logging.DEBUG)
+        ):
             return
-        self.logger.debug(f"{self._log_header()}: " + s.strip())
+        self.logger.debug("%s: %s", self._log_header(), s.strip())
 
     def logwarning(self, s: str | None, event: Event | None = None) -> None:
         """logs warning-level information
@@ -858,9 +954,13 @@ class World(
             return
         if event:
             self.announce(event)
-        if self._no_logs or not self.logger:
+        if (
+            self._no_logs
+            or not self.logger
+            or not self.logger.isEnabledFor(logging.WARNING)
+        ):
             return
-        self.logger.warning(f"{self._log_header()}: " + s.strip())
+        self.logger.warning("%s: %s", self._log_header(), s.strip())
 
     def logerror(self, s: str | None, event: Event | None = None) -> None:
         """logs error-level information
@@ -874,9 +974,13 @@ class World(
             return
         if event:
             self.announce(event)
-        if self._no_logs or not self.logger:
+        if (
+            self._no_logs
+            or not self.logger
+            or not self.logger.isEnabledFor(logging.ERROR)
+        ):
             return
-        self.logger.error(f"{self._log_header()}: " + s.strip())
+        self.logger.error("%s: %s", self._log_header(), s.strip())
 
     @property
     def time(self) -> float:
@@ -1620,18 +1724,45 @@ class World(
 
             The agreement or None and whether the negotiation is still running
         """
-        contract = None
+        result, exception = self._run_mechanism_step(mechanism, action)
+        return self._process_mechanism_step(
+            mechanism, result, exception, force_immediate_signing
+        )
+
+    @staticmethod
+    def _run_mechanism_step(
+        mechanism, action: dict[str, MechanismAction | None] | None = None
+    ) -> tuple[Any, Exception | None]:
+        """Steps a mechanism one step without touching the world.
+
+        Returns:
+
+            The result of the step and the exception raised while stepping (if any)
+        """
         try:
-            result = mechanism.step(action)
+            return mechanism.step(action), None
         except Exception as e:
-            result = mechanism.abort()
-            if not self.ignore_negotiation_exceptions:
-                raise e
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-            self.logerror(
-                f"Mechanism exception: " f"{traceback.format_tb(exc_traceback)}",
-                Event("entity-exception", dict(exception=e)),
-            )
+            return mechanism.abort(), e
+
+    def _process_mechanism_step(
+        self, mechanism, result, exception: Exception | None, force_immediate_signing
+    ) -> tuple[Contract | None, bool]:
+        """Updates the world after a mechanism was stepped (see `_run_mechanism_step`).
+
+        Returns:
+
+            The agreement or None and whether the negotiation is still running
+        """
+        contract = None
+        try:
+            if exception is not None:
+                if not self.ignore_negotiation_exceptions:
+                    raise exception
+                self.logerror(
+                    f"Mechanism exception: "
+                    f"{traceback.format_tb(exception.__traceback__)}",
+                    Event("entity-exception", dict(exception=exception)),
+                )
         finally:
             namap = dict()
             for neg in mechanism.negotiators:
@@ -1675,6 +1806,45 @@ class World(
             self._negotiations.pop(mechanism.id, None)
         return contract, is_running
 
+    @staticmethod
+    def _partition_mechanisms(
+        mechanisms: list[Mechanism], n_partitions: int
+    ) -> list[int]:
+        """Assigns mechanisms to partitions so that mechanisms sharing an agent are in the same partition.
+
+        Returns:
+
+            The partition of every mechanism (-1 for `None` mechanisms)
+        """
+        parent: dict[Any, Any] = dict()
+
+        def find(x):
+            while parent.setdefault(x, x) != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for i, mechanism in enumerate(mechanisms):
+            if mechanism is None:
+                continue
+            for neg in mechanism.negotiators:
+                a, b = find(i), find(neg.owner.id if neg.owner else neg.id)
+                if a != b:
+                    parent[b] = a
+        groups: dict[Any, list[int]] = defaultdict(list)
+        for i, mechanism in enumerate(mechanisms):
+            if mechanism is not None:
+                groups[find(i)].append(i)
+        # largest groups first, each to the least loaded partition (deterministic)
+        loads = [0] * n_partitions
+        assignment = [-1] * len(mechanisms)
+        for group in sorted(groups.values(), key=lambda x: (-len(x), x[0])):
+            k = loads.index(min(loads))
+            loads[k] += len(group)
+            for i in group:
+                assignment[i] = k
+        return assignment
+
     def _step_negotiations(
         self,
         mechanisms: list[Mechanism],
@@ -1711,46 +1881,82 @@ class World(
         if self.negotiation_speed is not None:
             n_steps = min(n_steps, self.negotiation_speed)
 
-        while any(running):
-            if self.shuffle_negotiations:
-                random.shuffle(indices)
-            for i in indices:
-                if not running[i]:
-                    continue
-                if self.time >= self.time_limit:
-                    break
-                mechanism = mechanisms[i]
-                contract, r = self._step_a_mechanism(
-                    mechanism,
-                    force_immediate_signing,
-                    action=action.get(mechanism.id, None) if action else None,
+        n_threads = min(self.parallel_negotiations, sum(running))
+        pool, partitions = None, []
+        if n_threads > 1:
+            partitions = self._partition_mechanisms(mechanisms, n_threads)
+            pool = ThreadPoolExecutor(max_workers=n_threads)
+
+        def _run_partition(active: list[int]) -> list[tuple[Any, Exception | None]]:
+            return [
+                self._run_mechanism_step(
+                    mechanisms[i],
+                    action.get(mechanisms[i].id, None) if action else None,
                 )
-                contracts[i] = contract
-                running[i] = r
-                if not running[i]:
-                    if contract is None:
-                        n_broken_ += 1
-                        n_steps_broken_ += mechanism.state.step + 1
+                for i in active
+            ]
+
+        try:
+            while any(running):
+                if self.shuffle_negotiations:
+                    random.shuffle(indices)
+                if pool is not None:
+                    if self.time >= self.time_limit:
+                        break
+                    active = [[] for _ in range(n_threads)]
+                    for i in indices:
+                        if running[i]:
+                            active[partitions[i]].append(i)
+                    stepped = dict()
+                    for lst, results in zip(
+                        active, pool.map(_run_partition, active), strict=True
+                    ):
+                        stepped.update(zip(lst, results))
+                for i in indices:
+                    if not running[i]:
+                        continue
+                    if pool is None and self.time >= self.time_limit:
+                        break
+                    mechanism = mechanisms[i]
+                    if pool is None:
+                        contract, r = self._step_a_mechanism(
+                            mechanism,
+                            force_immediate_signing,
+                            action=action.get(mechanism.id, None) if action else None,
+                        )
                     else:
-                        n_success_ += 1
-                        n_steps_success_ += mechanism.state.step + 1
-                    for _p in partners:
-                        self._add_edges(
-                            _p[0],
-                            _p,
-                            (
-                                self._edges_negotiations_succeeded
-                                if contract is not None
-                                else self._edges_negotiations_failed
-                            ),
-                            issues=mechanism.issues,
-                            bi=True,
+                        contract, r = self._process_mechanism_step(
+                            mechanism, *stepped[i], force_immediate_signing
                         )
-            current_step += 1
-            if current_step >= n_steps:
-                break
-            if self.time >= self.time_limit:
-                break
+                    contracts[i] = contract
+                    running[i] = r
+                    if not running[i]:
+                        if contract is None:
+                            n_broken_ += 1
+                            n_steps_broken_ += mechanism.state.step + 1
+                        else:
+                            n_success_ += 1
+                            n_steps_success_ += mechanism.state.step + 1
+                        for _p in partners:
+                            self._add_edges(
+                                _p[0],
+                                _p,
+                                (
+                                    self._edges_negotiations_succeeded
+                                    if contract is not None
+                                    else self._edges_negotiations_failed
+                                ),
+                                issues=mechanism.issues,
+                                bi=True,
+                            )
+                current_step += 1
+                if current_step >= n_steps:
+                    break
+                if self.time >= self.time_limit:
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
         return (
             contracts,
             running,
@@ -1761,12 +1967,22 @@ class World(
         )
 
     def append_stats(self):
-        if self._stats_file_name is not None:
-            save_stats(
-                self,
-                log_dir=self._stats_dir_name,
-                stats_file_name=self._stats_file_name,
-            )
+        """Appends the stats (and records) produced since the last call to the stats files"""
+        if self._stats_writer is not None:
+            self._stats_writer.append()
+
+    def checkpoint_flush(self) -> None:
+        if self._event_logger is not None:
+            self._event_logger.flush()
+
+    def compact_stats(self):
+        """Rewrites the stats files and writes buffered events and logs (called when the simulation ends)"""
+        if self._stats_writer is not None:
+            self._stats_writer.compact()
+        if self._event_logger is not None:
+            self._event_logger.flush()
+        if not self._no_logs:
+            self._log_pipeline.flush()
 
     def step(
         self,
@@ -1817,9 +2033,8 @@ class World(
             - Never mix calls with `n_neg_steps` equaling `None` and an integer.
             - Never call this method again on a world if it ever returned `False` on that world.
         """
-        if self.time >= self.time_limit:
-            return False
-        if self.current_step >= self.n_steps:
+        if self.time >= self.time_limit or self.current_step >= self.n_steps:
+            self.compact_stats()
             return False
 
         if self._saved_details_level > 0:
@@ -2026,12 +2241,13 @@ class World(
                     if self.time >= self.time_limit:
                         return False
             # update monitors
-            for monitor in self.stats_monitors:
-                if self.safe_stats_monitoring:
-                    __stats = copy.deepcopy(self.stats)
-                else:
-                    __stats = self.stats
-                monitor.init(__stats, world_name=self.name)
+            if self.stats_monitors:
+                # read-only views (or list copies that monitors can keep and change if safe_stats_monitoring)
+                __stats = (
+                    self.stats if self.safe_stats_monitoring else self.stats_arrays
+                )
+                for monitor in self.stats_monitors:
+                    monitor.init(__stats, world_name=self.name)
             for monitor in self.world_monitors:
                 monitor.init(self)
         else:
@@ -2364,19 +2580,23 @@ class World(
             for agent in self.agents.values():
                 self.call(agent, agent.on_simulation_step_ended)
                 if self.time >= self.time_limit:
+                    self.compact_stats()
                     return False
 
-            for monitor in self.stats_monitors:
-                if self.safe_stats_monitoring:
-                    __stats = copy.deepcopy(self.stats)
-                else:
-                    __stats = self.stats
-                monitor.step(__stats, world_name=self.name)
+            if self.stats_monitors:
+                # read-only views (or list copies that monitors can keep and change if safe_stats_monitoring)
+                __stats = (
+                    self.stats if self.safe_stats_monitoring else self.stats_arrays
+                )
+                for monitor in self.stats_monitors:
+                    monitor.step(__stats, world_name=self.name)
             for monitor in self.world_monitors:
                 monitor.step(self)
 
             self._current_step += 1
             self.frozen_time = self.time
+            if self._current_step >= self.n_steps:
+                self.compact_stats()
             if cross_step_boundary:
                 return self._step_to_negotiations()
         # always indicate that the simulation is to continue
@@ -3163,7 +3383,7 @@ class World(
         return None
         # todo add _get_signing_delay(contract) and implement it in SCML2019
 
-    if nx:
+    if _HAS_NETWORKX:
 
         def graph(
             self,
@@ -3186,6 +3406,8 @@ class World(
                 A networkx graph representing the world if together==True else a list of graphs one for each item in what
 
             """
+            import networkx as nx
+
             if steps is None:
                 steps = self.current_step
             if isinstance(steps, int):
@@ -3255,6 +3477,7 @@ class World(
             """
 
             import matplotlib.pyplot as plt
+            import networkx as nx
 
             if not self.construct_graphs:
                 self.logwarning(
@@ -3413,86 +3636,78 @@ class World(
     @property
     def business_size(self) -> float:
         """The total business size defined as the total money transferred within the system"""
-        if "activity_level" not in self.stats:
+        if "activity_level" not in self._stats:
             return np.nan
-        return sum(self.stats["activity_level"])
+        return sum(self.stats_arrays["activity_level"])
 
     @property
     def n_negotiation_rounds_successful(self) -> float:
         """Average number of rounds in a successful negotiation"""
-        if "n_contracts_concluded" not in self.stats:
+        if "n_contracts_concluded" not in self._stats:
             return np.nan
-        n_negs = sum(self.stats["n_contracts_concluded"])
+        n_negs = sum(self.stats_arrays["n_contracts_concluded"])
         if n_negs == 0:
             return np.nan
-        if "n_negotiation_rounds_successful" not in self.stats:
+        if "n_negotiation_rounds_successful" not in self._stats:
             return np.nan
-        return sum(self.stats["n_negotiation_rounds_successful"]) / n_negs
+        return sum(self.stats_arrays["n_negotiation_rounds_successful"]) / n_negs
 
     @property
     def n_negotiation_rounds_failed(self) -> float:
         """Average number of rounds in a successful negotiation"""
-        if "n_negotiations" not in self.stats:
+        if "n_negotiations" not in self._stats:
             return np.nan
-        n_negs = sum(self.stats["n_negotiations"]) - self.n_saved_contracts(True)
+        n_negs = sum(self.stats_arrays["n_negotiations"]) - self.n_saved_contracts(True)
         if n_negs == 0:
             return np.nan
-        if "n_negotiation_rounds_failed" not in self.stats:
+        if "n_negotiation_rounds_failed" not in self._stats:
             return np.nan
-        return sum(self.stats["n_negotiation_rounds_failed"]) / n_negs
+        return sum(self.stats_arrays["n_negotiation_rounds_failed"]) / n_negs
 
     @property
     def contract_execution_fraction(self) -> float:
         """Fraction of signed contracts successfully executed with no breaches, or errors"""
-        if "n_contracts_executed" not in self.stats:
+        if "n_contracts_executed" not in self._stats:
             return np.nan
-        n_executed = sum(self.stats["n_contracts_executed"])
-        n_signed_contracts = len(
-            [_ for _ in self._saved_contracts.values() if _["signed_at"] >= 0]
-        )
+        n_executed = sum(self.stats_arrays["n_contracts_executed"])
+        n_signed_contracts = self._n_signed_contracts()
         return n_executed / n_signed_contracts if n_signed_contracts > 0 else np.nan
 
     @property
     def contract_dropping_fraction(self) -> float:
         """Fraction of signed contracts that were never executed because they were signed to late to be executable"""
-        if "n_contracts_dropped" not in self.stats:
+        if "n_contracts_dropped" not in self._stats:
             return np.nan
-        n_dropped = sum(self.stats["n_contracts_dropped"])
-        n_signed_contracts = len(
-            [_ for _ in self._saved_contracts.values() if _["signed_at"] >= 0]
-        )
+        n_dropped = sum(self.stats_arrays["n_contracts_dropped"])
+        n_signed_contracts = self._n_signed_contracts()
         return n_dropped / n_signed_contracts if n_signed_contracts > 0 else np.nan
 
     @property
     def contract_err_fraction(self) -> float:
         """Fraction of signed contracts that caused exception during their execution"""
-        if "n_contracts_erred" not in self.stats:
+        if "n_contracts_erred" not in self._stats:
             return np.nan
-        n_erred = sum(self.stats["n_contracts_erred"])
-        n_signed_contracts = len(
-            [_ for _ in self._saved_contracts.values() if _["signed_at"] >= 0]
-        )
+        n_erred = sum(self.stats_arrays["n_contracts_erred"])
+        n_signed_contracts = self._n_signed_contracts()
         return n_erred / n_signed_contracts if n_signed_contracts > 0 else np.nan
 
     @property
     def contract_nullification_fraction(self) -> float:
         """Fraction of signed contracts were nullified by the system (e.g. due to bankruptcy)"""
-        if "n_contracts_nullified" not in self.stats:
+        if "n_contracts_nullified" not in self._stats:
             return np.nan
-        n_nullified = sum(self.stats["n_contracts_nullified"])
-        n_signed_contracts = len(
-            [_ for _ in self._saved_contracts.values() if _["signed_at"] >= 0]
-        )
+        n_nullified = sum(self.stats_arrays["n_contracts_nullified"])
+        n_signed_contracts = self._n_signed_contracts()
         return n_nullified / n_signed_contracts if n_signed_contracts > 0 else np.nan
 
     @property
     def breach_level(self) -> float:
         """The average breach level per contract"""
-        if "breach_level" not in self.stats:
+        if "breach_level" not in self._stats:
             return np.nan
-        blevel = np.nansum(self.stats["breach_level"])
-        n_contracts = sum(self.stats["n_contracts_executed"]) + sum(
-            self.stats["n_breaches"]
+        blevel = np.nansum(self.stats_arrays["breach_level"])
+        n_contracts = sum(self.stats_arrays["n_contracts_executed"]) + sum(
+            self.stats_arrays["n_breaches"]
         )
         return blevel / n_contracts if n_contracts > 0 else np.nan
 
@@ -3629,17 +3844,12 @@ class World(
         state = self.__dict__.copy()
         if "logger" in state.keys():
             state.pop("logger", None)
+        state["_agent_loggers"] = dict()
         return state
 
     def __setstate__(self, state):
         self.__dict__ = state
-        self.logger = create_loggers(
-            file_name=self.log_file_name,
-            module_name=None,
-            screen_level=self.log_screen_level if self.log_to_screen else None,
-            file_level=self.log_file_level,
-            app_wide_log_file=True,
-        )
+        self.logger = self._create_logger() if not self._no_logs else None
 
     @staticmethod
     def combine_stats(
@@ -3672,27 +3882,28 @@ class World(
         combined_stats = defaultdict(list)
         max_length = defaultdict(int)
         for world in worlds:
-            world_stats = [_ for _ in world.stats.keys() if _.startswith(stat)]
+            all_stats = world.stats
+            world_stats = [_ for _ in all_stats.keys() if _.startswith(stat)]
             if len(world_stats) == 0:
                 continue
             defaultdict(list)
             for s in world_stats:
                 if not pertype or not any(s.endswith(_) for _ in world.agents.keys()):
                     # this is not an agent statistic or an agent statistic but we are not combining types
-                    z = world.stats[s]
+                    z = all_stats[s]
                     combined_stats[s].append(np.asarray(z))
                     max_length[s] = max(max_length[s], len(z))
                     continue
                 parts = s.split("_")
                 base, aid = "_".join(parts[:-1]), parts[-1]
                 if aid not in world.agents.keys():
-                    z = world.stats[s]
+                    z = all_stats[s]
                     combined_stats[s].append(np.asarray(z))
                     max_length[s] = max(max_length[s], len(z))
                     continue
                 type_ = world.agents[aid].short_type_name
                 key = type_ if base == stat else f"{type_} ({base})"
-                z = world.stats[s]
+                z = all_stats[s]
                 combined_stats[key].append(np.asarray(z))
                 max_length[key] = max(max_length[key], len(z))
         if n_steps is None:
@@ -3903,7 +4114,7 @@ class World(
             )
             world_stats = [
                 _
-                for _ in self.stats.keys()
+                for _ in self._stats.keys()
                 if _.startswith(prefix) and (not suffix or _.endswith(suffix))
             ]
             if len(world_stats) == 0:
@@ -3912,7 +4123,7 @@ class World(
                 linestyle = styles[n_plots // n_per_style][1]
                 n_plots += 1
                 plt.plot(
-                    self.stats[world_stats[0]],
+                    self.stats_arrays[world_stats[0]],
                     label=world_stats[0],
                     linestyle=linestyle,
                 )
@@ -3935,11 +4146,11 @@ class World(
                     aid = bparts[-1]
                 if pertype:
                     type_ = self.agents[aid].type_name.split(":")[-1].split(".")[-1]
-                    type_world_stats[type_].append(self.stats[s])
+                    type_world_stats[type_].append(self.stats_arrays[s])
                     continue
                 n_plots += 1
                 linestyle = styles[n_plots // n_per_style][1]
-                plt.plot(self.stats[s], label=aid, linestyle=linestyle)
+                plt.plot(self.stats_arrays[s], label=aid, linestyle=linestyle)
             if not pertype:
                 if title:
                     plt.title(base)
@@ -7,7 +7,9 @@ import math
 import random
 import time
 from copy import deepcopy
+from typing import Sequence
 
+import numpy as np
 from attrs import define
 
 from negmas.common import NegotiatorMechanismInterface, MechanismAction
@@ -43,6 +45,9 @@ class VetoSTMechanism(
         initial_outcome: initial outcome. If None, it will be selected by `next_outcome` which by default will choose it
                          randomly.
         initial_responses: Initial set of responses.
+        n_candidates: The number of candidate outcomes evaluated in every step. All negotiators are asked about all
+                      candidates at once (see `BinaryComparatorNegotiator.is_better_many`) and the first candidate
+                      accepted by everyone becomes the current offer.
 
     Remarks:
 
@@ -60,6 +65,7 @@ class VetoSTMechanism(
         initial_outcome=None,
         initial_responses: tuple[bool] = tuple(),
         initial_state: STState | None = None,
+        n_candidates: int = 1,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -80,6 +86,11 @@ class VetoSTMechanism(
         self.epsilon = epsilon
         state.new_offer = initial_outcome
         """The new offer generated in this step"""
+        self.n_candidates = max(1, n_candidates)
+        """The number of candidate outcomes evaluated in every step"""
+        self._rng = np.random.default_rng(random.getrandbits(64))
+        self._values: list[list] | None = None
+        """Enumerated values of all issues. Only set by mechanisms that need them (e.g. hill climbing)"""
 
     def next_outcome(self, outcome: Outcome | None) -> Outcome | None:
         """Generate the next outcome given some outcome.
@@ -93,23 +104,87 @@ class VetoSTMechanism(
         """
         return self.random_outcomes(1)[0]
 
-    def __call__(self, state: STState, action=None) -> MechanismStepResult:
-        """Single round of the protocol"""
+    def next_outcomes(self, outcome: Outcome | None, n: int) -> list[Outcome]:
+        """Generate candidates for the next outcome given some outcome.
 
-        new_offer = self.next_outcome(state.current_offer)
-        responses = []
+        Args:
+             outcome: The current outcome
+             n: The maximum number of candidates
 
+        Returns:
+            a list of at most `n` outcomes. An empty list ends the mechanism run
+
+        Remarks:
+            - If `next_outcome` is overridden, it is called (up to) `n` times. Otherwise, candidates are sampled
+              at random (all at once for discrete outcome spaces). Value indices are sampled from the cardinality of
+              every issue so issue values are never enumerated.
+        """
+        if type(self).next_outcome is not VetoSTMechanism.next_outcome:
+            candidates = []
+            for _ in range(n):
+                candidate = self.next_outcome(outcome)
+                if candidate is None:
+                    break
+                candidates.append(candidate)
+            return candidates
+        issues = self.issues
+        if not all(_.is_discrete() for _ in issues):
+            return self.random_outcomes(n, with_replacement=True)
+        sizes = [int(_.cardinality) for _ in issues]
+        genes = self._rng.integers(0, sizes, size=(n, len(sizes)))
+        return [
+            tuple(issues[c].value_at(i) for c, i in enumerate(row))
+            for row in genes.tolist()
+        ]
+
+    def _decode(self, genes: np.ndarray) -> list[Outcome]:
+        """Decodes a matrix of indices into `_values` (one row per outcome) to outcomes"""
+        values = self._values
+        assert values is not None
+        return [
+            tuple(values[c][i] for c, i in enumerate(row)) for row in genes.tolist()
+        ]
+
+    def _responses(
+        self, candidates: Sequence[Outcome], current: Outcome | None
+    ) -> list[list[bool | None]] | None:
+        """
+        Asks every negotiator to compare all candidates with the current outcome.
+
+        Returns:
+            A list with the responses of every negotiator (one for each candidate) or `None` if some negotiator
+            exceeded the step time limit.
+        """
+        responses = []
         for neg in self.negotiators:
             strt = time.perf_counter()
-            responses.append(neg.is_better(new_offer, state.current_offer))
+            many = getattr(neg, "is_better_many", None)
+            if many is not None:
+                responses.append(many(candidates, current))
+            else:
+                responses.append([neg.is_better(_, current) for _ in candidates])
             if time.perf_counter() - strt > self.nmi.step_time_limit:
-                state.timedout = True
-                return MechanismStepResult(state)
+                return None
+        return responses
 
-        self.last_responses = responses
-        state.new_offer = new_offer
-        if all(responses):
-            state.current_offer = new_offer
+    def __call__(self, state: STState, action=None) -> MechanismStepResult:
+        """Single round of the protocol"""
+
+        if self.n_candidates == 1:
+            candidates = [self.next_outcome(state.current_offer)]
+        else:
+            candidates = self.next_outcomes(state.current_offer, self.n_candidates)
+        responses = self._responses(candidates, state.current_offer)
+        if responses is None:
+            state.timedout = True
+            return MechanismStepResult(state)
+
+        accepted = _first_accepted(responses, len(candidates))
+        selected = accepted if accepted is not None else len(candidates) - 1
+        self.last_responses = [_[selected] for _ in responses]
+        state.new_offer = candidates[selected]
+        if accepted is not None:
+            state.current_offer = candidates[accepted]
 
         return MechanismStepResult(state)
 
@@ -277,34 +352,42 @@ class HillClimbingSTMechanism(VetoSTMechanism):
     Args:
         *args: positional arguments to be passed to the base Mechanism
         **kwargs: keyword arguments to be passed to the base Mechanism
+
+    Remarks:
+        - Neighbors are generated as a matrix of value indices (one row per neighbor) and only decoded to outcomes
+          when proposed. Pass `n_candidates` to evaluate several neighbors in every step.
     """
 
+    def _neighbor_genes(self, outcome: Outcome) -> np.ndarray:
+        """Returns the value indices of all neighbors (one row per neighbor)"""
+        assert self._values is not None
+        current = np.asarray(
+            [self._indices[i][v] for i, v in enumerate(outcome)], dtype=np.int64
+        )
+        blocks = []
+        for i, values in enumerate(self._values):
+            if self._ordered[i]:
+                alternatives = np.asarray([current[i] - 1, current[i] + 1])
+                alternatives = alternatives[
+                    (alternatives >= 0) & (alternatives < len(values))
+                ]
+            else:
+                alternatives = np.arange(len(values))
+                alternatives = alternatives[alternatives != current[i]]
+            block = np.repeat(current[None, :], len(alternatives), axis=0)
+            block[:, i] = alternatives
+            blocks.append(block)
+        if not blocks:
+            return np.empty((0, len(current)), dtype=np.int64)
+        return np.concatenate(blocks)
+
     def neighbors(self, outcome: Outcome) -> list[Outcome]:
         """Returns all neighbors
 
-        Neighbor is an outcome that differs any one of the issues from the original outcome.
+        Neighbor is an outcome that differs any one of the issues from the original outcome. For numeric issues, only
+        the values just before and after the current value are used.
         """
-
-        neighbors = []
-        for i, issue in enumerate(self.issues):
-            values = []
-            if isinstance(issue.values, list):
-                values = issue.values
-            if isinstance(issue.values, int):
-                values = [max(0, outcome[i] - 1), min(outcome[i] + 1, issue.values)]
-            if isinstance(issue.values, tuple):
-                delta = random.random() * (issue.values[0] - issue.values[0])
-                values.append(max(issue.values[0], outcome[i] - delta))
-                values.append(min(outcome[i] + delta, issue.values[0]))
-
-            for value in values:
-                neighbor = list(deepcopy(outcome))
-                if neighbor[i] == value:
-                    continue
-                neighbor[i] = value
-                neighbors.append(tuple(neighbor))
-
-        return neighbors
+        return self._decode(self._neighbor_genes(outcome))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -313,11 +396,40 @@ class HillClimbingSTMechanism(VetoSTMechanism):
             if issue.is_discrete() is False:
                 raise ValueError("This mechanism assume discrete issues")
 
+        self._values = [list(_.all) for _ in self.issues]
+        self._ordered = [_.is_numeric() for _ in self.issues]
+        for ordered, values in zip(self._ordered, self._values):
+            if ordered:
+                values.sort()
+        self._indices = [{v: i for i, v in enumerate(_)} for _ in self._values]
+
         if self.initial_outcome is None:
             self.initial_outcome = self.random_outcomes(1)[0]
 
         self._current_state.current_offer = self.initial_outcome
-        self.possible_offers = self.neighbors(self._current_state.current_offer)
+        self._possible = self._neighbor_genes(self._current_state.current_offer)
+
+    @property
+    def possible_offers(self) -> list[Outcome]:
+        """Neighbors of the current offer not proposed yet"""
+        return self._decode(self._possible)
+
+    @possible_offers.setter
+    def possible_offers(self, outcomes: list[Outcome]) -> None:
+        self._possible = np.asarray(
+            [[self._indices[i][v] for i, v in enumerate(_)] for _ in outcomes],
+            dtype=np.int64,
+        ).reshape(len(outcomes), len(self._indices))
+
+    def next_outcomes(self, outcome: Outcome | None, n: int) -> list[Outcome]:
+        """Removes (up to) `n` random neighbors from the possible offers and returns them"""
+        n = min(n, len(self._possible))
+        if n == 0:
+            return []
+        selected = self._rng.choice(len(self._possible), size=n, replace=False)
+        candidates = self._decode(self._possible[selected])
+        self._possible = np.delete(self._possible, selected, axis=0)
+        return candidates
 
     def next_outcome(self, outcome: Outcome | None) -> Outcome | None:
         """Generate the next outcome given some outcome.
@@ -329,36 +441,39 @@ class HillClimbingSTMechanism(VetoSTMechanism):
             a new outcome or None to end the mechanism run
 
         """
-
-        if len(self.possible_offers) == 0:
-            return None
-        return self.possible_offers.pop(
-            random.randint(0, len(self.possible_offers)) - 1
-        )
+        candidates = self.next_outcomes(outcome, 1)
+        return candidates[0] if candidates else None
 
     def __call__(self, state: STState, action=None) -> MechanismStepResult:
         """Single round of the protocol"""
 
-        new_offer = self.next_outcome(state.current_offer)
-        if new_offer is None:
+        candidates = self.next_outcomes(state.current_offer, self.n_candidates)
+        if not candidates:
             state.agreement = (state.current_offer,)
             return MechanismStepResult(state)
 
-        responses = []
-        for neg in self.negotiators:
-            strt = time.perf_counter()
-            responses.append(neg.is_better(new_offer, state.current_offer))
-            if time.perf_counter() - strt > self.nmi.step_time_limit:
-                return MechanismStepResult(state)
+        responses = self._responses(candidates, state.current_offer)
+        if responses is None:
+            return MechanismStepResult(state)
 
-        self.last_responses = responses
+        accepted = _first_accepted(responses, len(candidates))
+        selected = accepted if accepted is not None else len(candidates) - 1
+        self.last_responses = [_[selected] for _ in responses]
 
-        if all(responses):
-            state.current_offer = new_offer
-            self.possible_offers = self.neighbors(state.current_offer)
+        if accepted is not None:
+            state.current_offer = candidates[accepted]
+            self._possible = self._neighbor_genes(state.current_offer)
 
         return MechanismStepResult(state)
 
     @property
     def current_offer(self):
         return self._current_state.current_offer
+
+
+def _first_accepted(responses: list[list[bool | None]], n: int) -> int | None:
+    """Returns the index of the first candidate for which all responses are True (None if no such candidate)"""
+    for j in range(n):
+        if all(_[j] for _ in responses):
+            return j
+    return None
@@ -1,10 +1,11 @@
 from __future__ import annotations
+import json
 from click.testing import CliRunner
 from typer.testing import CliRunner as TyperRunner
 from pathlib import Path
 
 from negmas.scripts.app import cli as main
-from negmas.scripts.negotiate import app
+from negmas.scripts.negotiate import app, batch_app
 
 
 def test_main():
@@ -105,3 +106,46 @@ def test_negotiate_app_save(tmp_path):
         assert (base / fname).exists()
         assert (base / fname).is_file()
         assert (base / fname).stat().st_size > 10
+
+
+def test_negotiate_batch_and_resume(tmp_path):
+    laptop = str(Path(__file__).parent / "data" / "Laptop")
+    output = tmp_path / "results.jsonl"
+    args = [laptop, "-n", "AspirationNegotiator,RandomNegotiator", "-r", "2"]
+    args += ["-s", "10", "-o", str(output), "--no-progress"]
+    runner = TyperRunner()
+    result = runner.invoke(batch_app, args + ["-j", "0"])
+    assert result.exit_code == 0, result.output
+    records = [json.loads(_) for _ in output.read_text().splitlines()]
+    assert [_["repetition"] for _ in records] == [0, 1]
+    for record in records:
+        assert record["error"] is None
+        assert record["negotiators"] == ["AspirationNegotiator", "RandomNegotiator"]
+        assert len(record["utilities"]) == 2 and record["step"] <= 10
+    # finished negotiations are not repeated
+    result = runner.invoke(batch_app, args + ["-j", "0", "-r", "3"])
+    assert result.exit_code == 0, result.output
+    assert len(output.read_text().splitlines()) == 3
+
+
+def test_negotiate_batch_parallel(tmp_path):
+    data = Path(__file__).parent / "data"
+    output = tmp_path / "results.jsonl"
+    args = [str(data / "Laptop"), str(data / "Laptop1Issue"), "-r", "2", "-s", "10"]
+    result = TyperRunner().invoke(
+        batch_app, args + ["-j", "2", "-o", str(output), "--no-progress"]
+    )
+    assert result.exit_code == 0, result.output
+    records = [json.loads(_) for _ in output.read_text().splitlines()]
+    assert len(records) == 4 and len({_["id"] for _ in records}) == 4
+    assert all(_["error"] is None for _ in records)
+
+
+def test_negotiate_batch_writes_only_records_to_stdout(tmp_path):
+    laptop = str(Path(__file__).parent / "data" / "Laptop")
+    args = [laptop, str(tmp_path), "-s", "10", "-j", "0", "--no-progress"]
+    result = TyperRunner().invoke(batch_app, args)
+    assert result.exit_code == 0, result.output
+    records = [json.loads(_) for _ in result.stdout.splitlines()]
+    assert len(records) == 1 and records[0]["error"] is None
+    assert "not a scenario folder" in result.stderr
@@ -1,8 +1,14 @@
 from __future__ import annotations
+import numpy as np
 from pytest import mark
 
-from negmas import MappingUtilityFunction, SorterNegotiator
-from negmas.ga import GAMechanism
+from negmas import (
+    LinearAdditiveUtilityFunction,
+    MappingUtilityFunction,
+    SorterNegotiator,
+    make_issue,
+)
+from negmas.ga import GAMechanism, fast_non_dominated_sort
 
 
 @mark.parametrize("n_negotiators,n_outcomes", [(2, 10), (3, 50), (2, 50), (3, 5)])
@@ -16,3 +22,60 @@ def test_ga_mechanism(n_negotiators, n_outcomes):
     assert mechanism.state.step == 1
     assert mechanism.dominant_outcomes is not None
     mechanism.run()
+
+
+def test_fast_non_dominated_sort_matches_brute_force():
+    rng = np.random.default_rng(0)
+    costs = rng.integers(0, 10, size=(300, 3))
+    fronts = fast_non_dominated_sort(costs)
+    assert sorted(np.concatenate(fronts).tolist()) == list(range(len(costs)))
+    remaining = set(range(len(costs)))
+    for front in fronts:
+        expected = {
+            i
+            for i in remaining
+            if not any(
+                (costs[j] <= costs[i]).all() and (costs[j] < costs[i]).any()
+                for j in remaining
+            )
+        }
+        assert set(front.tolist()) == expected
+        remaining -= expected
+    assert len(fast_non_dominated_sort(costs, max_fronts=1)) == 1
+
+
+def test_ga_mechanism_keeps_population_in_outcome_space():
+    issues = [make_issue(10, "a"), make_issue(["x", "y", "z"], "b")]
+    mechanism = GAMechanism(issues=issues, n_steps=5, n_population=200)
+    ufuns = MappingUtilityFunction.generate_random(
+        3, outcomes=list(mechanism.outcome_space.enumerate_or_sample())
+    )
+    for i, u in enumerate(ufuns):
+        mechanism.add(SorterNegotiator(name=f"agent{i}"), preferences=u)
+    mechanism.run()
+    outcomes = set(mechanism.outcome_space.enumerate_or_sample())
+    assert mechanism.encoded
+    assert len(mechanism.population) == 200
+    assert all(_ in outcomes for _ in mechanism.population)
+    assert mechanism.dominant_outcomes
+    assert all(_ in outcomes for _ in mechanism.dominant_outcomes)
+
+
+@mark.parametrize(
+    "issues",
+    [
+        [make_issue((0.0, 1.0), "price"), make_issue(10, "quantity")],
+        [make_issue((0, 10**9), "price"), make_issue(10, "quantity")],
+    ],
+)
+def test_ga_mechanism_supports_continuous_and_large_issues(issues):
+    mechanism = GAMechanism(issues=issues, n_steps=5, n_population=50)
+    assert not mechanism.encoded and mechanism.genes is None
+    for i in range(3):
+        ufun = LinearAdditiveUtilityFunction.random(mechanism.outcome_space)
+        mechanism.add(SorterNegotiator(name=f"agent{i}"), preferences=ufun)
+    mechanism.run()
+    assert len(mechanism.population) == 50
+    assert all(mechanism.outcome_space.is_valid(_) for _ in mechanism.population)
+    assert mechanism.dominant_outcomes
+    assert all(_ in mechanism.ranked_outcomes for _ in mechanism.dominant_outcomes)
@@ -5,6 +5,7 @@ import pytest
 from pathlib import Path
 
 from negmas.helpers import (
+    LogPipeline,
     create_loggers,
     pretty_string,
     shortest_unique_names,
@@ -41,6 +42,53 @@ def test_create_loggers_with_default_params(capsys):
     assert captured == ""
 
 
+def test_log_pipeline_demultiplexes_and_rotates(tmp_path):
+    import gzip
+
+    pipeline = LogPipeline(
+        format_str="%(message)s",
+        max_bytes=200,
+        backup_count=2,
+        compress=True,
+        max_open_files=1,
+    )
+    first = pipeline.get_logger("test_pipeline.first", tmp_path / "first.txt")
+    second = pipeline.get_logger(
+        "test_pipeline.second", tmp_path / "sub" / "second.txt", level=20
+    )
+    first.debug("%s-%d", "first", 1)
+    second.debug("ignored")
+    second.info("second")
+    first.info("first-2")
+    pipeline.flush()
+    assert (tmp_path / "first.txt").read_text() == "first-1\nfirst-2\n"
+    assert (tmp_path / "sub" / "second.txt").read_text() == "second\n"
+    for i in range(40):
+        first.info(f"line {i:02}")
+    pipeline.stop()
+    assert (tmp_path / "first.txt").read_text().endswith("line 39\n")
+    with gzip.open(tmp_path / "first.txt.1.gz", "rt") as f:
+        assert "line 00" in f.read()
+    assert not (tmp_path / "first.txt.3.gz").exists()
+    # the pipeline restarts when used again
+    first.info("restarted")
+    pipeline.stop()
+    assert (tmp_path / "first.txt").read_text().endswith("restarted\n")
+
+
+def test_log_pipeline_logs_to_screen(tmp_path, capsys):
+    pipeline = LogPipeline(format_str="%(message)s")
+    log = pipeline.get_logger(
+        "test_pipeline.screen", tmp_path / "log.txt", level=20, screen_level=10
+    )
+    log.debug("screen only")
+    log.info("both")
+    pipeline.stop()
+    _, captured = capsys.readouterr()
+    assert captured == "screen only\nboth\n"
+    assert (tmp_path / "log.txt").read_text() == "both\n"
+
+
 def disabled_test_create_loggers_with_file_params(capsys, tmpdir):
     file_name = tmpdir.join("log.txt")
 
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import negmas
+from negmas._exports import EXPORTS
+
+
+@pytest.mark.parametrize("module", list(EXPORTS.keys()))
+def test_exports_match_submodule_all(module):
+    assert EXPORTS[module] == tuple(importlib.import_module(f"negmas.{module}").__all__)
+
+
+def test_all_names_resolve_to_submodule_objects():
+    for module, names in EXPORTS.items():
+        m = importlib.import_module(f"negmas.{module}")
+        for name in names:
+            if negmas._SOURCES[name] == module:
+                assert getattr(negmas, name) is getattr(m, name)
+    assert negmas.tournaments is importlib.import_module("negmas.tournaments")
+    with pytest.raises(AttributeError):
+        negmas.this_does_not_exist  # type: ignore
+
+
+def test_import_negmas_is_lazy():
+    code = (
+        "import sys, negmas;"
+        "heavy = ('negmas.sao', 'negmas.situated', 'pandas', 'scipy', 'inflect', 'matplotlib');"
+        "print(','.join(_ for _ in heavy if _ in sys.modules));"
+        "negmas.SAOMechanism;"
+        "print('negmas.sao' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert out == ["", "True"]
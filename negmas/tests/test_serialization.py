@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+
+from negmas.serialization import (
+    CLOUDPICKLE_START,
+    PYTHON_CLASS_IDENTIFIER,
+    deserialize,
+    serialize,
+)
+
+
+def double(x):
+    return 2 * x
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self._private = 0
+        self.f = double
+
+
+class Slotted:
+    __slots__ = ("a", "b")
+
+    def __init__(self):
+        self.a, self.b = 1.5, [Point(1, 2), (3, None)]
+
+
+class Pretender:
+    """Claims to be a string through __class__"""
+
+    @property  # type: ignore
+    def __class__(self):
+        return str
+
+
+def test_serialize_simple_values_and_containers():
+    values = [None, 1, 1.5, "a", True, [1, "b", None, (2.0, [3])], {"a": (1, 2)}]
+    for v in values:
+        assert serialize(v) == v
+        assert type(serialize(v)) == type(v)
+
+
+def test_serialize_objects_is_stable_across_calls():
+    expected = {
+        "a": 1.5,
+        "b": [
+            {"x": 1, "y": 2, PYTHON_CLASS_IDENTIFIER: f"{__name__}.Point"},
+            (3, None),
+        ],
+        PYTHON_CLASS_IDENTIFIER: f"{__name__}.Slotted",
+    }
+    for _ in range(3):
+        assert serialize(Slotted()) == expected
+    p = deserialize(serialize(Point(np.int64(3), [4])))
+    assert isinstance(p, Point) and p.x == 3 and p.y == [4]
+    assert isinstance(serialize(Point(1, 2), keep_private=True)["_private"], int)
+
+
+def test_serialize_uses_instance_checks_when_class_is_overridden():
+    p = Pretender()
+    assert serialize(p) is p
+
+
+def test_serialize_pickles_ints_that_cannot_be_json_encoded():
+    assert serialize(10**5000).startswith(CLOUDPICKLE_START)
+    assert serialize(10**600) == 10**600
@@ -1,7 +1,12 @@
 from __future__ import annotations
 from pytest import mark
 
-from negmas import BinaryComparatorNegotiator, MappingUtilityFunction
+from negmas import (
+    BinaryComparatorNegotiator,
+    LinearAdditiveUtilityFunction,
+    MappingUtilityFunction,
+    make_issue,
+)
 from negmas.st import HillClimbingSTMechanism, VetoSTMechanism
 
 
@@ -38,3 +43,56 @@ def test_hill_climbing_mechanism(n_negotiators, n_outcomes):
     assert mechanism.state.current_offer is not None
     mechanism.run()
     assert mechanism.agreement is not None
+
+
+def test_is_better_many_matches_is_better():
+    ufun = MappingUtilityFunction.generate_random(1, outcomes=20)[0]
+    neg = BinaryComparatorNegotiator(preferences=ufun)
+    outcomes = [(_,) for _ in range(20)]
+    for second in outcomes[:5]:
+        assert neg.is_better_many(outcomes, second) == [
+            neg.is_better(_, second) for _ in outcomes
+        ]
+
+
+def test_hill_climbing_neighbors_differ_in_one_issue():
+    issues = [make_issue(5, "a"), make_issue(["x", "y", "z"], "b")]
+    mechanism = HillClimbingSTMechanism(issues=issues, initial_outcome=(2, "y"))
+    assert sorted(mechanism.neighbors((2, "y"))) == sorted(
+        [(1, "y"), (3, "y"), (2, "x"), (2, "z")]
+    )
+    assert sorted(mechanism.neighbors((0, "x"))) == sorted(
+        [(1, "x"), (0, "y"), (0, "z")]
+    )
+
+
+@mark.parametrize("mechanism_type", [VetoSTMechanism, HillClimbingSTMechanism])
+def test_batched_candidates_only_improve(mechanism_type):
+    issues = [make_issue(10, "a"), make_issue(10, "b"), make_issue(["x", "y"], "c")]
+    mechanism = mechanism_type(issues=issues, n_steps=20, n_candidates=8)
+    outcomes = list(mechanism.outcome_space.enumerate_or_sample())
+    ufuns = MappingUtilityFunction.generate_random(2, outcomes=outcomes)
+    for i, u in enumerate(ufuns):
+        mechanism.add(BinaryComparatorNegotiator(name=f"agent{i}"), preferences=u)
+    previous = mechanism.state.current_offer
+    for _ in range(20):
+        mechanism.step()
+        current = mechanism.state.current_offer
+        if previous is not None and current != previous:
+            assert all(u(current) > u(previous) for u in ufuns)
+        previous = current
+
+
+@mark.parametrize("n_candidates", [1, 8])
+def test_veto_mechanism_does_not_enumerate_large_issues(n_candidates):
+    issues = [make_issue((0, 10**9), "a"), make_issue((0, 10**9), "b")]
+    mechanism = VetoSTMechanism(issues=issues, n_steps=5, n_candidates=n_candidates)
+    ufun = LinearAdditiveUtilityFunction.random(mechanism.outcome_space)
+    for i in range(2):
+        mechanism.add(BinaryComparatorNegotiator(name=f"agent{i}"), preferences=ufun)
+    mechanism.run()
+    assert mechanism._values is None
+    assert mechanism.outcome_space.is_valid(mechanism.state.new_offer)
+    candidates = mechanism.next_outcomes(None, 100)
+    assert len(candidates) == 100
+    assert all(mechanism.outcome_space.is_valid(_) for _ in candidates)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+import numpy as np
+import pytest
+
+from negmas import MappingUtilityFunction
+from negmas.elicitation import User, VOIElicitor
+from negmas.elicitation import voi
+from negmas.elicitation.voi import _policy_sums, _replaced_eeu, _replaced_eeus
+from negmas.models.acceptance import AdaptiveDiscreteAcceptanceModel
+
+
+def _eeu(eus, acceptance) -> float:
+    """EEU of offering outcomes in the given order"""
+    eeu, reach = 0.0, 1.0
+    for u, a in zip(eus, acceptance):
+        eeu += u * a * reach
+        reach *= 1.0 - a
+    return eeu
+
+
+def _resorted_eeu(eus, acceptance, position, value) -> float:
+    """EEU after replacing the eu at `position` with `value` and sorting the policy again.
+
+    Ties are broken by putting the changed outcome first and keeping the order of all others.
+    """
+    eus = list(eus)
+    eus[position] = value
+    order = sorted(range(len(eus)), key=lambda i: (-eus[i], i != position, i))
+    return _eeu([eus[_] for _ in order], [acceptance[_] for _ in order])
+
+
+def _policy(n, rng, acceptance=None, ties=False):
+    eus = rng.integers(0, 4, n) / 4 if ties else rng.random(n)
+    eus = np.sort(eus)[::-1].copy()
+    if acceptance is None:
+        acceptance = rng.random(n)
+    return eus, np.asarray(acceptance, dtype=float)
+
+
+def _check(eus, acceptance, positions, values, **kwargs):
+    p, s = _policy_sums(eus, acceptance)
+    assert s[-1] == pytest.approx(_eeu(eus, acceptance))
+    found = _replaced_eeus(eus, acceptance, p, s, positions, values, **kwargs)
+    for i, (position, value) in enumerate(zip(positions, values)):
+        expected = _resorted_eeu(eus, acceptance, position, value)
+        assert _replaced_eeu(eus, acceptance, position, value) == pytest.approx(
+            expected
+        )
+        assert found[i] == pytest.approx(expected), (position, value)
+
+
+@pytest.mark.parametrize(
+    "acceptance",
+    [
+        None,
+        [1.0] * 8,
+        [0.0] * 8,
+        [0.3, 1.0, 0.5, 0.0, 1.0, 0.2, 0.0, 0.9],
+        [1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0],
+    ],
+)
+@pytest.mark.parametrize("ties", [False, True])
+def test_replaced_eeus_match_resorting(acceptance, ties):
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        eus, accept = _policy(8, rng, acceptance, ties)
+        positions = np.repeat(np.arange(8), 7)
+        values = np.concatenate(
+            [rng.integers(0, 4, 7) / 4 if ties else rng.random(7) for _ in range(8)]
+        )
+        # the current value, the values of all other outcomes and values beyond the extremes
+        positions = np.concatenate(
+            (positions, np.arange(8), np.repeat(np.arange(8), 8), [0, 7, 0, 7])
+        )
+        values = np.concatenate((values, eus, np.tile(eus, 8), [-1.0, -1.0, 2.0, 2.0]))
+        _check(eus, accept, positions, values)
+
+
+@pytest.mark.parametrize("max_workers", [2, None])
+def test_replaced_eeus_in_threads(monkeypatch, max_workers):
+    monkeypatch.setattr(voi, "PARALLEL_MIN_ANSWERS", 10)
+    rng = np.random.default_rng(1)
+    eus, acceptance = _policy(10, rng, [0.3, 1.0, 0.5, 0.0] + [0.4] * 6)
+    positions = rng.integers(0, 10, 200)
+    values = rng.random(200)
+    p, s = _policy_sums(eus, acceptance)
+    serial = _replaced_eeus(eus, acceptance, p, s, positions, values)
+    threaded = _replaced_eeus(
+        eus, acceptance, p, s, positions, values, max_workers=max_workers
+    )
+    assert np.allclose(serial, threaded)
+    _check(eus, acceptance, positions[:20], values[:20], max_workers=max_workers)
+
+
+def test_voi_elicitor_optimal_policy_is_sorted_on_eu():
+    outcomes = [(_,) for _ in range(6)]
+    ufun = MappingUtilityFunction(dict(zip(outcomes, [0.1] * 6)), outcomes=outcomes)
+    elicitor = VOIElicitor(strategy=None, user=User(preferences=ufun, cost=0.0))
+    acceptance = [0.2, 1.0, 0.0, 0.5, 0.3, 0.3]
+    elicitor.opponent_model = AdaptiveDiscreteAcceptanceModel(outcomes, prob=acceptance)
+    elicitor.eus = np.asarray([0.3, 0.5, 0.9, 0.3, 0.1, 0.7])
+    elicitor.init_optimal_policy()
+    order = [_[1] for _ in elicitor.eu_policy]
+    # ties keep the order of outcomes
+    assert order == [2, 5, 1, 0, 3, 4]
+    assert [-_[0] for _ in elicitor.eu_policy] == [0.9, 0.7, 0.5, 0.3, 0.3, 0.1]
+    assert elicitor.outcome_in_policy == {o: i for i, o in enumerate(order)}
+    expected = _eeu(elicitor.eus[order], np.asarray(acceptance)[order])
+    assert elicitor.current_eeu == pytest.approx(expected)
+    assert elicitor.eeu(np.asarray(order), elicitor.eus[order]) == pytest.approx(
+        -expected
+    )
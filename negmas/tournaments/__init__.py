@@ -7,5 +7,15 @@ from __future__ import annotations
 
 from .neg import *
 from .tournaments import *
+from .tcp import *
+from .adaptive import *
+from .pool import *
 
-__all__ = tournaments.__all__ + neg.__all__ + ["neg"]
+__all__ = (
+    tournaments.__all__
+    + neg.__all__
+    + tcp.__all__
+    + adaptive.__all__
+    + pool.__all__
+    + ["neg"]
+)
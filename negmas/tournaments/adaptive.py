@@ -0,0 +1,129 @@
+"""
+Helpers for adaptive tournaments that stop scheduling runs once the ranking of competitors is clear.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from scipy.stats import t as student_t
+
+from negmas.helpers.numeric import truncated_mean
+
+__all__ = ["score_intervals", "ranking_separated"]
+
+N_BOOTSTRAP = 1000
+
+_STATS: dict[str, Callable[..., np.ndarray]] = {
+    "mean": lambda x, axis: np.mean(x, axis=axis),
+    "median": lambda x, axis: np.median(x, axis=axis),
+    "50%": lambda x, axis: np.median(x, axis=axis),
+    "25%": lambda x, axis: np.percentile(x, 25, axis=axis),
+    "75%": lambda x, axis: np.percentile(x, 75, axis=axis),
+    "min": lambda x, axis: np.min(x, axis=axis),
+    "max": lambda x, axis: np.max(x, axis=axis),
+    "std": lambda x, axis: np.std(x, axis=axis, ddof=1),
+    "var": lambda x, axis: np.var(x, axis=axis, ddof=1),
+    "sum": lambda x, axis: np.sum(x, axis=axis),
+    "truncated_mean": lambda x, axis: np.apply_along_axis(truncated_mean, axis, x),
+}
+
+
+def _bootstrap(
+    x: np.ndarray, stat: str | Callable, alpha: float, n_bootstrap: int, rng
+) -> tuple[float, float, float]:
+    samples = x[rng.integers(0, len(x), size=(n_bootstrap, len(x)))]
+    if isinstance(stat, str):
+        f = _STATS[stat]
+        value, boot = float(f(x, None)), f(samples, 1)
+    else:
+        value = float(stat(x))
+        boot = np.asarray([stat(_) for _ in samples])
+    low, high = np.quantile(boot, [alpha / 2, 1 - alpha / 2])
+    return value, float(low), float(high)
+
+
+def score_intervals(
+    scores: pd.DataFrame,
+    by: str,
+    column: str,
+    stat: str | Callable[[np.ndarray], float] = "mean",
+    confidence: float = 0.95,
+    adjust: bool = True,
+    n_bootstrap: int = N_BOOTSTRAP,
+    seed: int | None = None,
+) -> pd.DataFrame:
+    """
+    Calculates confidence intervals of the final-score statistic of every competitor.
+
+    Args:
+        scores: Scores of all competitors in all runs (one row per competitor per run)
+        by: The column identifying competitors (e.g. strategy, agent_type)
+        column: The column containing the measure to score (e.g. advantage, score)
+        stat: The statistic applied to the measure. One of mean, median, min, max, std, var, sum,
+              truncated_mean, 25%, 50%, 75% or a callable receiving an array of values.
+        confidence: The confidence level of the intervals (e.g. 0.95)
+        adjust: If given, the confidence of each interval is raised (Bonferroni) so that all intervals
+                hold simultaneously at `confidence`
+        n_bootstrap: Number of bootstrap samples used for statistics other than the mean
+        seed: Seed of the bootstrap sampler
+
+    Returns:
+        A dataframe with the columns `by`, score, low, high and n sorted by score (descending).
+
+    Remarks:
+        - The interval of the mean uses the Student t distribution. Other statistics use percentile bootstrap.
+        - Competitors with less than two valid values get an unbounded interval.
+    """
+    groups = [
+        (name, group[column].to_numpy(dtype=float))
+        for name, group in scores.groupby(by)
+    ]
+    alpha = 1 - confidence
+    if adjust and groups:
+        alpha /= len(groups)
+    rng = np.random.default_rng(seed)
+    records = []
+    for name, x in groups:
+        x = x[~np.isnan(x)]
+        n = len(x)
+        if n < 2:
+            value = (
+                float("nan")
+                if n < 1
+                else float(_STATS[stat](x, None) if isinstance(stat, str) else stat(x))
+            )
+            low, high = float("-inf"), float("inf")
+        elif stat == "mean":
+            value = float(x.mean())
+            half = student_t.ppf(1 - alpha / 2, n - 1) * x.std(ddof=1) / np.sqrt(n)
+            low, high = value - half, value + half
+        else:
+            value, low, high = _bootstrap(x, stat, alpha, n_bootstrap, rng)
+        records.append({by: name, "score": value, "low": low, "high": high, "n": n})
+    return (
+        pd.DataFrame.from_records(records, columns=[by, "score", "low", "high", "n"])
+        .sort_values("score", ascending=False)
+        .reset_index(drop=True)
+    )
+
+
+def ranking_separated(intervals: pd.DataFrame, top_k: int | None = None) -> bool:
+    """
+    Checks whether the ranking implied by the given intervals is statistically clear.
+
+    Args:
+        intervals: Confidence intervals as returned by `score_intervals`
+        top_k: Only the first `top_k` positions of the ranking need to be separated (`None` for all positions)
+
+    Returns:
+        `True` if the interval of every competitor (down to position `top_k`) lies strictly above the
+        interval of the next competitor in the ranking.
+    """
+    if len(intervals) < 2:
+        return True
+    n = len(intervals) - 1 if top_k is None else min(top_k, len(intervals) - 1)
+    low, high = intervals["low"].to_numpy(), intervals["high"].to_numpy()
+    return bool(np.all(low[:n] > high[1 : n + 1]))
@@ -8,9 +8,11 @@ import sys
 import shutil
 import datetime
 import copy
-from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed, TimeoutError
+from contextlib import nullcontext
 import traceback
 from concurrent.futures.process import BrokenProcessPool
+from collections import defaultdict
 from itertools import product
 from math import exp, log, isinf
 from os import cpu_count
@@ -23,9 +25,17 @@ import matplotlib.pyplot as plt
 import pandas as pd
 from attr import asdict, define
 from rich.progress import track
+from negmas import warnings
 from negmas.common import TraceElement
 
 from negmas.helpers import unique_name
+from negmas.helpers.limits import (
+    ResourceLimitExceeded,
+    ResourceLimits,
+    RunMarkers,
+    call_with_limits,
+    set_worker_limits,
+)
 from negmas.helpers.inout import dump, has_needed_files, load
 from negmas.helpers.strings import humanize_time, shortest_unique_names
 from negmas.helpers.types import get_class, get_full_type_name
@@ -43,6 +53,8 @@ from negmas.preferences.ops import (
 from negmas.sao.common import SAOState
 from negmas.sao.mechanism import SAOMechanism
 from negmas.serialization import serialize, to_flat_dict
+from negmas.tournaments.adaptive import ranking_separated, score_intervals
+from negmas.tournaments.pool import WorkerPool, resolve_shared
 import signal
 import os
 import time
@@ -54,6 +66,7 @@ __all__ = [
     "combine_tournaments",
 ]
 MAX_TASKS_PER_CHILD = 10
+MAX_CRASHES_PER_RUN = 2
 LOG_UNIFORM_LIMIT = 10
 TERMINATION_WAIT_TIME = 10.0
 
@@ -900,7 +913,7 @@ def run_negotiation(
     Run a single negotiation with fully specified parameters
 
     Args:
-        s: The `Scenario` representing the negotiation (outcome space and preferences).
+        s: The `Scenario` representing the negotiation (outcome space and preferences) or a `SharedRef` to it.
         partners: The partners running the negotiation in order of addition to the mechanism.
         real_scenario_name: The real name of the scenario (used when saving logs).
         partner_names: Names of partners. Either `None` for defaults or a tuple of the same length as `partners`
@@ -914,7 +927,7 @@ def run_negotiation(
         plot: If true, save a plot of the negotiation (only if `path` is given)
         plot_params: Parameters to pass to the plotting function
         run_id: A unique ID for this run. If not given one is generated based on date and time
-        stats: statistics of the scenario. If not given or `path` is `None`, statistics are not saved
+        stats: statistics of the scenario (or a `SharedRef` to them). If not given or `path` is `None`, statistics are not saved
         annotation: Common information saved in the mechanism's annotation (accessible by negotiators using `self.nmi.annotation`). `None` for nothing
         private_infos: Private information saved in the negotiator's `private_info` attribute (accessible by negotiators as `self.private_info`). `None` for nothing
         id_reveals_type: Each negotiator ID will reveal its type.
@@ -924,6 +937,7 @@ def run_negotiation(
     Returns:
         A dictionary of negotiation results that contains the final state of the negotiation alongside other information
     """
+    s, stats = resolve_shared(s), resolve_shared(stats)
     m, failures, s, real_scenario_name = _make_mechanism(
         s=s,
         partners=partners,
@@ -1019,11 +1033,17 @@ def failed_run_record(
     mask_scenario_name: bool = True,
     ignore_exceptions: bool = False,
     stats: ScenarioStats | None = None,
+    timedout: bool = True,
 ):
     if partner_params is None:
         partner_params = tuple(dict() for _ in partners)  # type: ignore
     param_dump = tuple(str(to_flat_dict(_)) if _ else None for _ in partner_params)  # type: ignore
     execution_time = timeout
+    reason = (
+        f"Timedout after {timeout} with error {error}"
+        if timedout
+        else f"Failed with error {error}"
+    )
     try:
         m, _, s, real_scenario_name = _make_mechanism(
             s=s,
@@ -1045,9 +1065,9 @@ def failed_run_record(
         )
         state = m.state
         state.has_error = True
-        state.timedout = True
+        state.timedout = timedout
         state.started = True
-        state.error_details = f"Timedout after {timeout} with error {error}"
+        state.error_details = reason
 
         run_record = _make_record(
             m=m,
@@ -1064,11 +1084,9 @@ def failed_run_record(
         m = SAOMechanism()
         state = SAOState()
         state.has_error = True
-        state.timedout = True
+        state.timedout = timedout
         state.started = True
-        state.error_details = (
-            f"Timedout after {timeout} with exception {error} then Raised {e}"
-        )
+        state.error_details = f"{reason} then Raised {e}"
         run_record = _make_failure_record(
             state=state,
             s=s,
@@ -1183,6 +1201,12 @@ def cartesian_tournament(
     raise_exceptions: bool = True,
     mask_scenario_names: bool = True,
     only_failures_on_self_play: bool = False,
+    resource_limits: ResourceLimits | None = None,
+    executor: Executor | None = None,
+    confidence: float | None = None,
+    wave_size: int = 1,
+    min_repetitions: int = 2,
+    separate_top: int | None = None,
 ) -> SimpleTournamentResults:
     """A simplified version of Cartesian tournaments not using the internal machinay of NegMAS  tournaments
 
@@ -1226,6 +1250,20 @@ def cartesian_tournament(
         shorten_names: If True, shorter versions of names will be used for results
         raise_exceptions: When given, negotiators and mechanisms are allowed to raise exceptions stopping the tournament
         mask_scenario_names: If given, scenario names will be masked so that the negotiators do not know the original scenario name
+        resource_limits: Memory and CPU limits applied to every negotiation (see `ResourceLimits`). A negotiation exceeding them, or
+                         crashing its worker process, is recorded as a failure and the tournament continues with a fresh worker.
+                         `max_memory` is process-wide and only applied to the workers of the local process pool. It is ignored
+                         (with a warning) when running serially or on a given `executor` (pass it to `WorkerPool` instead).
+        executor: An executor to run negotiations on instead of a local process pool (e.g. a `WorkerPool` kept warm across
+                  tournaments or a `TCPExecutor` serving workers on other machines). It is not shut down at the end of the
+                  tournament and `njobs` is ignored when it is given.
+        confidence: If given, the tournament is adaptive. Repetitions are run in waves and no more waves are scheduled once
+                    the ranking of competitors (by `final_score`) is separated at this confidence level (e.g. 0.95). In
+                    this case, `n_repetitions` is the maximum number of repetitions (the budget).
+        wave_size: Number of repetitions of every scenario/partner combination in each wave of an adaptive tournament.
+        min_repetitions: Minimum number of repetitions to run before an adaptive tournament can stop.
+        separate_top: If given, an adaptive tournament stops once the top `separate_top` positions of the ranking are
+                      separated (instead of the whole ranking).
 
     Returns:
         A pandas DataFrame with all negotiation results.
@@ -1388,9 +1426,17 @@ def cartesian_tournament(
         shuffle(runs)
     if sort_runs:
         runs = sorted(runs, key=lambda x: scenario_size(x["s"]))
+    if confidence is None:
+        waves = [runs]
+    else:
+        wave_size = max(1, wave_size)
+        waves = [
+            [_ for _ in runs if start <= _["rep"] < start + wave_size]
+            for start in range(0, n_repetitions, wave_size)
+        ]
     if verbosity > 0:
         print(
-            f"Will run {len(runs)} negotiations on {len(scenarios)} scenarios between {len(competitors)} competitors",
+            f"Will run {'up to ' if len(waves) > 1 else ''}{len(runs)} negotiations on {len(scenarios)} scenarios between {len(competitors)} competitors",
             flush=True,
         )
     results, scores = [], []
@@ -1404,7 +1450,7 @@ def cartesian_tournament(
                 return results, scores
         results.append(record)
         scores += make_scores(record)
-        if results_path and save_every and i % save_every == 0:
+        if results_path and save_every and len(results) % save_every == 0:
             pd.DataFrame.from_records(results).to_csv(results_path, index_label="index")
             pd.DataFrame.from_records(scores).to_csv(scores_path, index_label="index")
         return results, scores
@@ -1412,13 +1458,32 @@ def cartesian_tournament(
     def get_run_id(info):
         return hash(str(serialize(info)))
 
-    if njobs < 0:
-        for i, info in enumerate(
-            track(runs, total=len(runs), description=NEGOTIATIONS_DIR_NAME)
-        ):
-            process_record(run_negotiation(**info, run_id=get_run_id(info)))
+    def failure_record(info, run_id, error, timeout=0.0, timedout=False):
+        params = {
+            k: v
+            for k, v in info.items()
+            if k not in ("verbosity", "plot", "plot_params")
+        }
+        return failed_run_record(
+            **params,
+            run_id=run_id,
+            timeout=timeout if timeout is not None else 0.0,
+            error=error,
+            timedout=timedout,
+        )
 
-    else:
+    def run_serially(runs):
+        for info in track(runs, total=len(runs), description=NEGOTIATIONS_DIR_NAME):
+            run_id = get_run_id(info)
+            try:
+                record = call_with_limits(
+                    resource_limits, None, run_negotiation, **info, run_id=run_id
+                )
+            except ResourceLimitExceeded as e:
+                record = failure_record(info, run_id, str(e))
+            process_record(record)
+
+    def run_in_parallel(runs):
         timeout = external_timeout if external_timeout else float("inf")
 
         def _safe_max(x) -> float:
@@ -1450,75 +1515,202 @@ def cartesian_tournament(
                 f"[magenta]Will use {timeout} as a timeout when receiving results[/magenta]"
             )
 
-        futures = dict()
         n_cores = cpu_count()
         if n_cores is None:
             n_cores = 4
         cpus = min(n_cores, njobs) if njobs else cpu_count()
-        kwargs_ = dict(max_workers=cpus)
+        kwargs_ = dict(
+            max_workers=cpus,
+            initializer=set_worker_limits,
+            initargs=(resource_limits,),
+        )
         version = sys.version_info
         if version.major > 3 or version.minor > 10:
             kwargs_.update(max_tasks_per_child=MAX_TASKS_PER_CHILD)
 
-        with ProcessPoolExecutor(**kwargs_) as pool:  # type: ignore
-            for info in runs:
-                futures[
-                    pool.submit(run_negotiation, **info, run_id=get_run_id(info))
-                ] = info
-            for i, f in enumerate(
-                track(
-                    as_completed(futures),
-                    total=len(futures),
-                    description=NEGOTIATIONS_DIR_NAME,
-                )
-            ):
-                try:
-                    result = f.result(timeout=timeout)
-                    process_record(result)
-                except TimeoutError:
-                    info = futures.get(f, dict(partners=["Unknown", "Unknown"]))
-                    print(
-                        f"[red]Negotiation between {info['partners']} [bold]timedout[/bold] [red] after {timeout} seconds ...\n\tKilling the process",
-                        end="",
-                    )
-                    if len(info) > 1:
-                        result = failed_run_record(**info)
-                        process_record(result)
-
-                    f.cancel()
-                    try:
-                        if os.name == "nt":  # Check if running on Windows
-                            pool._processes[f._process_ident].terminate()
-                        else:
-                            os.kill(
-                                f._process_ident,  # type: ignore
-                                signal.SIGTERM,
-                            )  # Default to SIGTERM
-                            time.sleep(
-                                TERMINATION_WAIT_TIME
-                            )  # Allow brief time for termination
-                            if not pool._processes[f._process_ident].is_alive():  # type: ignore
-                                os.kill(
-                                    f._process_ident,  # type: ignore
-                                    signal.SIGKILL,
-                                )  # Forceful if needed
-                        print("[yellow]SUCCEEDED[/yellow]")
-                    except Exception as e:
-                        print(f"[red]FAILED[/red] with exception {e}")
+        run_ids = [get_run_id(info) for info in runs]
+        # a warm pool gets scenarios (and their stats) once instead of with every run
+        pooled = isinstance(executor, WorkerPool)
+        shared = [dict() for _ in runs]
+        if pooled:
+            for info, d in zip(runs, shared):
+                d["s"] = executor.share(info["s"])  # type: ignore
+                if info["stats"] is not None:
+                    d["stats"] = executor.share(info["stats"])  # type: ignore
+        # indices of runs that are not finished yet. A run is only resubmitted
+        # if the pool broke (i.e. a worker died) before it finished
+        remaining = list(range(len(runs)))
+        crashes = defaultdict(int)
+        markers = RunMarkers()
+        i = -1
+        try:
+            while remaining:
+                futures, finished, processes = dict(), set(), None
+                with (
+                    ProcessPoolExecutor(**kwargs_)  # type: ignore
+                    if executor is None
+                    else nullcontext(executor)
+                ) as pool:
+                    for k in remaining:
+                        futures[
+                            pool.submit(
+                                call_with_limits,
+                                resource_limits,
+                                markers.marker(str(k))
+                                if executor is None or pooled
+                                else None,
+                                run_negotiation,
+                                **(runs[k] | shared[k]),
+                                run_id=run_ids[k],
+                            )
+                        ] = k
+                    for i, f in enumerate(
+                        track(
+                            as_completed(futures),
+                            total=len(futures),
+                            description=NEGOTIATIONS_DIR_NAME,
+                        ),
+                        start=i + 1,
+                    ):
+                        k = futures[f]
+                        info = runs[k]
+                        try:
+                            result = f.result(timeout=timeout)
+                            finished.add(k)
+                            process_record(result)
+                        except TimeoutError:
+                            finished.add(k)
+                            print(
+                                f"[red]Negotiation between {info['partners']} [bold]timedout[/bold] [red] after {timeout} seconds ...\n\tKilling the process",
+                                end="",
+                            )
+                            process_record(
+                                failure_record(
+                                    info,
+                                    run_ids[k],
+                                    "TimeoutError",
+                                    timeout=timeout,
+                                    timedout=True,
+                                )
+                            )
 
-                except BrokenProcessPool as e:
-                    if verbosity > 1:
-                        print("[red]Broken Pool[/red]")
-                        print(e)
+                            f.cancel()
+                            try:
+                                if os.name == "nt":  # Check if running on Windows
+                                    pool._processes[f._process_ident].terminate()
+                                else:
+                                    os.kill(
+                                        f._process_ident,  # type: ignore
+                                        signal.SIGTERM,
+                                    )  # Default to SIGTERM
+                                    time.sleep(
+                                        TERMINATION_WAIT_TIME
+                                    )  # Allow brief time for termination
+                                    if not pool._processes[f._process_ident].is_alive():  # type: ignore
+                                        os.kill(
+                                            f._process_ident,  # type: ignore
+                                            signal.SIGKILL,
+                                        )  # Forceful if needed
+                                print("[yellow]SUCCEEDED[/yellow]")
+                            except Exception as e:
+                                print(f"[red]FAILED[/red] with exception {e}")
+
+                        except ResourceLimitExceeded as e:
+                            finished.add(k)
+                            if verbosity > 1:
+                                print(
+                                    f"[red]Negotiation between {info['partners']} exceeded its resource limits[/red]: {e}"
+                                )
+                            process_record(failure_record(info, run_ids[k], str(e)))
+                        except BrokenProcessPool as e:
+                            if verbosity > 1:
+                                print("[red]Broken Pool[/red]")
+                                print(e)
+                            processes = dict(getattr(pool, "_processes", None) or dict())
+                            break
+                        except Exception as e:
+                            finished.add(k)
+                            if verbosity > 1:
+                                print("[red]Exception[/red]")
+                                if verbosity > 2:
+                                    print(traceback.format_exc())
+                                print(e)
+                    if executor is None:
+                        pool.shutdown(wait=False)
+                    # _stop_process_pool(pool)
+                for f, k in futures.items():
+                    if k in finished or not f.done() or f.cancelled():
+                        continue
+                    if f.exception() is not None:
+                        continue
+                    i += 1
+                    finished.add(k)
+                    process_record(f.result())
+                remaining = [k for k in futures.values() if k not in finished]
+                if not remaining:
                     break
-                except Exception as e:
-                    if verbosity > 1:
-                        print("[red]Exception[/red]")
-                        if verbosity > 2:
-                            print(traceback.format_exc())
-                        print(e)
-            pool.shutdown(wait=False)
-            # _stop_process_pool(pool)
+                # a worker died. Runs whose worker crashed are recorded as
+                # failures and the rest are run again on a fresh pool
+                culprits, in_flight = markers.crashed(processes)
+                if not culprits and not in_flight:
+                    in_flight = {str(_) for _ in remaining}
+                for key in in_flight:
+                    crashes[int(key)] += 1
+                failed = {int(_) for _ in culprits} | {
+                    k for k in remaining if crashes[k] >= MAX_CRASHES_PER_RUN
+                }
+                for k in failed:
+                    if k not in remaining:
+                        continue
+                    i += 1
+                    process_record(
+                        failure_record(
+                            runs[k], run_ids[k], "Worker process crashed"
+                        )
+                    )
+                remaining = [k for k in remaining if k not in failed]
+                if verbosity > 0 and remaining:
+                    print(
+                        f"[yellow]Worker crashed: restarting the pool for {len(remaining)} remaining negotiations[/yellow]"
+                    )
+        finally:
+            markers.cleanup()
+            if pooled:
+                executor.release([_ for d in shared for _ in d.values()])  # type: ignore
+
+    if (
+        resource_limits is not None
+        and resource_limits.max_memory is not None
+        and (njobs < 0 or executor is not None)
+    ):
+        warnings.warn(
+            f"max_memory ({resource_limits.max_memory}) is only applied to workers of the local process pool and will be "
+            f"ignored when running {'on the given executor' if executor is not None else 'serially'}",
+            warnings.NegmasIgnoredValueWarning,
+        )
+    for w, wave in enumerate(waves):
+        if njobs < 0 and executor is None:
+            run_serially(wave)
+        else:
+            run_in_parallel(wave)
+        n_reps = min((w + 1) * wave_size, n_repetitions)
+        if confidence is None or w == len(waves) - 1 or n_reps < min_repetitions:
+            continue
+        intervals = score_intervals(
+            pd.DataFrame.from_records(scores),
+            "strategy",
+            final_score[0],
+            final_score[1],
+            confidence=confidence,
+        )
+        if verbosity > 1:
+            print(intervals)
+        if ranking_separated(intervals, separate_top):
+            if verbosity > 0:
+                print(
+                    f"[green]Ranking separated at confidence {confidence} after {n_reps} of {n_repetitions} repetitions[/green]"
+                )
+            break
 
     tresults = SimpleTournamentResults.from_records(
         scores, results, final_score_stat=final_score, path=path
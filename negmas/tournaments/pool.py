@@ -0,0 +1,202 @@
+"""
+A process pool that stays alive (warm) across tournaments.
+
+Creating a process pool for every tournament means that every worker imports negmas (and its
+dependencies) and rebuilds its caches again. A `WorkerPool` is created once and passed to
+several tournaments (e.g. `cartesian_tournament(..., executor=pool)`). Its workers are only
+replaced when one of them crashes (breaking the pool) or after running a configured number of
+tasks.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import shutil
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from attrs import define
+
+from negmas.helpers.limits import ResourceLimits, set_worker_limits
+from negmas.helpers.types import get_class, get_full_type_name
+
+__all__ = ["WorkerPool", "SharedRef", "resolve_shared"]
+
+MAX_SHARED_CACHE = 128
+"""Maximum number of shared objects kept loaded in every worker"""
+
+# objects loaded by this process (worker) from shared references
+_shared_cache: OrderedDict[str, Any] = OrderedDict()
+# classes preloaded by the initializer of this process (worker)
+_preloaded: dict[str, type] = dict()
+
+
+@define(frozen=True)
+class SharedRef:
+    """
+    A reference to an object shared by a `WorkerPool` with its workers.
+
+    The object is pickled to disk once when shared. Each worker loads it the first time it is
+    needed and keeps it in memory for subsequent tasks (see `MAX_SHARED_CACHE`).
+    """
+
+    path: str
+
+    def get(self) -> Any:
+        """Returns the referenced object (loading it if this process did not load it already)"""
+        try:
+            obj = _shared_cache[self.path]
+            _shared_cache.move_to_end(self.path)
+            return obj
+        except KeyError:
+            pass
+        with open(self.path, "rb") as f:
+            obj = pickle.load(f)
+        _shared_cache[self.path] = obj
+        if len(_shared_cache) > MAX_SHARED_CACHE:
+            _shared_cache.popitem(last=False)
+        return obj
+
+
+def resolve_shared(x: Any) -> Any:
+    """Returns the object referenced by `x` if it is a `SharedRef` otherwise `x` itself"""
+    if isinstance(x, SharedRef):
+        return x.get()
+    return x
+
+
+def _init_worker(
+    limits: ResourceLimits | None,
+    preload: tuple[str, ...],
+    initializer: Callable | None,
+    initargs: tuple,
+) -> None:
+    set_worker_limits(limits)
+    for name in preload:
+        _preloaded[name] = get_class(name)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class WorkerPool(Executor):
+    """
+    A process pool that can be reused by multiple tournaments.
+
+    Args:
+        max_workers: Number of worker processes (`None` for the number of CPUs)
+        max_tasks_per_child: If given, every worker is replaced after running this number of tasks. By
+                             default, workers are only replaced when the pool breaks (a worker crashed).
+        preload: Classes (or their full names) to import in every worker when it starts (e.g. competitors)
+        resource_limits: Process-wide limits applied to every worker (see `ResourceLimits`)
+        initializer: An optional callable run in every worker after preloading (e.g. to warm caches)
+        initargs: Arguments passed to `initializer`
+        mp_context: The multiprocessing context used to start workers
+
+    Remarks:
+        - The pool follows the `concurrent.futures.Executor` interface and can be used as a context manager.
+        - Use `share` to send large objects (e.g. scenarios) to workers once instead of with every task.
+        - Passing `max_tasks_per_child` makes python start workers with the `spawn` method (which is
+          slower) unless an `mp_context` is given.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_tasks_per_child: int | None = None,
+        preload: Iterable[type | str] = (),
+        resource_limits: ResourceLimits | None = None,
+        initializer: Callable | None = None,
+        initargs: tuple = (),
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ):
+        preload = tuple(
+            _ if isinstance(_, str) else get_full_type_name(_) for _ in preload
+        )
+        self._kwargs: dict[str, Any] = dict(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(resource_limits, preload, initializer, initargs),
+        )
+        if max_tasks_per_child is not None:
+            self._kwargs["max_tasks_per_child"] = max_tasks_per_child
+        self._shared_dir = Path(tempfile.mkdtemp(prefix="negmas-shared-"))
+        self._shared: dict[int, tuple[Any, SharedRef]] = dict()
+        self._n_shared = 0
+        self.n_restarts = 0
+        self._executor = ProcessPoolExecutor(**self._kwargs)
+
+    @property
+    def processes(self) -> dict[int, multiprocessing.Process]:
+        """A mapping from PIDs to the worker processes currently in the pool"""
+        return dict(self._executor._processes or dict())  # type: ignore
+
+    # mirrors ProcessPoolExecutor so that callers can inspect (and terminate) workers
+    _processes = processes
+
+    @property
+    def broken(self) -> bool:
+        """Is the pool broken (i.e. a worker died abruptly)?"""
+        return bool(self._executor._broken)  # type: ignore
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Schedules `fn(*args, **kwargs)` to run on one of the workers (restarting the pool if it is broken)"""
+        self.ensure_running()
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def restart(self) -> None:
+        """Replaces all workers (needed after the pool breaks). Tasks not finished are lost"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = ProcessPoolExecutor(**self._kwargs)
+        self.n_restarts += 1
+
+    def ensure_running(self) -> None:
+        """Restarts the pool if it is broken"""
+        if self.broken:
+            self.restart()
+
+    def share(self, obj: Any) -> SharedRef:
+        """
+        Shares an object with all workers.
+
+        Returns:
+            A `SharedRef` that can be passed to tasks instead of the object. Tasks get the object
+            using `SharedRef.get()`. Sharing the same object again returns the same reference.
+
+        Remarks:
+            - The object is copied when shared. Changes made to it later are not seen by workers
+              unless it is released (see `release`) and shared again.
+        """
+        try:
+            o, ref = self._shared[id(obj)]
+            if o is obj:
+                return ref
+        except KeyError:
+            pass
+        path = self._shared_dir / str(self._n_shared)
+        self._n_shared += 1
+        with open(path, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        ref = SharedRef(str(path))
+        # keeping the object alive guarantees that its id is not reused
+        self._shared[id(obj)] = (obj, ref)
+        return ref
+
+    def release(self, refs: Iterable[SharedRef] | None = None) -> None:
+        """Stops sharing the given objects (all shared objects if `refs` is `None`)"""
+        paths = None if refs is None else {_.path for _ in refs}
+        for k, (_, ref) in list(self._shared.items()):
+            if paths is not None and ref.path not in paths:
+                continue
+            del self._shared[k]
+            Path(ref.path).unlink(missing_ok=True)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stops all workers and removes shared objects"""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        self._shared.clear()
+        shutil.rmtree(self._shared_dir, ignore_errors=True)
@@ -0,0 +1,393 @@
+"""
+A light-weight TCP work-queue for running tournaments on multiple machines without dask.
+
+A `TCPExecutor` (the coordinator) keeps a queue of tasks and serves them over TCP to
+workers started using `run_worker` (or `negmas tournament worker` from the command line)
+on the same or other hosts. Workers pull one task at a time, send heartbeats while running
+it and push the result back. Tasks of workers that disconnect or stop sending heartbeats
+are requeued.
+
+Remarks:
+    - Tasks and results are pickled. Only run workers against coordinators you trust and
+      use a private `authkey` on shared networks. The key can be passed explicitly or set in
+      the `NEGMAS_TCP_AUTHKEY` environment variable. The public default key is only accepted
+      for coordinators listening on a loopback interface.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import multiprocessing
+import os
+import pickle
+import socket
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable
+
+from rich import print
+
+__all__ = ["TCPExecutor", "run_worker", "DEFAULT_TCP_PORT", "AUTHKEY_ENV_VAR"]
+
+DEFAULT_TCP_PORT = 8787
+DEFAULT_AUTHKEY = b"negmas"
+AUTHKEY_ENV_VAR = "NEGMAS_TCP_AUTHKEY"
+"""Environment variable used for the authentication key when none is passed explicitly"""
+HEARTBEAT_INTERVAL = 2.0
+HEARTBEAT_TIMEOUT = 30.0
+MAX_REQUEUES = 3
+
+
+def resolve_authkey(authkey: bytes | str | None) -> bytes:
+    """Returns the given key, the one in the `AUTHKEY_ENV_VAR` environment variable or the default key"""
+    if authkey is None:
+        authkey = os.environ.get(AUTHKEY_ENV_VAR, None) or DEFAULT_AUTHKEY
+    if isinstance(authkey, str):
+        authkey = authkey.encode("utf-8")
+    return authkey
+
+
+def is_loopback(host: str) -> bool:
+    """Is the given host only reachable from this machine?"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class _Task:
+    __slots__ = ("id", "fn", "args", "kwargs", "future", "n_requeues")
+
+    def __init__(self, id: int, fn, args, kwargs, future: Future):
+        self.id, self.fn, self.args, self.kwargs = id, fn, args, kwargs
+        self.future = future
+        self.n_requeues = 0
+
+
+class TCPExecutor:
+    """
+    Serves tasks to workers connecting over TCP.
+
+    Args:
+        host: The interface to listen on (use "0.0.0.0" to accept remote workers)
+        port: The port to listen on (0 to choose a free port. See `address`)
+        authkey: Shared key used to authenticate workers. If not given, the one in the `NEGMAS_TCP_AUTHKEY`
+                 environment variable (or the public default key) is used
+        n_local_workers: Number of worker processes to start on this machine
+        heartbeat_timeout: Seconds without hearing from a worker running a task before it is considered lost
+        max_requeues: Maximum number of times a task is requeued after losing its worker before it fails
+        verbose: Print connection events
+
+    Remarks:
+        - The executor follows the `concurrent.futures.Executor` interface (`submit`, `map`, `shutdown`)
+          so the returned futures can be used with `concurrent.futures.as_completed`.
+        - Listening on an interface other than loopback with the public default key raises a `ValueError`
+          because anyone reaching the port could exchange pickles with the executor.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_TCP_PORT,
+        authkey: bytes | str | None = None,
+        n_local_workers: int = 0,
+        heartbeat_timeout: float = HEARTBEAT_TIMEOUT,
+        max_requeues: int = MAX_REQUEUES,
+        verbose: bool = False,
+    ):
+        authkey = resolve_authkey(authkey)
+        if authkey == DEFAULT_AUTHKEY and not is_loopback(host):
+            raise ValueError(
+                f"Refusing to listen on {host} with the default authentication key. Pass a private "
+                f"authkey or set the {AUTHKEY_ENV_VAR} environment variable"
+            )
+        self._listener = Listener((host, port), authkey=authkey)
+        self._authkey = authkey
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_requeues = max_requeues
+        self.verbose = verbose
+        self._queue: deque[_Task] = deque()
+        self._cond = threading.Condition()
+        self._next_id = 0
+        self._shutdown = False
+        self._connections: set[Connection] = set()
+        self._local_workers: list[multiprocessing.Process] = []
+        self._acceptor = threading.Thread(target=self._accept, daemon=True)
+        self._acceptor.start()
+        for _ in range(n_local_workers):
+            self.start_local_worker()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The (host, port) workers should connect to"""
+        return self._listener.address  # type: ignore
+
+    @property
+    def n_pending(self) -> int:
+        """Number of tasks waiting for a worker"""
+        with self._cond:
+            return len(self._queue)
+
+    def start_local_worker(self) -> multiprocessing.Process:
+        """Starts a worker process on this machine connected to this executor"""
+        host, port = self.address
+        p = multiprocessing.Process(
+            target=run_worker,
+            kwargs=dict(
+                host=host,
+                port=port,
+                authkey=self._authkey,
+                heartbeat_interval=min(HEARTBEAT_INTERVAL, self.heartbeat_timeout / 4),
+            ),
+            daemon=True,
+        )
+        p.start()
+        self._local_workers.append(p)
+        return p
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Schedules `fn(*args, **kwargs)` to be run by some worker"""
+        future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            self._queue.append(_Task(self._next_id, fn, args, kwargs, future))
+            self._next_id += 1
+            self._cond.notify()
+        return future
+
+    def map(self, fn: Callable, *iterables):
+        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        for f in fs:
+            yield f.result()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stops serving tasks. Workers are told to stop when they ask for the next task."""
+        with self._cond:
+            self._shutdown = True
+            if cancel_futures:
+                while self._queue:
+                    self._queue.popleft().future.cancel()
+            self._cond.notify_all()
+        if wait:
+            with self._cond:
+                self._cond.wait_for(lambda: not self._connections, timeout=None)
+            for p in self._local_workers:
+                p.join()
+        self._wake_acceptor()
+        self._acceptor.join()
+        try:
+            self._listener.close()
+        except Exception:
+            pass
+
+    def _wake_acceptor(self) -> None:
+        """Connects to the listener so that the acceptor thread returns from `accept` (closing does not wake it)"""
+        if not self._acceptor.is_alive():
+            return
+        host, port = self.address
+        try:
+            if ipaddress.ip_address(host).is_unspecified:
+                host = "::1" if ipaddress.ip_address(host).version == 6 else "127.0.0.1"
+        except ValueError:
+            pass
+        try:
+            # the handshake fails and the acceptor stops as the executor is shut down
+            with socket.create_connection((host, port), timeout=1):
+                pass
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown(wait=True)
+        return False
+
+    def _accept(self):
+        while True:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                # the listener was closed or the handshake failed
+                with self._cond:
+                    if self._shutdown:
+                        return
+                continue
+            with self._cond:
+                if self._shutdown:
+                    conn.close()
+                    return
+                self._connections.add(conn)
+            if self.verbose:
+                print(f"[green]Worker connected[/green] ({len(self._connections)} connected)")
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _next_task(self) -> _Task | None:
+        with self._cond:
+            while True:
+                while self._queue:
+                    task = self._queue.popleft()
+                    if task.future.done() or (
+                        not task.future.running()
+                        and not task.future.set_running_or_notify_cancel()
+                    ):
+                        continue
+                    return task
+                if self._shutdown:
+                    return None
+                self._cond.wait()
+
+    def _requeue(self, task: _Task, reason: str):
+        task.n_requeues += 1
+        if task.n_requeues > self.max_requeues:
+            task.future.set_exception(
+                RuntimeError(f"Task lost its worker too many times ({reason})")
+            )
+            return
+        with self._cond:
+            self._queue.appendleft(task)
+            self._cond.notify()
+
+    def _serve(self, conn: Connection):
+        task = None
+        try:
+            while True:
+                msg = conn.recv()
+                if msg[0] != "ready":
+                    continue
+                task = self._next_task()
+                if task is None:
+                    conn.send(("stop",))
+                    return
+                try:
+                    conn.send(("task", task.id, task.fn, task.args, task.kwargs))
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    # the task cannot be sent to any worker
+                    task.future.set_exception(e)
+                    task = None
+                    conn.send(("skip",))
+                    continue
+                while True:
+                    if not conn.poll(self.heartbeat_timeout):
+                        raise TimeoutError("worker stopped sending heartbeats")
+                    msg = conn.recv()
+                    if msg[0] == "heartbeat":
+                        continue
+                    _, _, ok, value = msg
+                    if ok:
+                        task.future.set_result(value)
+                    else:
+                        task.future.set_exception(value)
+                    task = None
+                    break
+        except Exception as e:
+            if task is not None:
+                if self.verbose:
+                    print(f"[yellow]Lost worker ({e}): requeueing task {task.id}[/yellow]")
+                self._requeue(task, str(e))
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            with self._cond:
+                self._connections.discard(conn)
+                self._cond.notify_all()
+
+
+def _heartbeat(conn: Connection, lock: threading.Lock, task_id, stop, interval):
+    while not stop.wait(interval):
+        try:
+            with lock:
+                conn.send(("heartbeat", task_id))
+        except Exception:
+            return
+
+
+def run_worker(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_TCP_PORT,
+    authkey: bytes | str | None = None,
+    heartbeat_interval: float = HEARTBEAT_INTERVAL,
+    max_tasks: int | None = None,
+    connect_timeout: float = 60.0,
+    verbose: bool = False,
+) -> int:
+    """
+    Runs a worker that pulls tasks from a `TCPExecutor` until it is told to stop.
+
+    Args:
+        host: Address of the coordinator
+        port: Port of the coordinator
+        authkey: Shared key used to authenticate with the coordinator. If not given, the one in the
+                 `NEGMAS_TCP_AUTHKEY` environment variable (or the public default key) is used
+        heartbeat_interval: Seconds between heartbeats sent while running a task
+        max_tasks: Maximum number of tasks to run before exiting (`None` for no limit)
+        connect_timeout: Seconds to keep retrying to connect to the coordinator
+        verbose: Print the progress of the worker
+
+    Returns:
+        The number of tasks run.
+    """
+    authkey = resolve_authkey(authkey)
+    strt = time.perf_counter()
+    while True:
+        try:
+            conn = Client((host, port), authkey=authkey)
+            break
+        except ConnectionRefusedError:
+            if time.perf_counter() - strt > connect_timeout:
+                raise
+            time.sleep(0.5)
+    lock = threading.Lock()
+    n = 0
+    try:
+        while max_tasks is None or n < max_tasks:
+            with lock:
+                conn.send(("ready",))
+            msg = conn.recv()
+            if msg[0] == "stop":
+                break
+            if msg[0] == "skip":
+                continue
+            _, task_id, fn, args, kwargs = msg
+            stop = threading.Event()
+            beater = threading.Thread(
+                target=_heartbeat,
+                args=(conn, lock, task_id, stop, heartbeat_interval),
+                daemon=True,
+            )
+            beater.start()
+            try:
+                result = (task_id, True, fn(*args, **kwargs))
+            except Exception as e:
+                if verbose:
+                    print(traceback.format_exc())
+                result = (task_id, False, e)
+            finally:
+                stop.set()
+                beater.join()
+            with lock:
+                try:
+                    conn.send(("result", *result))
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    # pickling fails before anything is written to the socket
+                    error = RuntimeError(f"Cannot send the result of the task: {e}")
+                    conn.send(("result", task_id, False, error))
+            n += 1
+            if verbose:
+                print(f"Worker finished task {task_id} ({n} tasks so far)")
+    except (EOFError, OSError):
+        # the coordinator is gone
+        pass
+    finally:
+        conn.close()
+    return n
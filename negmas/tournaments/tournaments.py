@@ -44,9 +44,17 @@ from negmas.helpers import (
     unique_name,
 )
 from negmas.helpers.inout import dump, load
+from negmas.helpers.limits import (
+    ResourceLimits,
+    RunMarkers,
+    call_with_limits,
+    set_worker_limits,
+)
 from negmas.helpers.numeric import truncated_mean
 from negmas.serialization import serialize, to_flat_dict
 from negmas.situated import Agent, World, save_stats
+from negmas.tournaments.adaptive import ranking_separated, score_intervals
+from negmas.tournaments.tcp import DEFAULT_TCP_PORT, TCPExecutor
 
 __all__ = [
     "WorldGenerator",
@@ -64,6 +72,7 @@ __all__ = [
 ]
 
 MAX_TASKS_PER_CHILD = 10
+MAX_CRASHES_PER_RUN = 2
 TIMEOUT_EXTRA = 1.05
 
 
@@ -1187,7 +1196,13 @@ def process_world_run(
 
 
 def _get_executor(
-    method, verbose, scheduler_ip=None, scheduler_port=None, total_timeout=None
+    method,
+    verbose,
+    scheduler_ip=None,
+    scheduler_port=None,
+    total_timeout=None,
+    resource_limits: ResourceLimits | None = None,
+    authkey: bytes | str | None = None,
 ):
     """Returns an exeuctor object which has a submit method to submit calls to run worlds"""
     if method == "dask":
@@ -1214,6 +1229,28 @@ def _get_executor(
             partial(distributed.as_completed, raise_errors=True, with_results=False),  # type: ignore
         )
 
+    if method.startswith("tcp"):
+        n_local = method.split(":")
+        n_local = int(n_local[-1]) if len(n_local) > 1 else 0
+        if scheduler_ip is None:
+            scheduler_ip = "127.0.0.1"
+        if scheduler_port is None:
+            scheduler_port = DEFAULT_TCP_PORT
+        executor = TCPExecutor(
+            host=scheduler_ip,
+            port=int(scheduler_port),
+            authkey=authkey,
+            n_local_workers=n_local,
+            verbose=verbose,
+        )
+        if verbose:
+            host, port = executor.address
+            print(
+                f"Serving worlds on {host}:{port} ({n_local} local workers). Start more "
+                f"workers using:\n\t>> negmas tournament worker --ip {host} --port {port}"
+            )
+        return executor, futures.as_completed
+
     fraction = None
     parallelism = method.split(":")
     if len(parallelism) != 1:
@@ -1221,7 +1258,11 @@ def _get_executor(
     parallelism = parallelism[0]
     max_workers = fraction if fraction is None else max(1, int(fraction * cpu_count()))
 
-    kwargs_ = dict(max_workers=max_workers)
+    kwargs_ = dict(
+        max_workers=max_workers,
+        initializer=set_worker_limits,
+        initargs=(resource_limits,),
+    )
     version = sys.version_info
     if version.major > 3 or version.minor > 10:
         kwargs_.update(max_tasks_per_child=MAX_TASKS_PER_CHILD)
@@ -1241,9 +1282,15 @@ def _submit_all(
     attempts_path,
     verbose,
     max_attempts,
-) -> tuple[list[futures.Future], float | None]:
-    """Submits all processes to be executed by the executor"""
-    future_results = []
+    resource_limits: ResourceLimits | None = None,
+    markers: RunMarkers | None = None,
+) -> tuple[dict[futures.Future, str], float | None]:
+    """Submits all processes to be executed by the executor.
+
+    Returns:
+        A mapping from each future to the run ID of its world set and the timeout to use for receiving results
+    """
+    future_results = dict()
     timeout = float("-inf")
     for worlds_params in assigned:
         for w in worlds_params:
@@ -1259,8 +1306,11 @@ def _submit_all(
         run_id = _hash(worlds_params)
         if run_id in run_ids:
             continue
-        future_results.append(
+        future_results[
             executor.submit(
+                call_with_limits,
+                resource_limits,
+                markers.marker(run_id) if markers else None,
                 _run_worlds,
                 worlds_params,
                 world_generator,
@@ -1274,7 +1324,7 @@ def _submit_all(
                 max_attempts,
                 verbose,
             )
-        )
+        ] = run_id
     if verbose:
         print("Submitted all processes ", end="")
         if len(assigned) > 0:
@@ -1362,85 +1412,129 @@ def _run_parallel(
     attempts_path=None,
     total_timeout=None,
     max_attempts=float("inf"),
+    resource_limits: ResourceLimits | None = None,
+    authkey: bytes | str | None = None,
 ) -> None:
     """Runs the tournament in parallel"""
     strt = time.perf_counter()
-    executor, as_completed = _get_executor(
-        parallelism,
-        verbose,
-        total_timeout=total_timeout,
-        scheduler_ip=scheduler_ip,
-        scheduler_port=scheduler_port,
-    )
-    future_results, timeout = _submit_all(
-        executor,
-        assigned,
-        run_ids,
-        world_generator,
-        score_calculator,
-        world_progress_callback,
-        override_ran_worlds,
-        attempts_path,
-        verbose,
-        max_attempts,
-    )
-    n_world_configs = len(future_results)
-    if verbose:
-        print(
-            f"World timeout is {humanize_time(timeout, show_ms=True)} and total-timeout is {humanize_time(total_timeout, show_ms=True)}"
-        )
+    # markers of running world sets are only meaningful for local process pools
+    markers = RunMarkers() if parallelism.startswith("parallel") else None
+    run_ids, crashes = set(run_ids), defaultdict(int)
+    n_world_configs, i = None, -1
     _strt = time.perf_counter()
-    for i, future in track(
-        enumerate(as_completed(future_results)),
-        total=n_world_configs,
-        description="Simulating ...",
-    ):
-        if total_timeout is not None and time.perf_counter() - strt > total_timeout:
+    while True:
+        executor, as_completed = _get_executor(
+            parallelism,
+            verbose,
+            total_timeout=total_timeout,
+            scheduler_ip=scheduler_ip,
+            scheduler_port=scheduler_port,
+            resource_limits=resource_limits,
+            authkey=authkey,
+        )
+        future_results, timeout = _submit_all(
+            executor,
+            assigned,
+            run_ids,
+            world_generator,
+            score_calculator,
+            world_progress_callback,
+            override_ran_worlds,
+            attempts_path,
+            verbose,
+            max_attempts,
+            resource_limits,
+            markers,
+        )
+        if n_world_configs is None:
+            n_world_configs = len(future_results)
+            if verbose:
+                print(
+                    f"World timeout is {humanize_time(timeout, show_ms=True)} and total-timeout is {humanize_time(total_timeout, show_ms=True)}"
+                )
+        broken = None
+        for i, future in track(
+            enumerate(as_completed(future_results), start=i + 1),
+            total=len(future_results),
+            description="Simulating ...",
+        ):
+            if total_timeout is not None and time.perf_counter() - strt > total_timeout:
+                break
+            run_ids.add(future_results[future])
+            try:
+                (
+                    run_id,
+                    world_paths,
+                    score_,
+                    world_stats_,
+                    type_stats_,
+                    agent_stats_,
+                ) = future.result(timeout=timeout)
+                save_run_results(
+                    run_id,
+                    score_,
+                    world_stats_,
+                    type_stats_,
+                    agent_stats_,
+                    tournament_progress_callback,
+                    world_paths,
+                    name,
+                    verbose,
+                    _strt,
+                    attempts_path,
+                    n_world_configs,
+                    i,
+                )
+            except futures.TimeoutError:
+                if tournament_progress_callback is not None:
+                    tournament_progress_callback(None, i, n_world_configs)
+                # if verbose:
+                print(
+                    "[yellow]World timed-out in {humanize_time(timeout, show_us=True)}[/yellow]"
+                )
+            except futures.process.BrokenProcessPool as e:
+                run_ids.discard(future_results[future])
+                broken = dict(executor._processes or dict())  # type: ignore
+                if print_exceptions:
+                    print(e)
+                break
+            except Exception as e:
+                if tournament_progress_callback is not None:
+                    tournament_progress_callback(None, i, n_world_configs)
+                if print_exceptions:
+                    print(traceback.format_exc())
+                    print(e)
+        if parallelism.startswith("parallel") or parallelism.startswith("tcp"):
+            executor.shutdown()
+        if broken is None or markers is None:
             break
-        try:
-            (
-                run_id,
-                world_paths,
-                score_,
-                world_stats_,
-                type_stats_,
-                agent_stats_,
-            ) = future.result(timeout=timeout)
-            save_run_results(
-                run_id,
-                score_,
-                world_stats_,
-                type_stats_,
-                agent_stats_,
-                tournament_progress_callback,
-                world_paths,
-                name,
-                verbose,
-                _strt,
-                attempts_path,
-                n_world_configs,
-                i,
-            )
-        except futures.TimeoutError:
+        # A worker died. World sets that crashed it are counted as failures and
+        # the rest are resubmitted to a fresh pool
+        unfinished = {
+            run_id
+            for f, run_id in future_results.items()
+            if run_id not in run_ids
+        }
+        culprits, in_flight = markers.crashed(broken)
+        if not culprits and not in_flight:
+            in_flight = unfinished
+        for run_id in in_flight:
+            crashes[run_id] += 1
+        for run_id in unfinished:
+            if run_id not in culprits and crashes[run_id] < MAX_CRASHES_PER_RUN:
+                continue
+            run_ids.add(run_id)
+            i += 1
             if tournament_progress_callback is not None:
                 tournament_progress_callback(None, i, n_world_configs)
-            # if verbose:
+        if not unfinished - run_ids:
+            break
+        if verbose:
             print(
-                "[yellow]World timed-out in {humanize_time(timeout, show_us=True)}[/yellow]"
+                f"[yellow]Worker crashed: restarting the pool for {len(unfinished - run_ids)} remaining world sets[/yellow]"
             )
-        except futures.process.BrokenProcessPool as e:
-            if tournament_progress_callback is not None:
-                tournament_progress_callback(None, i, n_world_configs)
-            if print_exceptions:
-                print(e)
-        except Exception as e:
-            if tournament_progress_callback is not None:
-                tournament_progress_callback(None, i, n_world_configs)
-            if print_exceptions:
-                print(traceback.format_exc())
-                print(e)
-    if parallelism.startswith("parallel"):
-        executor.shutdown()
+    if markers is not None:
+        markers.cleanup()
 
 
 def _divide_into_sets(competitors, n_competitors_per_world):
@@ -1524,6 +1618,8 @@ def run_tournament(
     print_exceptions: bool = True,
     override_ran_worlds: bool = False,
     max_attempts: int = sys.maxsize,
+    resource_limits: ResourceLimits | None = None,
+    authkey: bytes | str | None = None,
 ) -> None:
     """
     Runs a tournament
@@ -1538,11 +1634,14 @@ def run_tournament(
                           The third parameter is a boolean specifying whether this is a dry_run. For dry runs, scores
                           are not expected but names and types should exist in the returned `WorldRunResults`.
         total_timeout: Total timeout for the complete process
-        parallelism: Type of parallelism. Can be 'serial' for serial, 'parallel' for parallel and 'distributed' for
-                     distributed! For parallel, you can add the fraction of CPUs to use after a colon (e.g. parallel:0.5
-                     to use half of the CPU in the machine). By defaults parallel uses all CPUs in the machine
-        scheduler_port: Port of the dask scheduler if parallelism is dask, dist, or distributed
-        scheduler_ip:   IP Address of the dask scheduler if parallelism is dask, dist, or distributed
+        parallelism: Type of parallelism. Can be 'serial' for serial, 'parallel' for parallel, 'distributed' for
+                     distributed (using dask) and 'tcp' for distributed using the built-in `TCPExecutor`! For parallel,
+                     you can add the fraction of CPUs to use after a colon (e.g. parallel:0.5 to use half of the CPU in
+                     the machine). By defaults parallel uses all CPUs in the machine. For tcp, you can add the number of
+                     local workers to start after a colon (e.g. tcp:4). Other workers can be started on any machine
+                     using `negmas tournament worker`.
+        scheduler_port: Port of the dask scheduler if parallelism is dask, dist, or distributed (or to listen on for tcp)
+        scheduler_ip:   IP Address of the dask scheduler if parallelism is dask, dist, or distributed (or to listen on for tcp)
         world_progress_callback: A function to be called after every step of every world run (only allowed for serial
                                  and parallel evaluation and should be used with cautious).
         tournament_progress_callback: A function to be called with `WorldRunResults` after each world finished
@@ -1552,6 +1651,10 @@ def run_tournament(
         print_exceptions: If true, exceptions encountered during world simulation will be printed to stdout
         override_ran_worlds: If true worlds that are already ran will be ran again
         max_attempts: The maximum number of attempts to run each simulation. Default is infinite
+        resource_limits: Memory and CPU limits applied to every world set run (see `ResourceLimits`). A run exceeding
+                         them, or crashing its worker process, counts as a failed run and the tournament continues.
+        authkey: The key workers use to authenticate with the coordinator of a tcp tournament. If not given, the
+                 `NEGMAS_TCP_AUTHKEY` environment variable is used. It is never saved with the tournament parameters.
 
     """
     tournament_path = _path(tournament_path)
@@ -1665,6 +1768,7 @@ def run_tournament(
     scores_file = str(scores_file)
     dask_options = ("dist", "distributed", "dask", "d")
     multiprocessing_options = ("local", "parallel", "par", "p")
+    tcp_options = ("tcp",)
     serial_options = ("none", "serial", "s")
     # serial_timeout_options = ("serial-timeout", "serial_timeout", "t")
     if parallelism is None:
@@ -1716,7 +1820,10 @@ def run_tournament(
                     world_stats_,
                     type_stats_,
                     agent_stats_,
-                ) = _run_worlds(
+                ) = call_with_limits(
+                    resource_limits,
+                    None,
+                    _run_worlds,
                     worlds_params=worlds_params,
                     world_generator=world_generator,
                     world_progress_callback=world_progress_callback,
@@ -1750,8 +1857,10 @@ def run_tournament(
                 if print_exceptions:
                     print(traceback.format_exc())
                     print(e)
-    elif any(parallelism.startswith(_) for _ in multiprocessing_options) or (
-        parallelism in dask_options
+    elif (
+        any(parallelism.startswith(_) for _ in multiprocessing_options)
+        or any(parallelism.startswith(_) for _ in tcp_options)
+        or (parallelism in dask_options)
     ):
         _run_parallel(
             parallelism,
@@ -1776,6 +1885,8 @@ def run_tournament(
             attempts_path,
             total_timeout,
             max_attempts,
+            resource_limits,
+            authkey,
         )
     if verbose:
         print("[blue]Tournament completed[/blue]")
@@ -1858,11 +1969,14 @@ def create_tournament(
         base_tournament_path: Path at which to store all results. A new folder with the name of the tournament will be
                          created at this path. A scores.csv file will keep the scores and logs folder will keep detailed
                          logs
-        parallelism: Type of parallelism. Can be 'serial' for serial, 'parallel' for parallel and 'distributed' for
-                     distributed! For parallel, you can add the fraction of CPUs to use after a colon (e.g. parallel:0.5
-                     to use half of the CPU in the machine). By defaults parallel uses all CPUs in the machine
-        scheduler_port: Port of the dask scheduler if parallelism is dask, dist, or distributed
-        scheduler_ip:   IP Address of the dask scheduler if parallelism is dask, dist, or distributed
+        parallelism: Type of parallelism. Can be 'serial' for serial, 'parallel' for parallel, 'distributed' for
+                     distributed (using dask) and 'tcp' for distributed using the built-in `TCPExecutor`! For parallel,
+                     you can add the fraction of CPUs to use after a colon (e.g. parallel:0.5 to use half of the CPU in
+                     the machine). By defaults parallel uses all CPUs in the machine. For tcp, you can add the number of
+                     local workers to start after a colon (e.g. tcp:4). Other workers can be started on any machine
+                     using `negmas tournament worker`.
+        scheduler_port: Port of the dask scheduler if parallelism is dask, dist, or distributed (or to listen on for tcp)
+        scheduler_ip:   IP Address of the dask scheduler if parallelism is dask, dist, or distributed (or to listen on for tcp)
         non_competitors: A list of agent types that will not be competing but will still exist in the world.
         non_competitor_params: paramters of non competitor agents
         dynamic_non_competitors: A list of non-competing agents that are assigned to the simulation dynamically during
@@ -2656,6 +2770,11 @@ def tournament(
     video_saver=None,
     max_attempts: int = sys.maxsize,
     extra_scores_to_use: str | None = None,
+    resource_limits: ResourceLimits | None = None,
+    confidence: float | None = None,
+    wave_size: int = 1,
+    min_repetitions: int = 2,
+    separate_top: int | None = None,
     **kwargs,
 ) -> TournamentResults | Path:
     """
@@ -2702,11 +2821,14 @@ def tournament(
         tournament_path: Path at which to store all results. A new folder with the name of the tournament will be
                          created at this path. A scores.csv file will keep the scores and logs folder will keep detailed
                          logs
-        parallelism: Type of parallelism. Can be 'serial' for serial, 'parallel' for parallel and 'distributed' for
-                     distributed! For parallel, you can add the fraction of CPUs to use after a colon (e.g. parallel:0.5
-                     to use half of the CPU in the machine). By defaults parallel uses all CPUs in the machine
-        scheduler_port: Port of the dask scheduler if parallelism is dask, dist, or distributed
-        scheduler_ip:   IP Address of the dask scheduler if parallelism is dask, dist, or distributed
+        parallelism: Type of parallelism. Can be 'serial' for serial, 'parallel' for parallel, 'distributed' for
+                     distributed (using dask) and 'tcp' for distributed using the built-in `TCPExecutor`! For parallel,
+                     you can add the fraction of CPUs to use after a colon (e.g. parallel:0.5 to use half of the CPU in
+                     the machine). By defaults parallel uses all CPUs in the machine. For tcp, you can add the number of
+                     local workers to start after a colon (e.g. tcp:4). Other workers can be started on any machine
+                     using `negmas tournament worker`.
+        scheduler_port: Port of the dask scheduler if parallelism is dask, dist, or distributed (or to listen on for tcp)
+        scheduler_ip:   IP Address of the dask scheduler if parallelism is dask, dist, or distributed (or to listen on for tcp)
         world_progress_callback: A function to be called after every step of every world run (only allowed for serial
                                  and parallel evaluation and should be used with cautious).
         tournament_progress_callback: A function to be called with `WorldRunResults` after each world finished
@@ -2729,6 +2851,15 @@ def tournament(
         video_saver: The parameters to pass to the video saving function after the world
         max_attempts: The maximum number of times to retry running simulations
         extra_scores_to_use: The type of extra-scores to use. If None normal scores will be used. Only effective if scores is None.
+        resource_limits: Memory and CPU limits applied to every world set run (see `ResourceLimits` and `run_tournament`)
+        confidence: If given, every stage is adaptive. It is run in waves of `wave_size` runs per world (each wave
+                    generating its own configs) and no more waves are scheduled once the ranking of competitors (by
+                    `metric`) is separated at this confidence level (e.g. 0.95). In this case, `n_runs_per_world` is
+                    the maximum number of runs per world (the budget).
+        wave_size: Number of runs per world in each wave of an adaptive tournament.
+        min_repetitions: Minimum number of runs per world before an adaptive tournament can stop.
+        separate_top: If given, an adaptive tournament stops once the top `separate_top` positions of the ranking
+                      are separated (instead of the whole ranking).
         kwargs: Arguments to pass to the `config_generator` function
 
     Returns:
@@ -2759,7 +2890,7 @@ def tournament(
             tname = ctype._type_name()  # type: ignore
         competitor_indx[tname] = i
 
-    def _run_eval(competitors_, stage_name):
+    def _run_eval(competitors_, stage_name, base_path=tournament_path, n_runs=None):
         final_tournament_path = create_tournament(
             competitors=competitors_,
             config_generator=config_generator,
@@ -2773,10 +2904,10 @@ def tournament(
             n_agents_per_competitor=n_agents_per_competitor,
             n_configs=n_configs,
             max_worlds_per_config=max_worlds_per_config,
-            n_runs_per_world=n_runs_per_world,
+            n_runs_per_world=n_runs_per_world if n_runs is None else n_runs,
             max_n_configs=max_n_configs,
-            n_runs_per_config=n_runs_per_config,
-            base_tournament_path=tournament_path,
+            n_runs_per_config=n_runs_per_config if n_runs is None else None,
+            base_tournament_path=base_path,
             total_timeout=total_timeout,
             parallelism=parallelism,
             scheduler_ip=scheduler_ip,
@@ -2811,6 +2942,7 @@ def tournament(
             compact=compact,
             print_exceptions=print_exceptions,
             max_attempts=max_attempts,
+            resource_limits=resource_limits,
         )
         return evaluate_tournament(
             tournament_path=final_tournament_path,
@@ -2820,6 +2952,49 @@ def tournament(
             extra_scores_to_use=extra_scores_to_use,
         )
 
+    def _run_adaptive_eval(competitors_, stage_name):
+        base_path = _path(
+            tournament_path if tournament_path is not None else TOURNAMENTS_BASE_PATH
+        ) / stage_name
+        n_runs = n_runs_per_config if n_runs_per_config is not None else n_runs_per_world
+        size = max(1, wave_size)
+        stat = metric if isinstance(metric, str) else lambda x: metric(pd.Series(x))
+        scores, n_done = [], 0
+        for w, start in enumerate(range(0, n_runs, size)):
+            n_done = min(start + size, n_runs)
+            results_ = _run_eval(
+                competitors_, f"wave-{w:04}", base_path, n_done - start
+            )
+            scores.append(results_.scores)
+            if n_done >= n_runs or n_done < min_repetitions:
+                continue
+            intervals = score_intervals(
+                pd.concat(scores, ignore_index=True),
+                "agent_type",
+                "score",
+                stat,
+                confidence=confidence,  # type: ignore
+            )
+            if ranking_separated(intervals, separate_top):
+                if verbose:
+                    print(
+                        f"Ranking separated at confidence {confidence} after {n_done} of {n_runs} runs per world"
+                    )
+                break
+        return evaluate_tournament(
+            tournament_path=base_path,
+            scores=pd.concat(scores, ignore_index=True),
+            verbose=verbose,
+            recursive=round_robin,
+            metric=metric,
+            compile=False,
+        )
+
+    if confidence is not None and not configs_only:
+        _run_eval_ = _run_adaptive_eval
+    else:
+        _run_eval_ = _run_eval
+
     def _keep_n(competitors_, results_, n):
         tscores = results_.total_scores.sort_values(by=["score"], ascending=False)
         sorted_indices = np.array(
@@ -2839,7 +3014,7 @@ def tournament(
                 max(1, int(stage_winners_fraction * len(competitors))),
                 len(competitors) - 1,
             )
-            results = _run_eval(competitors, stage_name)
+            results = _run_eval_(competitors, stage_name)
             if n_winners_per_stage == 1:
                 return results
             competitors = _keep_n(competitors, results, n_winners_per_stage)
@@ -2856,7 +3031,7 @@ def tournament(
                     max(1, int(stage_winners_fraction * n_competitors_per_world)),
                     len(c) - 1,
                 )
-                results = _run_eval(c, match_name_)
+                results = _run_eval_(c, match_name_)
                 winners_ = _keep_n(competitors, results, n_winners_per_match)
                 next_stage_competitors += winners_
             competitors = next_stage_competitors
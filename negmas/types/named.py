@@ -16,9 +16,8 @@ from os import PathLike
 from pathlib import Path
 from typing import Any, Literal, overload
 
-import dill
-
 from ..helpers import get_full_type_name, shorten, unique_name
+from ..helpers.checkpointing import read_checkpoint, write_checkpoint
 from ..helpers.inout import dump, load
 
 __all__ = ["NamedObject"]
@@ -169,6 +168,10 @@ class NamedObject:
             "_Entity__current_step",
             "_step",
         ),
+        compression: str | None = None,
+        base: PathLike | str | None = None,
+        background: str | None = None,
+        zero_copy: bool = False,
     ) -> Path:
         """
         Saves a checkpoint of the current object at  the given path.
@@ -183,10 +186,20 @@ class NamedObject:
             step_attribs: Attributes to represent the time-step of the object. Any of the given attributes will be
                           used in the file name generated if single_checkpoint is False. If single_checkpoint is True, the
                           filename will not contain time-step information
+            compression: Compression method (gzip, bz2, lzma, zstd or lz4) or None for no compression
+            base: If given, a differential checkpoint storing only the changes from the checkpoint in
+                  this file (in the same directory) is saved
+            background: If given ("thread" or "fork"), the checkpoint is written in the background (see
+                        `negmas.helpers.checkpointing.write_checkpoint`)
+            zero_copy: If True, numpy arrays are saved as separate blobs that are memory-mapped instead of copied
+                       when the checkpoint is loaded (cannot be combined with `base`)
 
         Returns:
             full path to the file used to save the checkpoint
 
+        Remarks:
+            - The json file with checkpoint information is written after the checkpoint itself.
+
         """
         if file_name is None:
             base_name = (
@@ -222,6 +235,9 @@ class NamedObject:
                 "time": datetime.datetime.now().isoformat(),
                 "step": current_step,
                 "filename": str(full_file_name),
+                "compression": compression,
+                "base": str(base) if base is not None else None,
+                "zero_copy": zero_copy,
             }
         )
 
@@ -230,12 +246,16 @@ class NamedObject:
                 f"{str(full_file_name)} already exists. Pass exist_ok=True if you want to override it"
             )
 
-        with open(full_file_name, "wb") as f:
-            dill.dump(self, f)
-
         info_file_name = path / (base_name + ".json")
-        dump(info, info_file_name)
-        return full_file_name
+        return write_checkpoint(
+            self,
+            full_file_name,
+            compression=compression,
+            base=base,
+            background=background,
+            on_written=lambda: dump(info, info_file_name),
+            zero_copy=zero_copy,
+        )
 
     @overload
     @classmethod
@@ -274,8 +294,7 @@ class NamedObject:
                 - name: name
         """
         file_name = Path(file_name).absolute()
-        with open(file_name, "rb") as f:
-            obj = dill.load(f)
+        obj = read_checkpoint(file_name)
         if return_info:
             return obj, cls.checkpoint_info(file_name)
         return obj
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+import shutil
 from os import walk
 from pathlib import Path
 
@@ -7,7 +8,8 @@ import pkg_resources
 import pytest
 
 from negmas import load_genius_domain_from_folder
-from negmas.inout import Scenario
+from negmas import inout
+from negmas.inout import Scenario, _scenario_cache_path
 from negmas.outcomes import enumerate_issues
 from negmas.outcomes.outcome_space import DiscreteCartesianOutcomeSpace
 from negmas.preferences.crisp.linear import LinearAdditiveUtilityFunction
@@ -254,3 +256,65 @@ def test_load_geniusweb_example_reserved_value():
 #     if n < 10_000:
 #         d2.to_single_issue()
 #         assert d2.outcome_space.cardinality == n or d2.outcome_space.cardinality == float("inf")
+
+
+def _same_scenario(a: Scenario, b: Scenario) -> bool:
+    return (
+        a.outcome_space == b.outcome_space
+        and len(a.ufuns) == len(b.ufuns)
+        and all(
+            u.reserved_value == v.reserved_value and u(o) == v(o)
+            for u, v in zip(a.ufuns, b.ufuns)
+            for o in a.outcome_space.enumerate_or_sample()
+        )
+    )
+
+
+def test_scenario_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(inout, "SCENARIO_CACHE_DIR", tmp_path / "cache")
+    folder = tmp_path / "Laptop"
+    shutil.copytree(
+        pkg_resources.resource_filename("negmas", resource_name="tests/data/Laptop"),
+        folder,
+    )
+    files = sorted(folder.iterdir())
+    parsed = Scenario.load(folder)
+    assert not _scenario_cache_path(folder).exists()
+    first = Scenario.load(folder, cache=True)
+    assert _scenario_cache_path(folder).parent == tmp_path / "cache"
+    assert _scenario_cache_path(folder).exists()
+    # nothing is written to (or read from) the scenario folder
+    assert sorted(folder.iterdir()) == files
+    cached = Scenario.load(folder, cache=True)
+    assert parsed is not None and first is not None and cached is not None
+    assert _same_scenario(parsed, cached)
+    assert {u.id for u in first.ufuns}.isdisjoint({u.id for u in cached.ufuns})
+
+    # touching the files does not invalidate the cache but changing them does
+    for f in folder.glob("*.xml"):
+        os.utime(f, ns=(0, 0))
+    assert _same_scenario(parsed, Scenario.load(folder, cache=True))  # type: ignore
+    ufun_file = folder / "Laptop-C-prof1.xml"
+    ufun_file.write_text(
+        ufun_file.read_text().replace('evaluation="12"', 'evaluation="25"')
+    )
+    changed = Scenario.load(folder, cache=True)
+    assert changed is not None and not _same_scenario(parsed, changed)
+    assert _same_scenario(changed, Scenario.load(folder))  # type: ignore
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_scenario_load_many(tmp_path, monkeypatch, n_jobs):
+    monkeypatch.setattr(inout, "SCENARIO_CACHE_DIR", tmp_path / "cache")
+    data = Path(pkg_resources.resource_filename("negmas", resource_name="tests/data"))
+    names = ["Laptop", "Laptop1Issue", "FiftyFifty"]
+    for name in names:
+        shutil.copytree(data / name, tmp_path / name)
+    paths = [tmp_path / _ for _ in names] + [tmp_path]
+    expected = [Scenario.load(_) for _ in paths[:-1]]
+    for cache in (False, True, True):
+        scenarios = Scenario.load_many(paths, n_jobs=n_jobs, cache=cache)
+        assert scenarios[-1] is None
+        for a, b in zip(expected, scenarios[:-1]):
+            assert _same_scenario(a, b)  # type: ignore
+        assert all(_scenario_cache_path(_).exists() == cache for _ in paths[:-1])
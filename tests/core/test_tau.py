@@ -1100,3 +1100,207 @@ from __future__ import annotations
 #         assert (
 #             p.agreement in front_outcomes or p.agreement is None
 #         ), f"Suboptimal agreement in a supposedly optimal profile {_history(p)}{_plot(p, True)}"
+
+
+def _reference_tau(negotiator_ids, states, cardinality):
+    """Evaluates TAU agreements by recounting offers and acceptances in the window every step"""
+    from collections import defaultdict
+
+    from negmas.gb.common import ResponseType
+
+    results = []
+    for i, state in enumerate(states):
+        window = states[max(0, i - cardinality + 1) : i + 1]
+        accepted, offered = defaultdict(set), defaultdict(set)
+        for s in window:
+            for source, t in s.threads.items():
+                offered[t.new_offer].add(source)
+                for responder, response in t.new_responses.items():
+                    if response == ResponseType.ACCEPT_OFFER:
+                        accepted[t.new_offer].add(responder)
+        agreements = {
+            o
+            for o in offered
+            if len(accepted[o]) == len(offered[o]) == len(negotiator_ids)
+        }
+        results.append(agreements)
+        if agreements:
+            break
+    return results
+
+
+def test_tau_evaluator_matches_full_recount():
+    import random
+
+    from negmas.gb.common import GBState, ResponseType, ThreadState
+    from negmas.gb.evaluators.tau import INFINITE, TAUEvaluationStrategy
+
+    ids = ["a", "b", "c"]
+    for seed in range(200):
+        rng = random.Random(seed)
+        outcomes = [(_,) for _ in range(rng.randint(2, 8))]
+        states = []
+        for step in range(30):
+            threads = {
+                source: ThreadState(
+                    new_offer=rng.choice(outcomes),
+                    new_responses={
+                        r: rng.choice(
+                            [ResponseType.ACCEPT_OFFER, ResponseType.REJECT_OFFER]
+                        )
+                        for r in ids
+                    },
+                )
+                for source in ids
+            }
+            # n_negotiators is larger than the number of threads to disable ending on repetition
+            states.append(GBState(step=step, n_negotiators=4, threads=threads))
+        for cardinality in (INFINITE, 1, 3, 7):
+            expected = _reference_tau(ids, states, cardinality)
+            for skip in (False, True):
+                evaluator = TAUEvaluationStrategy(cardinality=cardinality)
+                for i, state in enumerate(states[: len(expected)]):
+                    # skipping calls makes the evaluator recount its window from the history
+                    if skip and i % 4 == 1 and cardinality != INFINITE:
+                        continue
+                    result = evaluator(ids, state, states[:i])
+                    if expected[i]:
+                        assert result in expected[i]
+                    else:
+                        assert result == "continue"
+
+
+def _reference_rfo(offer, outcomes, n):
+    if not offer:
+        return False
+    if outcomes:
+        for a, b in zip(outcomes[:-1], outcomes[1:]):
+            if a == offer:
+                break
+            if a == b:
+                return False
+    past = set(outcomes)
+    if outcomes and len(past) >= n:
+        past = past.difference({outcomes[-1]})
+    return offer not in past
+
+
+def _reference_rlo(offer, outcomes, n):
+    if not offer:
+        return False
+    past = set(outcomes)
+    if outcomes and len(past) >= n:
+        past = past.difference({outcomes[-1]})
+    return offer not in past
+
+
+def test_incremental_offering_constraints_match_full_scan():
+    import random
+
+    from negmas.gb.common import GBState, ThreadState
+    from negmas.gb.constraints import (
+        RepeatFinalOfferOnly,
+        RepeatLastOfferOnly,
+        UniqueOffers,
+    )
+
+    for seed in range(100):
+        rng = random.Random(seed)
+        outcomes = [(_,) for _ in range(rng.randint(1, 6))] + [None]
+        n = rng.randint(1, 5)
+        offers = [rng.choice(outcomes) for _ in range(20)]
+        constraints = [
+            (UniqueOffers(), lambda o, past, n: bool(o) and o not in past),
+            (RepeatLastOfferOnly(n=n), _reference_rlo),
+            (RepeatFinalOfferOnly(n=n), _reference_rfo),
+        ]
+        history = [GBState(threads={"a": ThreadState(new_offer=_)}) for _ in offers]
+        for constraint, reference in constraints:
+            for i in range(len(offers)):
+                for offer in outcomes:
+                    state = GBState(threads={"a": ThreadState(new_offer=offer)})
+                    expected = reference(offer, offers[:i], n)
+                    assert constraint.eval_globally("a", state, history[:i]) == expected
+                    threads = [_.threads["a"] for _ in history[:i]]
+                    assert constraint(state.threads["a"], threads) == expected
+            # a shorter history (e.g. a new negotiation) resets the constraint
+            state = GBState(threads={"a": ThreadState(new_offer=offers[0])})
+            assert constraint.eval_globally("a", state, []) == bool(offers[0])
+
+
+def test_parallel_gb_mechanism_runs_threads_concurrently():
+    import dill
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from negmas.gb.evaluators.tau import TAUEvaluationStrategy
+    from negmas.gb.mechanisms.base import ParallelGBMechanism
+    from negmas.gb.negotiators.cab import CABNegotiator
+    from negmas.outcomes import make_issue, make_os
+    from negmas.preferences import LinearAdditiveUtilityFunction
+
+    delay, n_steps, n_negotiators = 0.02, 5, 4
+    lock = threading.Lock()
+    running = dict(now=0, max=0)
+
+    class SlowNegotiator(CABNegotiator):
+        def propose(self, state, *args, **kwargs):
+            with lock:
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            time.sleep(delay)
+            with lock:
+                running["now"] -= 1
+            return super().propose(state, *args, **kwargs)
+
+    os = make_os([make_issue(10), make_issue(10)])
+    ufuns = [
+        LinearAdditiveUtilityFunction.random(os, reserved_value=0.0)
+        for _ in range(n_negotiators)
+    ]
+
+    def run(**kwargs):
+        running["max"] = 0
+        m = ParallelGBMechanism(
+            outcome_space=os,
+            evaluator_type=TAUEvaluationStrategy,
+            n_steps=n_steps,
+            **kwargs,
+        )
+        for u in ufuns:
+            m.add(SlowNegotiator(), ufun=u)
+        m.step()
+        pool = m._pool
+        m.run()
+        assert m._pool is None
+        return m, pool, running["max"]
+
+    # concurrency is opt-in
+    sequential, pool, max_running = run()
+    assert pool is None and max_running == 1
+    concurrent, pool, max_running = run(max_workers=None)
+    assert pool is not None and max_running > 1
+    with ThreadPoolExecutor(2) as executor:
+        shared, pool, max_running = run(executor=executor)
+    assert pool is None and max_running == 2
+    for m in (sequential, concurrent, shared):
+        times = m.negotiator_times
+        assert len(times) == n_negotiators
+        assert all(_ >= delay * m.state.step for _ in times.values())
+        assert m.state.last_thread in times
+    # mechanisms with a thread pool can still be pickled (e.g. for checkpoints)
+    m = ParallelGBMechanism(
+        outcome_space=os,
+        evaluator_type=TAUEvaluationStrategy,
+        n_steps=n_steps,
+        max_workers=2,
+    )
+    for u in ufuns:
+        m.add(CABNegotiator(), ufun=u)
+    m.step()
+    assert m._pool is not None
+    restored = dill.loads(dill.dumps(m))
+    assert restored._pool is None
+    restored.run()
+    m.run()
@@ -256,3 +256,190 @@ def test_can_run_from_checkpoint(
     runner.reset()
 
     runner.run()
+
+
+@mark.parametrize(
+    "compression, background, differential",
+    [
+        (None, None, 0),
+        ("gzip", None, 3),
+        ("lzma", "thread", 2),
+        (None, "fork", 4),
+        ("bz2", "fork", 0),
+    ],
+)
+def test_compressed_differential_background_checkpoints(
+    tmp_path, compression, background, differential
+):
+    from negmas import RandomNegotiator
+    from negmas.helpers.checkpointing import DELTA_MAGIC, decompress_bytes
+
+    n_steps = 12
+    mechanism = SAOMechanism(
+        outcomes=20,
+        n_steps=n_steps,
+        checkpoint_every=1,
+        checkpoint_folder=tmp_path,
+        checkpoint_filename="mechanism",
+        single_checkpoint=False,
+        checkpoint_compression=compression,
+        checkpoint_background=background,
+        checkpoint_differential=differential,
+    )
+    ufuns = MappingUtilityFunction.generate_random(2, outcomes=20)
+    for i in range(2):
+        mechanism.add(RandomNegotiator(name=f"agent{i}"), preferences=ufuns[i])
+    offers = dict()
+    while mechanism.state.running:
+        offers[mechanism.state.step] = mechanism.state.current_offer
+        mechanism.step()
+    mechanism.checkpoint_final_step()
+
+    runner = CheckpointRunner(folder=tmp_path)
+    assert runner.steps == list(range(len(runner.steps)))
+    n_deltas = 0
+    for step in runner.steps:
+        runner.goto(step, exact=True)
+        loaded = runner.loaded_object
+        assert isinstance(loaded, SAOMechanism)
+        assert loaded.state.step == step
+        if step in offers:
+            assert loaded.state.current_offer == offers[step]
+        info = loaded.checkpoint_info(tmp_path / f"{step:05}.mechanism")
+        assert info["compression"] == compression
+        with open(tmp_path / f"{step:05}.mechanism", "rb") as f:
+            data = f.read()
+        assert (decompress_bytes(data) != data) == (compression is not None)
+        if decompress_bytes(data).startswith(DELTA_MAGIC):
+            n_deltas += 1
+            assert info["base"] is not None
+    expected = len(runner.steps) - len(runner.steps[:: differential + 1])
+    assert n_deltas == expected
+    # the loaded object can continue running
+    runner.goto(runner.first_step, exact=True)
+    m = runner.fork(every=0, folder=None)
+    assert m is not None
+    m.run()  # type: ignore
+    assert not m.state.running  # type: ignore
+
+
+def test_delta_encoding_roundtrip():
+    import random
+
+    from negmas.helpers.checkpointing import apply_delta, make_delta
+
+    rng = random.Random(0)
+    base = bytes(rng.getrandbits(8) for _ in range(200_000))
+    data = base[:50_000] + b"changed" + base[50_100:150_000] + base[:1000]
+    ops = make_delta(base, data)
+    assert apply_delta(base, ops) == data
+    assert sum(len(_) for _ in ops if isinstance(_, bytes)) < 20_000
+    assert apply_delta(base, make_delta(base, b"")) == b""
+    assert apply_delta(b"", make_delta(b"", data)) == data
+
+
+@mark.parametrize(
+    "compression, background", [(None, None), ("gzip", "thread"), (None, "fork")]
+)
+def test_zero_copy_checkpoints(tmp_path, compression, background):
+    import numpy as np
+
+    from negmas import RandomNegotiator
+    from negmas.helpers.checkpointing import ZERO_COPY_MAGIC
+
+    mechanism = SAOMechanism(
+        outcomes=20,
+        n_steps=10,
+        checkpoint_every=1,
+        checkpoint_folder=tmp_path,
+        checkpoint_filename="mechanism",
+        single_checkpoint=False,
+        checkpoint_compression=compression,
+        checkpoint_background=background,
+        checkpoint_differential=2,
+        checkpoint_zero_copy=True,
+    )
+    mechanism.table = np.arange(100_000, dtype=np.float64)  # type: ignore
+    mechanism.matrix = np.ones((50, 30)).T  # type: ignore
+    ufuns = MappingUtilityFunction.generate_random(2, outcomes=20)
+    for i in range(2):
+        mechanism.add(
+            RandomNegotiator(p_acceptance=0, p_rejection=1, p_ending=0, name=f"a{i}"),
+            preferences=ufuns[i],
+        )
+    for step in range(10):
+        mechanism.table[step] = -1  # type: ignore
+        mechanism.step()
+    mechanism.checkpoint_final_step()
+
+    runner = CheckpointRunner(folder=tmp_path)
+    assert len(runner.steps) > 5
+    for step in runner.steps:
+        with open(tmp_path / f"{step:05}.mechanism", "rb") as f:
+            assert f.read(len(ZERO_COPY_MAGIC)) == ZERO_COPY_MAGIC
+        runner.goto(step, exact=True)
+        loaded = runner.loaded_object
+        assert isinstance(loaded, SAOMechanism)
+        assert loaded.state.step == step
+        table = loaded.table  # type: ignore
+        # the array is mapped from the file not copied
+        assert not table.flags.owndata and table.flags.writeable
+        assert (table[:step] == -1).all()
+        assert (table[step + 1 :] == np.arange(step + 1, 100_000)).all()
+        assert (loaded.matrix == 1).all() and loaded.matrix.shape == (30, 50)  # type: ignore
+
+    # random access to checkpoints gives independent objects without moving the runner
+    runner.goto(runner.first_step, exact=True)
+    forks = [runner.fork(every=0, step=step) for step in reversed(runner.steps)]
+    assert runner.current_step == runner.first_step
+    forks[0].table[:] = 5  # type: ignore
+    assert (forks[1].table != 5).any()  # type: ignore
+    for m in forks:
+        m.run()  # type: ignore
+        assert not m.state.running  # type: ignore
+
+
+@mark.parametrize("background", ["thread", "fork"])
+def test_failed_background_checkpoints_are_reported(tmp_path, background):
+    import pytest
+
+    from negmas.helpers.checkpointing import wait_for_checkpoints, write_checkpoint
+    from negmas.warnings import NegmasIOWarning
+
+    # the folder does not exist so writing fails
+    write_checkpoint(dict(a=1), tmp_path / "none" / "x", background=background)
+    with pytest.warns(NegmasIOWarning):
+        wait_for_checkpoints()
+    write_checkpoint(dict(a=1), tmp_path / "none" / "x", background=background)
+    with pytest.raises(OSError):
+        wait_for_checkpoints(raise_errors=True)
+    write_checkpoint(dict(a=1), tmp_path / "x", background=background)
+    wait_for_checkpoints(raise_errors=True)
+    assert (tmp_path / "x").exists()
+
+
+@mark.parametrize("background", [None, "thread", "fork"])
+def test_checkpoints_do_not_duplicate_buffered_events(tmp_path, background):
+    from negmas.events import Event, read_events
+    from negmas.helpers.checkpointing import wait_for_checkpoints
+    from negmas.tests.test_situated import DummyWorld
+
+    world = DummyWorld(
+        n_steps=3,
+        log_folder=tmp_path,
+        event_file_name="events.jsonl",
+        checkpoint_every=1,
+        checkpoint_folder=tmp_path / "checkpoints",
+        checkpoint_background=background,
+    )
+    for i in range(5):
+        world.announce(Event("test", dict(i=i)))
+    world.step()
+    wait_for_checkpoints(raise_errors=True)
+    # buffered events are written once (before the checkpoint is saved)
+    events = [_["data"]["i"] for _ in read_events(tmp_path / "events.jsonl")]
+    assert events == list(range(5))
+    world.run()
+    world._event_logger.close()  # type: ignore
+    events = list(read_events(tmp_path / "events.jsonl", types=["test"]))
+    assert [_["data"]["i"] for _ in events] == list(range(5))
@@ -1,10 +1,13 @@
 from __future__ import annotations
+import os
+import sys
 from pathlib import Path
 from time import sleep
 from pytest import mark
 import pandas as pd
 from negmas.gb.common import ResponseType
 from negmas.helpers.inout import is_nonzero_file
+from negmas.helpers.limits import ResourceLimits
 from negmas.inout import Scenario
 from negmas.outcomes import make_issue
 from negmas.outcomes.outcome_space import make_os
@@ -30,6 +33,175 @@ class TimeWaster(SAONegotiator):
         return SAOResponse(ResponseType.REJECT_OFFER, self.nmi.random_outcome())
 
 
+class MemoryHog(SAONegotiator):
+    def __call__(self, state) -> SAOResponse:
+        self._data = bytearray(4 * 1024**3)
+        return SAOResponse(ResponseType.REJECT_OFFER, self.nmi.random_outcome())
+
+
+class CPUHog(SAONegotiator):
+    def __call__(self, state) -> SAOResponse:
+        while True:
+            pass
+
+
+class Crasher(SAONegotiator):
+    def __call__(self, state) -> SAOResponse:
+        os._exit(3)
+
+
+class Taker(SAONegotiator):
+    def __call__(self, state) -> SAOResponse:
+        return SAOResponse(ResponseType.REJECT_OFFER, self.ufun.best())
+
+
+class Giver(SAONegotiator):
+    def __call__(self, state) -> SAOResponse:
+        if state.current_offer is not None:
+            return SAOResponse(ResponseType.ACCEPT_OFFER, state.current_offer)
+        return SAOResponse(ResponseType.REJECT_OFFER, self.ufun.best())
+
+
+class Taker2(Taker):
+    pass
+
+
+def _simple_scenarios(n=1):
+    issues = (
+        make_issue([f"q{i}" for i in range(10)], "quantity"),
+        make_issue([f"p{i}" for i in range(5)], "price"),
+    )
+    return [
+        Scenario(
+            outcome_space=make_os(issues, name=f"S{i}"),
+            ufuns=(
+                U.random(issues=issues, reserved_value=(0.0, 0.2), normalized=False),
+                U.random(issues=issues, reserved_value=(0.0, 0.2), normalized=False),
+            ),
+        )
+        for i in range(n)
+    ]
+
+
+def _check_failures(results, bad, n_runs):
+    details = results.details
+    assert len(details) == n_runs
+    involved = details["partners"].apply(lambda x: any(bad in _ for _ in x))
+    assert details.loc[involved, "has_error"].all()
+    assert not details.loc[~involved, "has_error"].any()
+
+
+def _opposed_scenario():
+    from negmas.preferences.value_fun import AffineFun
+
+    issues = (make_issue(10, "price"),)
+    return Scenario(
+        outcome_space=make_os(issues, name="Opposed"),
+        ufuns=(
+            U(values=(AffineFun(1.0),), issues=issues, reserved_value=0.0),
+            U(values=(AffineFun(-1.0, bias=9.0),), issues=issues, reserved_value=0.0),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "competitors,n_expected",
+    [
+        # the taker always gets everything. The ranking is clear after min_repetitions
+        ((Taker, Giver), 2),
+        # the two never agree and get identical scores. The whole budget is used
+        ((Taker, Taker2), 8),
+    ],
+)
+def test_adaptive_cartesian_tournament_stops_when_ranking_separates(
+    competitors, n_expected
+):
+    results = cartesian_tournament(
+        competitors=competitors,
+        scenarios=[_opposed_scenario()],
+        mechanism_params=dict(n_steps=10),
+        n_repetitions=8,
+        confidence=0.95,
+        wave_size=1,
+        min_repetitions=2,
+        self_play=False,
+        verbosity=0,
+        njobs=-1,
+        save_stats=False,
+        path=None,
+    )
+    # two partner orders and two ufun rotations per repetition
+    assert len(results.details) == n_expected * 4
+    assert results.final_scores["strategy"].iloc[0] in ("Taker", "Taker2")
+
+
+def test_score_intervals_and_ranking_separation():
+    from negmas.tournaments.adaptive import ranking_separated, score_intervals
+
+    scores = pd.DataFrame(
+        dict(
+            strategy=["a"] * 20 + ["b"] * 20 + ["c"] * 20,
+            advantage=[1.0, 0.9] * 10 + [0.5, 0.4] * 10 + [0.52, 0.38] * 10,
+        )
+    )
+    for stat in ("mean", "median"):
+        intervals = score_intervals(scores, "strategy", "advantage", stat, seed=0)
+        assert intervals["strategy"].tolist()[0] == "a"
+        assert (intervals["low"] <= intervals["score"]).all()
+        assert (intervals["score"] <= intervals["high"]).all()
+        assert ranking_separated(intervals, top_k=1)
+        assert not ranking_separated(intervals)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs the resource module")
+@pytest.mark.parametrize(
+    "bad,limits",
+    [
+        (MemoryHog, "memory"),
+        (CPUHog, ResourceLimits(max_cpu_time=1)),
+        (Crasher, None),
+    ],
+)
+def test_cartesian_tournament_survives_bad_workers(bad, limits):
+    import psutil
+
+    if limits == "memory":
+        limits = ResourceLimits(
+            max_memory=psutil.Process().memory_info().vms + 1024**3
+        )
+    results = cartesian_tournament(
+        competitors=[AspirationNegotiator, bad],
+        scenarios=_simple_scenarios(),
+        mechanism_params=dict(n_steps=10),
+        n_repetitions=1,
+        verbosity=0,
+        njobs=1,
+        rotate_ufuns=False,
+        resource_limits=limits,
+        save_stats=False,
+        path=None,
+    )
+    _check_failures(results, bad.__name__, 4)
+
+
+def test_cartesian_tournament_warns_when_max_memory_is_ignored():
+    from negmas.warnings import NegmasIgnoredValueWarning
+
+    with pytest.warns(NegmasIgnoredValueWarning, match="serially"):
+        cartesian_tournament(
+            competitors=[AspirationNegotiator, RandomNegotiator],
+            scenarios=_simple_scenarios(),
+            mechanism_params=dict(n_steps=10),
+            n_repetitions=1,
+            verbosity=0,
+            njobs=-1,
+            rotate_ufuns=False,
+            resource_limits=ResourceLimits(max_memory=1024**4),
+            save_stats=False,
+            path=None,
+        )
+
+
 @pytest.mark.skip(
     "Can be used in the future to test breaking negotiations with infinite loops. Currently it will hang at the end"
 )
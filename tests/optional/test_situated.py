@@ -1,3 +1,4 @@
+import json
 import random
 from pathlib import Path
 
@@ -7,6 +8,7 @@ import pytest
 from hypothesis import HealthCheck, given, settings
 
 from negmas.helpers import unique_name
+from negmas.situated.monitors import StatsMonitor
 from negmas.situated.world import World
 from negmas.tests.test_situated import DummyWorld, NegAgent, NegPerStepWorld
 
@@ -131,3 +133,407 @@ def test_combine_stats(pertype, n_step, method, n):
 #     #
 #     # plt.show()
 #     # assert False
+
+
+def test_incremental_stats_match_full_save(tmp_path):
+    import filecmp
+
+    import pandas as pd
+
+    from negmas.situated import save_stats
+
+    n_steps = 10
+    world = NegPerStepWorld(
+        n_steps,
+        log_folder=str(tmp_path / "world"),
+        log_stats_every=1,
+        save_signed_contracts=True,
+        save_negotiations=True,
+        ignore_agent_exceptions=True,
+        ignore_negotiation_exceptions=True,
+    )
+    for i in range(5):
+        world.join(NegAgent(p_request=0.5, name=f"a{i}"))
+    for _ in range(n_steps - 1):
+        world.step()
+    # rows are appended every step
+    stats = pd.read_csv(tmp_path / "world" / "stats.csv.csv", index_col=0)
+    assert len(stats) == n_steps - 1
+    assert len(pd.read_csv(tmp_path / "world" / "negotiations.csv")) == len(
+        world.saved_negotiations
+    )
+    # the last step compacts the files to what save_stats produces
+    world.step()
+    save_stats(world, tmp_path / "ref", stats_file_name="stats.csv")
+    for name in ("stats.csv.csv", "negotiations.csv", "contracts.csv", "breaches.csv"):
+        assert filecmp.cmp(
+            tmp_path / "world" / name, tmp_path / "ref" / name, shallow=False
+        ), name
+
+
+def test_contract_records_track_added_keys():
+    import pickle
+
+    from negmas.situated.helpers import ContractRecords
+
+    records = ContractRecords(a=dict(signed_at=0, issues=[1]), b=dict(signed_at=-1))
+    records["c"] = dict(signed_at=2)
+    records["a"] = dict(signed_at=1)
+    records.pop("b")
+    records["b"] = dict(signed_at=-1)
+    assert records.keys_added == ["a", "b", "c", "b"]
+    assert (records.n_signed, records.n_with_issues) == (2, 0)
+    restored = pickle.loads(pickle.dumps(records))
+    assert restored == records and restored.keys_added == records.keys_added
+    assert (restored.n_signed, restored.n_with_issues) == (2, 0)
+    records.clear()
+    assert records.keys_added == [] and records.n_signed == 0
+
+
+def _run_neg_world(parallel_negotiations, n_steps=5, n_agents=5, **kwargs):
+    world = NegPerStepWorld(
+        n_steps,
+        parallel_negotiations=parallel_negotiations,
+        ignore_agent_exceptions=True,
+        ignore_negotiation_exceptions=True,
+        no_logs=True,
+    )
+    for i in range(n_agents):
+        world.join(NegAgent(name=f"a{i}", **kwargs))
+    world.run()
+    return world
+
+
+def test_parallel_negotiations_match_serial():
+    serial = _run_neg_world(0, never_agree=True)
+    parallel = _run_neg_world(4, never_agree=True)
+    assert parallel.current_step == serial.current_step
+    assert len(parallel.saved_negotiations) == len(serial.saved_negotiations) > 0
+    for k in ("n_negotiations", "n_negotiation_rounds_failed", "n_contracts_signed"):
+        assert np.array_equal(parallel.stats[k], serial.stats[k]), k
+    assert not parallel._negotiations
+
+
+def test_parallel_negotiations_conclude_all_negotiations():
+    world = _run_neg_world(3)
+    assert not world._negotiations
+    assert sum(world.stats["n_negotiations"]) == len(world.saved_negotiations) > 0
+    assert sum(world.stats["n_negotiation_successful"]) + sum(
+        world.stats["n_negotiation_failed"]
+    ) == len(world.saved_negotiations)
+
+
+def test_partition_mechanisms_keeps_agents_together():
+    from types import SimpleNamespace
+
+    def mechanism(*owners):
+        return SimpleNamespace(
+            negotiators=[
+                SimpleNamespace(id=f"n{_}", owner=SimpleNamespace(id=_)) for _ in owners
+            ]
+        )
+
+    mechanisms = [
+        mechanism("a", "b"),
+        mechanism("c", "d"),
+        None,
+        mechanism("b", "e"),
+        mechanism("f", "g"),
+    ]
+    partitions = World._partition_mechanisms(mechanisms, 2)  # type: ignore
+    assert partitions[2] == -1
+    assert partitions[0] == partitions[3]
+    assert len({partitions[_] for _ in (0, 1, 4)}) == 2
+    assert partitions == World._partition_mechanisms(mechanisms, 2)  # type: ignore
+
+
+def test_bulletin_board_indexes_and_snapshots():
+    import pickle
+
+    from negmas.situated import BulletinBoard
+
+    board = BulletinBoard()
+    board.add_section("offers", indexes=("type",))
+    for i in range(20):
+        board.record("offers", dict(type=i % 3, price=i), key=f"o{i}")
+    board.record("offers", dict(type=[0], price=100), key="odd")
+    # indexed and non-indexed queries agree with a full scan
+    for query in (dict(type=1), dict(type=0, price=3), dict(price=5), dict(type=7)):
+        expected = {
+            k: v
+            for k, v in board.data["offers"].items()
+            if BulletinBoard.satisfies(v, query)
+        }
+        assert board.query("offers", query) == expected
+    # overwriting a record updates the index
+    board.record("offers", dict(type=7, price=1), key="o1")
+    assert board.query("offers", dict(type=7)) == {"o1": dict(type=7, price=1)}
+    assert "o1" not in board.query("offers", dict(type=1))
+    # a record changed in place is re-indexed by recording it again
+    record = board.read("offers", "o5")
+    record["type"] = 9
+    board.record("offers", record, key="o5")
+    assert board.query("offers", dict(type=9)) == {"o5": record}
+    assert "o5" not in board.query("offers", dict(type=2))
+    assert "o5" not in board._indexes["offers"]["type"][2]
+    # whole-section reads are cached read-only snapshots
+    snapshot = board.query("offers", None)
+    assert snapshot is board.query("offers", None)
+    with pytest.raises(TypeError):
+        snapshot["x"] = 1  # type: ignore
+    # removal by value (unhashable and hashable)
+    assert board.remove("offers", value=board.read("offers", "o2"))
+    assert board.remove("offers", value=dict(type=0, price=3))
+    board.add_section("names")
+    board.record("names", "abc", key="n")
+    assert board.remove("names", value="abc")
+    assert not board.remove("names", value="abc")
+    assert "o2" not in board.query("offers", dict(type=2))
+    assert snapshot is not board.query("offers", None)
+    assert "o2" in snapshot and "o2" not in board.query("offers", None)
+    # the board (and snapshots) survive pickling
+    board = pickle.loads(pickle.dumps(board))
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+    assert board.remove("offers", value=board.read("offers", "o4"))
+    assert set(board.query("offers", dict(type=1))) == {
+        "o7",
+        "o10",
+        "o13",
+        "o16",
+        "o19",
+    }
+
+
+@pytest.mark.parametrize(
+    "missing",
+    [
+        ("_indexes", "_indexed", "_unindexed", "_by_value", "_by_id", "_snapshots"),
+        ("_indexed",),
+    ],
+)
+def test_bulletin_board_loads_old_pickles(missing):
+    from negmas.situated import BulletinBoard
+
+    board = BulletinBoard()
+    board.add_section("offers", indexes=("type",))
+    for i in range(6):
+        board.record("offers", dict(type=i % 3, price=i), key=f"o{i}")
+    board.add_section("lists")
+    board.record("lists", [1, 2], key="list")
+    # the state of a board pickled by an older version
+    state = {k: v for k, v in board.__dict__.items() if k not in missing}
+    old = BulletinBoard.__new__(BulletinBoard)
+    old.__setstate__(state)
+    assert old.query("offers", dict(type=1)) == board.query("offers", dict(type=1))
+    assert old.query("offers", None) == board.query("offers", None)
+    assert ("type" in old._indexes["offers"]) == ("_indexes" not in missing)
+    assert old.remove("lists", value=[1, 2])
+    old.record("offers", dict(type=2, price=9), key="o1")
+    assert old.query("offers", dict(type=1)) == {"o4": dict(type=1, price=4)}
+    assert old.query("offers", dict(type=0)) == {
+        "o0": dict(type=0, price=0),
+        "o3": dict(type=0, price=3),
+    }
+
+
+def test_contract_fractions_use_running_counts():
+    world = NegPerStepWorld(
+        10,
+        save_signed_contracts=True,
+        ignore_agent_exceptions=True,
+        ignore_negotiation_exceptions=True,
+        no_logs=True,
+    )
+    for i in range(4):
+        world.join(NegAgent(name=f"a{i}", p_request=0.5))
+    world.run()
+    world._check_contract_counts()
+    records = list(world._saved_contracts.values())
+    n_signed = len([_ for _ in records if _["signed_at"] >= 0])
+    n_negotiated = len([_ for _ in records if _["issues"]])
+    assert world.n_saved_contracts(False) == len(records)
+    assert world.n_saved_contracts(True) == n_negotiated
+    if n_signed:
+        assert world.breach_fraction == sum(world.stats["n_breaches"]) / n_signed
+    # removing and replacing records keeps the counts in sync
+    for cid in list(world._saved_contracts.keys())[::2]:
+        world._saved_contracts.pop(cid)
+    world._saved_contracts["x"] = dict(signed_at=0, issues=["i"])
+    world._saved_contracts["x"] = dict(signed_at=-1, issues=[])
+    world._check_contract_counts()
+
+
+def test_stats_store_columns_and_views():
+    import pickle
+
+    from negmas.situated import StatsStore
+
+    store = StatsStore(n_steps=4)
+    for i in range(10):
+        store["ints"].append(i)
+        store["floats"].append(i / 2)
+    store["late"].append(1)
+    store["late"].append(None)
+    store["mixed"].extend([1, "x"])
+    assert len(store["ints"]) == 10 and store["ints"][-1] == 9
+    assert store["ints"].values.dtype == np.int64
+    views = store.views()
+    assert all(len(_) == 10 for _ in views.values())
+    assert np.isnan(views["late"][1:]).all()
+    assert list(views["mixed"][:2]) == [1, "x"]
+    with pytest.raises(ValueError):
+        views["ints"][0] = 5
+    # views are snapshots: later appends do not change them
+    store["ints"].append(10)
+    assert len(views["ints"]) == 10 and len(store.views()["ints"]) == 11
+    df = store.to_dataframe()
+    assert list(df["floats"][:10]) == [i / 2 for i in range(10)]
+    restored = pickle.loads(pickle.dumps(store))
+    restored["ints"].append(11)
+    assert list(restored["ints"]) == list(range(12))
+
+
+def test_world_stats_are_read_only_views():
+    received = []
+
+    class Monitor(StatsMonitor):
+        def step(self, stats, world_name):
+            received.append(stats)
+
+    world = _run_neg_world(0, n_steps=4, never_agree=True)
+    assert isinstance(world.stats_arrays["n_negotiations"], np.ndarray)
+    with pytest.raises(ValueError):
+        world.stats_arrays["n_negotiations"][0] = 3
+    # stats are list copies
+    stats = world.stats
+    assert isinstance(stats["n_negotiations"], list)
+    assert stats["n_negotiations"] == world.stats_arrays["n_negotiations"].tolist()
+    stats["n_negotiations"].append(100)
+    assert len(world.stats["n_negotiations"]) == 4
+    json.dumps(world.stats)
+    assert list(world.stats_df["n_negotiations"]) == list(
+        world.stats["n_negotiations"]
+    )
+    for safe in (False, True):
+        received.clear()
+        world = NegPerStepWorld(
+            3, no_logs=True, ignore_agent_exceptions=True, safe_stats_monitoring=safe
+        )
+        world.register_stats_monitor(Monitor())
+        for i in range(3):
+            world.join(NegAgent(name=f"a{i}", never_agree=True))
+        world.run()
+        assert [len(_["n_negotiations"]) for _ in received] == [1, 2, 3]
+        # monitors get read-only views unless monitoring is safe (list copies)
+        assert all(
+            isinstance(_["n_negotiations"], list if safe else np.ndarray)
+            for _ in received
+        )
+        if not safe:
+            with pytest.raises(ValueError):
+                received[-1]["n_negotiations"][0] = 3
+
+
+def test_event_logger_buffers_and_reads_back(tmp_path):
+    import pickle
+
+    from negmas.events import Event, EventLogger, EventSource, read_events
+
+    source = EventSource()
+    logger = EventLogger(tmp_path / "events.jsonl", types=["a", "b"], buffer_size=3)
+    source.register_listener(None, logger)
+    for i in range(5):
+        source.announce(Event("a" if i % 2 else "b", dict(i=i)))
+    source.announce(Event("ignored", None))
+    # only complete batches are written
+    assert len(list(read_events(tmp_path / "events.jsonl"))) == 3
+    # pickling writes nothing and does not save buffered events
+    restored = pickle.loads(pickle.dumps(logger))
+    assert len(list(read_events(tmp_path / "events.jsonl"))) == 3
+    source.announce(Event("a", dict(i=5)))
+    logger.close()
+    events = list(read_events(tmp_path / "events.jsonl"))
+    assert [_["data"]["i"] for _ in events] == list(range(6))
+    a_events = read_events(tmp_path / "events.jsonl", types=["a"])
+    assert [_["type"] for _ in a_events] == ["a"] * 3
+    restored.on_event(Event("b", dict(i=6)), source)
+    restored.close()
+    assert len(list(read_events(tmp_path / "events.jsonl"))) == 7
+
+
+def test_event_logger_flushes_in_background(tmp_path):
+    import time
+
+    from negmas.events import Event, EventLogger, EventSource, read_events
+
+    logger = EventLogger(tmp_path / "events.jsonl", flush_every=0.01)
+    logger.on_event(Event("a", 1), EventSource())
+    for _ in range(500):
+        if (tmp_path / "events.jsonl").exists():
+            break
+        time.sleep(0.01)
+    assert [_["data"] for _ in read_events(tmp_path / "events.jsonl")] == [1]
+    logger.close()
+
+
+def test_read_events_accepts_old_format(tmp_path):
+    from negmas.events import read_events
+
+    path = tmp_path / "events.json"
+    path.write_text('{"sender": "s", "time": 0.1, "type": "a", "data": 1},\n')
+    assert [_["data"] for _ in read_events(path)] == [1]
+
+
+def test_event_source_dispatches_by_type():
+    from negmas.events import Event, EventSink, EventSource
+
+    received = []
+
+    class Sink(EventSink):
+        def __init__(self, name):
+            self.name = name
+
+        def on_event(self, event, sender):
+            received.append((self.name, event.type))
+
+    source = EventSource()
+    source.announce(Event("a", None))
+    source.register_listener("a", Sink("a1"))
+    source.register_listener(None, Sink("all"))
+    source.register_listener("a", Sink("a2"))
+    source.register_listener("b", Sink("b"))
+    for t in ("a", "b", "c"):
+        source.announce(Event(t, None))
+    assert received == [
+        ("a1", "a"),
+        ("a2", "a"),
+        ("all", "a"),
+        ("b", "b"),
+        ("all", "b"),
+        ("all", "c"),
+    ]
+    received.clear()
+    source.shuffle_listeners = True
+    for _ in range(20):
+        source.announce(Event("a", None))
+    assert sorted(set(received)) == [("a1", "a"), ("a2", "a"), ("all", "a")]
+    assert len(received) == 60
+
+
+def test_world_logs_to_screen_and_file(tmp_path, capsys):
+    import logging
+
+    world = DummyWorld(
+        n_steps=1,
+        log_folder=tmp_path,
+        log_file_name="log.txt",
+        log_to_screen=True,
+        log_screen_level=logging.WARNING,
+    )
+    world.loginfo("file only")
+    world.logwarning("screen and file")
+    world._log_pipeline.flush()
+    _, captured = capsys.readouterr()
+    assert "screen and file" in captured and "file only" not in captured
+    text = (tmp_path / "log.txt").read_text()
+    assert "screen and file" in text and "file only" in text
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import as_completed
+
+import pytest
+
+from negmas.inout import Scenario
+from negmas.outcomes import make_issue
+from negmas.outcomes.outcome_space import make_os
+from negmas.preferences import LinearAdditiveUtilityFunction as U
+from negmas.sao import AspirationNegotiator, RandomNegotiator
+from negmas.tournaments.neg import cartesian_tournament
+from negmas.tournaments.tcp import TCPExecutor, run_worker
+
+
+def square(x):
+    return x * x
+
+
+def fail(x):
+    raise ValueError(f"failed on {x}")
+
+
+def die_once(flag: str, x):
+    if not os.path.exists(flag):
+        open(flag, "w").close()
+        os._exit(1)
+    return x
+
+
+def slow(x, t):
+    time.sleep(t)
+    return x
+
+
+def test_tcp_executor_runs_tasks_on_local_workers():
+    with TCPExecutor(port=0, n_local_workers=2) as executor:
+        futures = {executor.submit(square, i): i for i in range(20)}
+        results = {futures[f]: f.result() for f in as_completed(futures)}
+    assert results == {i: i * i for i in range(20)}
+
+
+def test_tcp_executor_passes_exceptions():
+    with TCPExecutor(port=0, n_local_workers=1) as executor:
+        f = executor.submit(fail, 3)
+        with pytest.raises(ValueError, match="failed on 3"):
+            f.result()
+        assert executor.submit(square, 3).result() == 9
+
+
+def test_tcp_executor_requeues_tasks_of_lost_workers(tmp_path):
+    flag = str(tmp_path / "died")
+    with TCPExecutor(port=0, n_local_workers=1) as executor:
+        f = executor.submit(die_once, flag, 5)
+        # the first worker dies running the task. A new one picks it up again
+        time.sleep(0.5)
+        executor.start_local_worker()
+        assert f.result(timeout=60) == 5
+
+
+def test_tcp_executor_requeues_tasks_without_heartbeats():
+    import threading
+
+    executor = TCPExecutor(port=0, heartbeat_timeout=0.5)
+    host, port = executor.address
+    f = executor.submit(slow, 7, 1.5)
+    # a worker that never sends heartbeats loses its task
+    t = threading.Thread(
+        target=run_worker,
+        kwargs=dict(host=host, port=port, heartbeat_interval=100, max_tasks=1),
+        daemon=True,
+    )
+    t.start()
+    t.join()
+    executor.start_local_worker()
+    assert f.result(timeout=60) == 7
+    executor.shutdown()
+
+
+def test_cartesian_tournament_on_tcp_workers():
+    issues = (
+        make_issue([f"q{i}" for i in range(10)], "quantity"),
+        make_issue([f"p{i}" for i in range(5)], "price"),
+    )
+    scenarios = [
+        Scenario(
+            outcome_space=make_os(issues, name="S0"),
+            ufuns=(
+                U.random(issues=issues, reserved_value=(0.0, 0.2), normalized=False),
+                U.random(issues=issues, reserved_value=(0.0, 0.2), normalized=False),
+            ),
+        )
+    ]
+    competitors = [RandomNegotiator, AspirationNegotiator]
+    with TCPExecutor(port=0, n_local_workers=2) as executor:
+        results = cartesian_tournament(
+            competitors=competitors,
+            scenarios=scenarios,
+            mechanism_params=dict(n_steps=10),
+            n_repetitions=2,
+            verbosity=0,
+            executor=executor,
+            save_stats=False,
+            path=None,
+        )
+    assert len(results.details) == 2 * 4 * 2
+    assert not results.details["has_error"].any()
+
+
+def test_tcp_executor_refuses_default_key_on_public_interfaces(monkeypatch):
+    monkeypatch.delenv("NEGMAS_TCP_AUTHKEY", raising=False)
+    with pytest.raises(ValueError):
+        TCPExecutor(host="0.0.0.0", port=0)
+
+
+def test_tcp_executor_uses_private_keys(monkeypatch):
+    with TCPExecutor(host="0.0.0.0", port=0, authkey="secret") as executor:
+        _, port = executor.address
+        with pytest.raises(Exception):
+            run_worker(port=port, authkey=b"negmas", max_tasks=1, connect_timeout=1)
+    # the environment variable is used by both sides when no key is passed
+    monkeypatch.setenv("NEGMAS_TCP_AUTHKEY", "secret")
+    with TCPExecutor(host="0.0.0.0", port=0, n_local_workers=1) as executor:
+        assert executor.submit(square, 3).result(timeout=60) == 9
+
+
+@pytest.mark.parametrize("host", ["localhost", "0.0.0.0"])
+def test_tcp_executor_stops_its_acceptor(host):
+    executor = TCPExecutor(host=host, port=0, authkey="secret")
+    executor.shutdown(wait=False)
+    assert not executor._acceptor.is_alive()
+    with TCPExecutor(host=host, port=0, n_local_workers=1, authkey="secret") as e:
+        assert e.submit(square, 2).result(timeout=60) == 4
+    assert not e._acceptor.is_alive()
+    # shutting down again is harmless
+    e.shutdown()
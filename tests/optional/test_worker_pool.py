@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+from negmas.inout import Scenario
+from negmas.outcomes import make_issue
+from negmas.outcomes.outcome_space import make_os
+from negmas.preferences import LinearAdditiveUtilityFunction as U
+from negmas.sao import AspirationNegotiator, RandomNegotiator
+from negmas.sao.common import SAOResponse
+from negmas.sao.negotiators.base import SAONegotiator
+from negmas.tournaments.neg import cartesian_tournament
+from negmas.tournaments.pool import WorkerPool
+
+
+class Crasher(SAONegotiator):
+    def __call__(self, state) -> SAOResponse:
+        os._exit(3)
+
+
+def _scenarios(n=1):
+    issues = (
+        make_issue([f"q{i}" for i in range(10)], "quantity"),
+        make_issue([f"p{i}" for i in range(5)], "price"),
+    )
+    return [
+        Scenario(
+            outcome_space=make_os(issues, name=f"S{i}"),
+            ufuns=(
+                U.random(issues=issues, reserved_value=(0.0, 0.2), normalized=False),
+                U.random(issues=issues, reserved_value=(0.0, 0.2), normalized=False),
+            ),
+        )
+        for i in range(n)
+    ]
+
+
+def _pids(pool: WorkerPool) -> set[int]:
+    return {pool.submit(os.getpid).result() for _ in range(10)}
+
+
+def _preloaded():
+    from negmas.tournaments import pool
+
+    return sorted(pool._preloaded.keys())
+
+
+def _shared_value(ref):
+    return ref.get()
+
+
+def test_worker_pool_preloads_and_shares():
+    with WorkerPool(max_workers=1, preload=[AspirationNegotiator]) as pool:
+        assert pool.submit(_preloaded).result() == [
+            "negmas.gb.negotiators.timebased.AspirationNegotiator"
+        ]
+        data = dict(a=list(range(10)))
+        ref = pool.share(data)
+        assert pool.share(data) == ref
+        assert pool.submit(_shared_value, ref).result() == data
+        pool.release([ref])
+        assert not os.path.exists(ref.path)
+
+
+def test_worker_pool_is_reused_across_tournaments():
+    with WorkerPool(max_workers=2) as pool:
+        before = _pids(pool)
+        for _ in range(2):
+            results = cartesian_tournament(
+                competitors=[RandomNegotiator, AspirationNegotiator],
+                scenarios=_scenarios(2),
+                mechanism_params=dict(n_steps=10),
+                n_repetitions=1,
+                verbosity=0,
+                executor=pool,
+                save_stats=True,
+                path=None,
+            )
+            assert len(results.details) == 2 * 4 * 2
+            assert not results.details["has_error"].any()
+        assert _pids(pool) <= before
+        assert pool.n_restarts == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_worker_pool_recovers_from_crashes():
+    with WorkerPool(max_workers=1) as pool:
+        results = cartesian_tournament(
+            competitors=[AspirationNegotiator, Crasher],
+            scenarios=_scenarios(),
+            mechanism_params=dict(n_steps=10),
+            n_repetitions=1,
+            verbosity=0,
+            rotate_ufuns=False,
+            executor=pool,
+            save_stats=False,
+            path=None,
+        )
+        details = results.details
+        assert len(details) == 4
+        crashed = details["partners"].apply(lambda x: any("Crasher" in _ for _ in x))
+        assert details.loc[crashed, "has_error"].all()
+        assert not details.loc[~crashed, "has_error"].any()
+        assert pool.n_restarts > 0
+        assert pool.submit(abs, -3).result() == 3